@@ -5,9 +5,20 @@ Provides deterministic chunking strategies for splitting documents into
 manageable chunks for indexing and embedding.
 """
 
+import math
 import re
 from typing import NamedTuple
 
+# Default sliding-window stride as a fraction of the window size
+DEFAULT_STRIDE_RATIO = 0.75
+
+# Literal-prefixed patterns let the regex engine skip ahead with a fast
+# substring search instead of attempting a match at every character.
+_SPACE_RUN_RE = re.compile("  +")
+_BLANK_LINES_RE = re.compile("\n\n\n+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+_SENTENCE_SPLIT_RE = re.compile(r"([.!?]+)\s+")
+
 
 class ChunkInfo(NamedTuple):
     """Information about a text chunk."""
@@ -27,14 +38,14 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text with consistent whitespace
     """
-    # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # Normalize line endings, and tabs to spaces
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\t", " ")
 
     # Normalize multiple spaces but preserve single newlines
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _SPACE_RUN_RE.sub(" ", text)
 
     # Normalize multiple newlines (3+ becomes 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     # Strip leading/trailing whitespace from each line
     lines = [line.strip() for line in text.split("\n")]
@@ -48,6 +59,7 @@ def chunk_text(
     min_chunk_size: int = 500,
     max_chunk_size: int = 1500,
     overlap: int = 0,
+    assume_normalized: bool = False,
 ) -> list[ChunkInfo]:
     """
     Split text into chunks using paragraph and sentence boundaries.
@@ -64,6 +76,8 @@ def chunk_text(
         min_chunk_size: Minimum target chunk size in characters
         max_chunk_size: Maximum chunk size in characters
         overlap: Number of characters to overlap between chunks (future use)
+        assume_normalized: Skip step 1 because `text` is already the output of
+            normalize_text (e.g. Document.text)
 
     Returns:
         List of ChunkInfo tuples with text and offsets
@@ -71,10 +85,10 @@ def chunk_text(
     if not text or not text.strip():
         return []
 
-    normalized = normalize_text(text)
+    normalized = text if assume_normalized else normalize_text(text)
 
     # Split by paragraphs (double newlines or more)
-    paragraphs = re.split(r"\n\n+", normalized)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(normalized)
 
     chunks: list[ChunkInfo] = []
     current_offset = 0
@@ -137,6 +151,53 @@ def chunk_text(
     return chunks
 
 
+def sliding_window_chunks(
+    text: str,
+    window_size: int = 1500,
+    stride: int | None = None,
+    assume_normalized: bool = False,
+) -> list[ChunkInfo]:
+    """
+    Split text into fixed-size, overlapping character windows.
+
+    Windows start at multiples of `stride`, so consecutive chunks share
+    `window_size - stride` characters of context across what would otherwise
+    be a hard boundary. The last window is shortened to end at the end of the
+    text, giving ceil((N - window_size) / stride) + 1 chunks for N > window_size.
+
+    Args:
+        text: Text to chunk
+        window_size: Window size in characters
+        stride: Distance between window starts (default: 0.75 * window_size)
+        assume_normalized: Use `text` as-is because it is already the output of
+            normalize_text (e.g. Document.text)
+
+    Returns:
+        List of ChunkInfo tuples with text and offsets into the normalized text
+    """
+    if not text or not text.strip():
+        return []
+
+    if stride is None:
+        stride = int(DEFAULT_STRIDE_RATIO * window_size)
+    if window_size <= 0 or stride <= 0:
+        raise ValueError("window_size and stride must be positive")
+    if stride > window_size:
+        raise ValueError("stride cannot exceed window_size")
+
+    normalized = text if assume_normalized else normalize_text(text)
+    length = len(normalized)
+    window_count = math.ceil(max(length - window_size, 0) / stride) + 1
+
+    chunks: list[ChunkInfo] = []
+    for i in range(window_count):
+        start = i * stride
+        end = min(start + window_size, length)
+        chunks.append(ChunkInfo(text=normalized[start:end], start_offset=start, end_offset=end))
+
+    return chunks
+
+
 def _split_sentences(text: str) -> list[str]:
     """
     Split text into sentences using simple punctuation-based rules.
@@ -149,7 +210,7 @@ def _split_sentences(text: str) -> list[str]:
     """
     # Split on sentence-ending punctuation followed by whitespace or end of string
     # This is a simple heuristic; more sophisticated methods could be used
-    sentences = re.split(r"([.!?]+)\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
     # Recombine sentence with its punctuation
     result = []
@@ -221,35 +282,40 @@ def _merge_small_chunks(
         return []
 
     merged: list[ChunkInfo] = []
-    current_text = chunks[0].text
+    # Track the pending chunk as a list of parts plus its joined length so the
+    # merged text is only materialized once, when the chunk is emitted.
+    current_parts = [chunks[0].text]
+    current_length = len(chunks[0].text)
     current_start = chunks[0].start_offset
 
     for i in range(1, len(chunks)):
         # Try to merge if current chunk is small and merging won't exceed max_size
         next_chunk = chunks[i]
-        combined_text = current_text + "\n\n" + next_chunk.text
+        combined_length = current_length + 2 + len(next_chunk.text)
 
-        if len(current_text) < min_size and len(combined_text) <= max_size:
+        if current_length < min_size and combined_length <= max_size:
             # Merge
-            current_text = combined_text
+            current_parts.append(next_chunk.text)
+            current_length = combined_length
         else:
             # Save current and start new
             merged.append(
                 ChunkInfo(
-                    text=current_text,
+                    text="\n\n".join(current_parts),
                     start_offset=current_start,
-                    end_offset=current_start + len(current_text),
+                    end_offset=current_start + current_length,
                 )
             )
-            current_text = next_chunk.text
+            current_parts = [next_chunk.text]
+            current_length = len(next_chunk.text)
             current_start = next_chunk.start_offset
 
     # Don't forget the last chunk
     merged.append(
         ChunkInfo(
-            text=current_text,
+            text="\n\n".join(current_parts),
             start_offset=current_start,
-            end_offset=current_start + len(current_text),
+            end_offset=current_start + current_length,
         )
     )
 
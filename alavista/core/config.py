@@ -74,11 +74,18 @@ class Settings(BaseSettings):
         description="Vector backend to use (faiss | memory)",
     )
     vector_index_dir: Path = Field(
-        default=Path("./data/vector_index"), description="Directory for FAISS index files"
+        default=Path("./data/vector_index"), description="Directory for persisted vector index files"
     )
     vector_normalize: bool = Field(
         default=True, description="Whether to L2-normalize embeddings before indexing/search"
     )
+    vector_index_type: str = Field(
+        default="flat", description="FAISS index type for new corpora (flat | hnsw | ivfpq)"
+    )
+    vector_quantization: str = Field(
+        default="none",
+        description="Storage precision for the in-memory backend (none | float16 | int8)",
+    )
 
     # Persona configuration
     auto_create_persona_corpora: bool = Field(
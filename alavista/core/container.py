@@ -87,16 +87,22 @@ class Container:
         return Settings(**overrides)
 
     @staticmethod
-    def create_corpus_store(settings: Settings | None = None) -> SQLiteCorpusStore:
+    def create_corpus_store(
+        settings: Settings | None = None, *, in_memory: bool = False
+    ) -> SQLiteCorpusStore:
         """
         Create a CorpusStore instance.
 
         Args:
             settings: Settings instance (uses singleton if not provided)
+            in_memory: Use a private in-memory database instead of data_dir/corpus.db
+                (no filesystem access; contents are lost with the store)
 
         Returns:
             SQLiteCorpusStore: Corpus store instance
         """
+        if in_memory:
+            return SQLiteCorpusStore(":memory:")
         settings = settings or Container.get_settings()
         db_path = settings.data_dir / "corpus.db"
         return SQLiteCorpusStore(db_path)
@@ -120,6 +126,8 @@ class Container:
         embedding_service=None,
         vector_search_service=None,
         persona_registry=None,
+        stride: int | None = None,
+        near_duplicate_threshold: float | None = None,
     ) -> IngestionService:
         """
         Create an IngestionService instance.
@@ -131,12 +139,15 @@ class Container:
             embedding_service: Optional embedding service
             vector_search_service: Optional vector search service
             persona_registry: Optional PersonaRegistry for persona-specific ingestion
+            stride: Optional sliding-window stride (enables overlapping window chunking)
+            near_duplicate_threshold: Optional MinHash Jaccard threshold for near-duplicate rejection
 
         Returns:
             IngestionService: Ingestion service instance
         """
         corpus_store = corpus_store or Container.get_corpus_store()
-        persona_registry = persona_registry or Container.get_persona_registry()
+        if persona_registry is None:
+            persona_registry = Container.get_persona_registry()
         return IngestionService(
             corpus_store=corpus_store,
             min_chunk_size=min_chunk_size,
@@ -144,6 +155,8 @@ class Container:
             embedding_service=embedding_service,
             vector_search_service=vector_search_service,
             persona_registry=persona_registry,
+            stride=stride,
+            near_duplicate_threshold=near_duplicate_threshold,
         )
 
     @staticmethod
@@ -178,9 +191,15 @@ class Container:
             return FaissVectorSearchService(
                 root_dir=settings.vector_index_dir,
                 normalize=settings.vector_normalize,
+                index_type=settings.vector_index_type.lower(),
             )
         if backend == "memory":
-            return InMemoryVectorSearchService(normalize=settings.vector_normalize)
+            return InMemoryVectorSearchService(
+                # Own subdirectory: both backends name files <corpus_id>.meta.json
+                root_dir=settings.vector_index_dir / "memory",
+                normalize=settings.vector_normalize,
+                quantization=settings.vector_quantization.lower(),
+            )
         raise ValueError(f"Unsupported vector backend: {backend}")
 
     @staticmethod
@@ -332,7 +351,7 @@ class Container:
         Returns:
             RunStore: Run storage instance
         """
-        settings = settings or get_settings()
+        settings = settings or Container.get_settings()
         db_path = settings.data_dir / "runs.db"
         return RunStore(db_path)
 
@@ -451,7 +470,8 @@ class Container:
         Returns:
             PersonaRuntime: Persona runtime instance
         """
-        persona_registry = persona_registry or Container.get_persona_registry()
+        if persona_registry is None:
+            persona_registry = Container.get_persona_registry()
         search_service = search_service or Container.get_search_service()
         graph_service = graph_service or Container.get_graph_service()
         corpus_store = corpus_store or Container.get_corpus_store()
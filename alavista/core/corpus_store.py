@@ -6,11 +6,28 @@ with deduplication support.
 """
 
 import json
+import re
 import sqlite3
+import threading
+import uuid
+import zlib
+from collections.abc import Iterator
+from contextlib import closing
 from pathlib import Path
 from typing import Protocol
 
-from alavista.core.models import Corpus, Document
+from alavista.core.models import Chunk, Corpus, Document
+
+# Query terms for the FTS5 index; quoting each keeps FTS5 operators out of user input
+_FTS_TERM_RE = re.compile(r"\w+")
+
+# Statements shared by several write paths. Each is one constant string so
+# sqlite3's per-connection statement cache reuses its prepared form.
+_INSERT_DOCUMENT_SQL = """
+    INSERT INTO documents (id, corpus_id, text, content_hash, metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_UPSERT_CHUNKS_SQL = "INSERT OR REPLACE INTO chunks_packed (document_id, payload) VALUES (?, ?)"
 
 
 class CorpusStore(Protocol):
@@ -41,6 +58,10 @@ class CorpusStore(Protocol):
         """Add a document to a corpus."""
         ...
 
+    def add_documents(self, documents: list[Document]) -> list[Document]:
+        """Add several documents in a single transaction."""
+        ...
+
     def get_document(self, doc_id: str) -> Document | None:
         """Get a document by ID."""
         ...
@@ -49,43 +70,115 @@ class CorpusStore(Protocol):
         """List all documents in a corpus."""
         ...
 
+    def iter_documents(self, corpus_id: str) -> Iterator[Document]:
+        """Iterate over the documents in a corpus without loading them all at once."""
+        ...
+
+    def list_document_ids(self, corpus_id: str) -> frozenset[str]:
+        """List the IDs of all documents in a corpus."""
+        ...
+
     def find_by_hash(self, corpus_id: str, content_hash: str) -> Document | None:
         """Find a document by content hash for deduplication."""
         ...
 
+    def add_chunks(self, document_id: str, chunks: list[Chunk]) -> None:
+        """Store the chunks of a document."""
+        ...
+
+    def add_chunks_batch(self, chunks_by_document: dict[str, list[Chunk]]) -> None:
+        """Store the chunks of several documents at once."""
+        ...
+
+    def add_document_with_chunks(self, document: Document, chunks: list[Chunk]) -> Document:
+        """Add a document and its chunks in a single transaction."""
+        ...
+
+    def get_chunks(self, document_id: str) -> list[Chunk]:
+        """Get the stored chunks of a document."""
+        ...
+
 
 class SQLiteCorpusStore:
     """
     SQLite-backed implementation of CorpusStore.
 
     Stores corpora and documents in a SQLite database with JSON metadata support.
+    Each thread reuses one connection for the store's lifetime, so connection
+    setup and SQL statement preparation are paid once per thread rather than
+    on every call.
     """
 
-    def __init__(self, db_path: Path | str):
+    def __init__(self, db_path: Path | str, fast_mode: bool = False):
         """
         Initialize the corpus store.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a private
+                in-memory database that lives as long as this store
+            fast_mode: Trade durability for write speed (WAL journal, no fsync on
+                commit, in-memory temp storage). Intended for tests and throwaway
+                databases; a power loss can lose recent commits.
         """
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fast_mode = fast_mode
+        self._uri = str(db_path) == ":memory:"
+        self._keepalive: sqlite3.Connection | None = None
+        self._corpora_cache: tuple[int, list[Corpus]] | None = None
+        self._local = threading.local()
+        if self._uri:
+            # Every call opens its own connection, so a plain ":memory:" database
+            # would start empty each time. Use a uniquely named shared-cache
+            # database instead, held open by one connection for the store's lifetime.
+            self.db_path = f"file:alavista-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._keepalive = sqlite3.connect(self.db_path, uri=True)
+        else:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
         """
-        Get a database connection with foreign keys enabled.
+        Get the calling thread's database connection, opening it on first use.
+
+        Connections have foreign keys enabled and return sqlite3.Row rows.
+        Callers use `with conn:` for transactions but must not close it.
 
         Returns:
             SQLite connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, uri=self._uri)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            if self.fast_mode:
+                conn.execute("PRAGMA synchronous = OFF")
+                conn.execute("PRAGMA temp_store = MEMORY")
+            self._local.conn = conn
         return conn
 
+    def close(self) -> None:
+        """
+        Close the calling thread's connection and the in-memory keep-alive connection.
+
+        Connections opened by other threads are closed when they are garbage
+        collected. An in-memory store loses its data once closed.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._get_connection() as conn:
+            if self.fast_mode and not self._uri:
+                # Journal mode is persistent, so it only needs setting once
+                conn.execute("PRAGMA journal_mode = WAL")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS corpora (
                     id TEXT PRIMARY KEY,
@@ -99,6 +192,25 @@ class SQLiteCorpusStore:
                 )
             """)
 
+            # Bumped by triggers on every corpora write, from any connection or
+            # process, so list_corpora can tell when its cached result is stale
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS table_versions (
+                    name TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO table_versions VALUES ('corpora', 0)")
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS corpora_version_{event.lower()}
+                    AFTER {event} ON corpora
+                    BEGIN
+                        UPDATE table_versions SET version = version + 1
+                        WHERE name = 'corpora';
+                    END
+                """)
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS documents (
                     id TEXT PRIMARY KEY,
@@ -111,19 +223,92 @@ class SQLiteCorpusStore:
                 )
             """)
 
-            # Index for deduplication
+            # Unique index for deduplication; its leading column also serves
+            # corpus lookups, so no separate corpus_id index is kept.
+            try:
+                conn.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_documents_corpus_hash
+                    ON documents(corpus_id, content_hash)
+                """)
+            except sqlite3.IntegrityError:
+                # Databases written before the constraint may already hold
+                # duplicate hashes; keep a plain index for those.
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_documents_hash
+                    ON documents(corpus_id, content_hash)
+                """)
+            else:
+                conn.execute("DROP INDEX IF EXISTS idx_documents_hash")
+            conn.execute("DROP INDEX IF EXISTS idx_documents_corpus")
+
+            self._init_fts(conn)
+
+            # All chunks of a document packed into one compressed row
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_documents_hash
-                ON documents(corpus_id, content_hash)
+                CREATE TABLE IF NOT EXISTS chunks_packed (
+                    document_id TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+                )
             """)
 
-            # Index for corpus lookup
+            conn.commit()
+
+    def _init_fts(self, conn: sqlite3.Connection) -> None:
+        """
+        Create the FTS5 keyword index over document text, kept in sync by triggers.
+
+        Sets `has_fts` to False when the SQLite build lacks FTS5.
+
+        Args:
+            conn: Open connection used for schema initialization
+        """
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'documents_fts'"
+        ).fetchone()
+        if existing and "content=" not in existing[0]:
+            # Replace the earlier self-contained index, which duplicated the text
+            conn.execute("DROP TABLE documents_fts")
+            for event in ("insert", "delete", "update"):
+                conn.execute(f"DROP TRIGGER IF EXISTS documents_fts_{event}")
+            existing = None
+        try:
+            # External-content index: FTS rows share the rowid of their documents
+            # row, and the text itself is read back from documents.
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_documents_corpus
-                ON documents(corpus_id)
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts
+                USING fts5(text, content='documents', content_rowid='rowid')
             """)
-
-            conn.commit()
+        except sqlite3.OperationalError:
+            self.has_fts = False
+            return
+        self.has_fts = True
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents
+            BEGIN
+                INSERT INTO documents_fts (rowid, text) VALUES (new.rowid, new.text);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents
+            BEGIN
+                INSERT INTO documents_fts (documents_fts, rowid, text)
+                VALUES ('delete', old.rowid, old.text);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS documents_fts_update AFTER UPDATE ON documents
+            BEGIN
+                INSERT INTO documents_fts (documents_fts, rowid, text)
+                VALUES ('delete', old.rowid, old.text);
+                INSERT INTO documents_fts (rowid, text) VALUES (new.rowid, new.text);
+            END
+        """)
+
+        if not existing:
+            # Index documents written before the FTS table existed
+            conn.execute("INSERT INTO documents_fts (documents_fts) VALUES ('rebuild')")
 
     def create_corpus(self, corpus: Corpus) -> Corpus:
         """
@@ -170,7 +355,6 @@ class SQLiteCorpusStore:
             Corpus if found, None otherwise
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM corpora WHERE id = ?",
                 (corpus_id,),
@@ -195,15 +379,24 @@ class SQLiteCorpusStore:
         """
         List all corpora.
 
+        The decoded list is cached until the corpora table next changes, so
+        repeated listings cost one version lookup. The returned Corpus objects
+        are shared between calls and should not be mutated.
+
         Returns:
             List of all corpora
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
+            (version,) = conn.execute(
+                "SELECT version FROM table_versions WHERE name = 'corpora'"
+            ).fetchone()
+            cached = self._corpora_cache
+            if cached is not None and cached[0] == version:
+                return list(cached[1])
             cursor = conn.execute("SELECT * FROM corpora ORDER BY created_at DESC")
             rows = cursor.fetchall()
 
-        return [
+        corpora = [
             Corpus(
                 id=row["id"],
                 type=row["type"],
@@ -216,6 +409,8 @@ class SQLiteCorpusStore:
             )
             for row in rows
         ]
+        self._corpora_cache = (version, corpora)
+        return list(corpora)
 
     def delete_corpus(self, corpus_id: str) -> bool:
         """
@@ -244,27 +439,40 @@ class SQLiteCorpusStore:
             The added document
 
         Raises:
-            sqlite3.IntegrityError: If document with same ID already exists
+            sqlite3.IntegrityError: If a document with the same ID, or the same
+                content hash in the corpus, already exists
         """
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO documents (id, corpus_id, text, content_hash, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    document.id,
-                    document.corpus_id,
-                    document.text,
-                    document.content_hash,
-                    json.dumps(document.metadata),
-                    document.created_at.isoformat(),
-                ),
-            )
+            conn.execute(_INSERT_DOCUMENT_SQL, _document_params(document))
             conn.commit()
 
         return document
 
+    def add_documents(self, documents: list[Document]) -> list[Document]:
+        """
+        Add several documents in a single transaction.
+
+        Args:
+            documents: Documents to add
+
+        Returns:
+            The added documents
+
+        Raises:
+            sqlite3.IntegrityError: If any document ID, or content hash within its corpus,
+                already exists (nothing is written)
+        """
+        if not documents:
+            return documents
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_DOCUMENT_SQL, [_document_params(document) for document in documents]
+            )
+            conn.commit()
+
+        return documents
+
     def get_document(self, doc_id: str) -> Document | None:
         """
         Get a document by ID.
@@ -276,7 +484,6 @@ class SQLiteCorpusStore:
             Document if found, None otherwise
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM documents WHERE id = ?",
                 (doc_id,),
@@ -286,14 +493,7 @@ class SQLiteCorpusStore:
         if row is None:
             return None
 
-        return Document(
-            id=row["id"],
-            corpus_id=row["corpus_id"],
-            text=row["text"],
-            content_hash=row["content_hash"],
-            metadata=json.loads(row["metadata"]),
-            created_at=row["created_at"],
-        )
+        return _document_from_row(row)
 
     def list_documents(self, corpus_id: str) -> list[Document]:
         """
@@ -306,24 +506,54 @@ class SQLiteCorpusStore:
             List of documents in the corpus
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM documents WHERE corpus_id = ? ORDER BY created_at DESC",
                 (corpus_id,),
             )
             rows = cursor.fetchall()
 
-        return [
-            Document(
-                id=row["id"],
-                corpus_id=row["corpus_id"],
-                text=row["text"],
-                content_hash=row["content_hash"],
-                metadata=json.loads(row["metadata"]),
-                created_at=row["created_at"],
+        return [_document_from_row(row) for row in rows]
+
+    def iter_documents(self, corpus_id: str, batch_size: int = 256) -> Iterator[Document]:
+        """
+        Iterate over the documents in a corpus, newest first.
+
+        Rows are fetched `batch_size` at a time, so only one batch of documents
+        is held in memory while the caller consumes them.
+
+        Args:
+            corpus_id: ID of the corpus
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Documents in the corpus
+        """
+        # Closing the cursor releases its read statement if iteration stops early
+        with closing(self._get_connection().cursor()) as cursor:
+            cursor.execute(
+                "SELECT * FROM documents WHERE corpus_id = ? ORDER BY created_at DESC",
+                (corpus_id,),
             )
-            for row in rows
-        ]
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield _document_from_row(row)
+
+    def list_document_ids(self, corpus_id: str) -> frozenset[str]:
+        """
+        List the IDs of all documents in a corpus.
+
+        Cheaper than list_documents when only membership or counts are needed,
+        since no text is read and no Document objects are built.
+
+        Args:
+            corpus_id: ID of the corpus
+
+        Returns:
+            Set of document IDs in the corpus
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT id FROM documents WHERE corpus_id = ?", (corpus_id,))
+            return frozenset(row[0] for row in cursor)
 
     def find_by_hash(self, corpus_id: str, content_hash: str) -> Document | None:
         """
@@ -337,9 +567,8 @@ class SQLiteCorpusStore:
             Document if found, None otherwise
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.execute(
-                "SELECT * FROM documents WHERE corpus_id = ? AND content_hash = ?",
+                "SELECT * FROM documents WHERE corpus_id = ? AND content_hash = ? LIMIT 1",
                 (corpus_id, content_hash),
             )
             row = cursor.fetchone()
@@ -347,11 +576,186 @@ class SQLiteCorpusStore:
         if row is None:
             return None
 
-        return Document(
-            id=row["id"],
-            corpus_id=row["corpus_id"],
-            text=row["text"],
-            content_hash=row["content_hash"],
-            metadata=json.loads(row["metadata"]),
-            created_at=row["created_at"],
+        return _document_from_row(row)
+
+    def search_documents(
+        self, corpus_id: str, query: str, k: int = 20
+    ) -> list[tuple[Document, float]]:
+        """
+        Rank a corpus's documents against a keyword query using the FTS5 index.
+
+        Any query term may match; ranking uses SQLite's built-in BM25.
+
+        Args:
+            corpus_id: ID of the corpus to search in
+            query: Free-text keyword query
+            k: Maximum number of results to return
+
+        Returns:
+            List of (document, score) tuples, best first; higher scores are better
+        """
+        terms = _FTS_TERM_RE.findall(query)
+        if not terms:
+            return []
+        match = " OR ".join(f'"{term}"' for term in terms)
+
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT d.*, bm25(documents_fts) AS rank_score
+                FROM documents_fts
+                JOIN documents d ON d.rowid = documents_fts.rowid
+                WHERE documents_fts MATCH ? AND d.corpus_id = ?
+                ORDER BY rank_score
+                LIMIT ?
+                """,
+                (match, corpus_id, k),
+            )
+            rows = cursor.fetchall()
+
+        # FTS5 reports BM25 as a negative number where lower is better
+        return [(_document_from_row(row), -row["rank_score"]) for row in rows]
+
+    def add_chunks(self, document_id: str, chunks: list[Chunk]) -> None:
+        """
+        Store the chunks of a document.
+
+        Chunks are packed into a single compressed row per document, since write
+        cost is dominated by row count rather than bytes. Replaces any chunks
+        previously stored for the document.
+
+        Args:
+            document_id: ID of the parent document
+            chunks: Chunks to store
+
+        Raises:
+            sqlite3.IntegrityError: If the document does not exist
+        """
+        with self._get_connection() as conn:
+            conn.execute(_UPSERT_CHUNKS_SQL, (document_id, _pack_chunks(chunks)))
+            conn.commit()
+
+    def add_document_with_chunks(self, document: Document, chunks: list[Chunk]) -> Document:
+        """
+        Add a document and its chunks in a single transaction.
+
+        Equivalent to add_document followed by add_chunks, but with one
+        connection and one commit, and no document left without its chunks
+        if either insert fails.
+
+        Args:
+            document: Document to add
+            chunks: Chunks of the document
+
+        Returns:
+            The added document
+
+        Raises:
+            sqlite3.IntegrityError: If a document with the same ID, or the same
+                content hash in the corpus, already exists
+        """
+        with self._get_connection() as conn:
+            conn.execute(_INSERT_DOCUMENT_SQL, _document_params(document))
+            conn.execute(_UPSERT_CHUNKS_SQL, (document.id, _pack_chunks(chunks)))
+            conn.commit()
+
+        return document
+
+    def add_chunks_batch(self, chunks_by_document: dict[str, list[Chunk]]) -> None:
+        """
+        Store the chunks of several documents in a single transaction.
+
+        Args:
+            chunks_by_document: Mapping of document ID to its chunks
+
+        Raises:
+            sqlite3.IntegrityError: If any document does not exist (nothing is written)
+        """
+        if not chunks_by_document:
+            return
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                _UPSERT_CHUNKS_SQL,
+                [
+                    (document_id, _pack_chunks(chunks))
+                    for document_id, chunks in chunks_by_document.items()
+                ],
+            )
+            conn.commit()
+
+    def get_chunks(self, document_id: str) -> list[Chunk]:
+        """
+        Get the stored chunks of a document.
+
+        Args:
+            document_id: ID of the parent document
+
+        Returns:
+            Chunks in document order, or an empty list if none are stored
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT payload FROM chunks_packed WHERE document_id = ?",
+                (document_id,),
+            ).fetchone()
+
+        if row is None:
+            return []
+        return _unpack_chunks(document_id, row[0])
+
+
+def _document_params(document: Document) -> tuple:
+    """Build the _INSERT_DOCUMENT_SQL parameters for a document."""
+    return (
+        document.id,
+        document.corpus_id,
+        document.text,
+        document.content_hash,
+        json.dumps(document.metadata),
+        document.created_at.isoformat(),
+    )
+
+
+def _document_from_row(row: sqlite3.Row) -> Document:
+    """Build a Document from a documents table row."""
+    return Document(
+        id=row["id"],
+        corpus_id=row["corpus_id"],
+        text=row["text"],
+        content_hash=row["content_hash"],
+        metadata=json.loads(row["metadata"]),
+        created_at=row["created_at"],
+    )
+
+
+def _pack_chunks(chunks: list[Chunk]) -> bytes:
+    """Serialize chunks to a zlib-compressed JSON payload."""
+    corpus_id = chunks[0].corpus_id if chunks else None
+    payload = {
+        "corpus_id": corpus_id,
+        "chunks": [
+            [chunk.id, chunk.text, chunk.start_offset, chunk.end_offset, chunk.metadata]
+            for chunk in chunks
+        ],
+    }
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack_chunks(document_id: str, blob: bytes) -> list[Chunk]:
+    """Deserialize chunks packed by _pack_chunks."""
+    payload = json.loads(zlib.decompress(blob))
+    corpus_id = payload["corpus_id"]
+    # Payloads were validated when written; skip re-validation on the read path
+    return [
+        Chunk.model_construct(
+            id=chunk_id,
+            document_id=document_id,
+            corpus_id=corpus_id,
+            text=text,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            metadata=metadata,
         )
+        for chunk_id, text, start_offset, end_offset, metadata in payload["chunks"]
+    ]
@@ -1,6 +1,7 @@
 """Embeddings package for Phase 3.1 placed under the alavista package."""
 
 from .service import (
+    CachingEmbeddingService,
     DeterministicFallbackEmbeddingService,
     EmbeddingError,
     SentenceTransformersEmbeddingService,
@@ -9,6 +10,7 @@ from .service import (
 from .pipeline import EmbeddingPipeline
 
 __all__ = [
+    "CachingEmbeddingService",
     "DeterministicFallbackEmbeddingService",
     "EmbeddingError",
     "SentenceTransformersEmbeddingService",
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Protocol
 
+import blake3
+
 try:
     from sentence_transformers import SentenceTransformer
     _HAS_ST = True
@@ -76,6 +79,47 @@ class DeterministicFallbackEmbeddingService:
         return out
 
 
+@dataclass
+class CachingEmbeddingService:
+    """
+    Wrap an embedding service with an LRU cache keyed by a hash of each text.
+
+    Only texts missing from the cache are sent to the wrapped service, in a
+    single call. Cached vectors are shared between callers and must not be mutated.
+    """
+
+    inner: EmbeddingService
+    max_entries: int = 4096
+
+    def __post_init__(self):
+        self._cache: OrderedDict[bytes, list[float]] = OrderedDict()
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if texts is None:
+            raise EmbeddingError("texts must be a list of strings")
+
+        keys = [blake3.blake3(t.encode("utf-8")).digest() for t in texts]
+        cache = self._cache
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in cache:
+                cache.move_to_end(key)
+            elif key not in missing:
+                missing[key] = text
+
+        fresh: dict[bytes, list[float]] = {}
+        if missing:
+            vectors = await self.inner.embed_texts(list(missing.values()))
+            fresh = dict(zip(missing, vectors, strict=True))
+
+        # Assemble before evicting so a batch larger than the cache still resolves
+        out = [fresh[key] if key in fresh else cache[key] for key in keys]
+        cache.update(fresh)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+        return out
+
+
 def get_default_embedding_service() -> EmbeddingService:
     if _HAS_ST:
         try:
@@ -6,13 +6,22 @@ including normalization, deduplication, chunking, and (optionally) embedding + v
 """
 
 import asyncio
-import hashlib
+import contextlib
+import mmap
+import time
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any, Protocol
 
-from alavista.core.chunking import chunk_text, normalize_text
+import blake3
+import numpy as np
+
+from alavista.core.chunking import ChunkInfo, chunk_text, normalize_text, sliding_window_chunks
 from alavista.core.corpus_store import CorpusStore
+from alavista.core.minhash import MinHashLSH, estimate_jaccard, minhash_signature
 from alavista.core.models import Chunk, Document
 from alavista.vector import VectorSearchService
 
@@ -33,6 +42,58 @@ class UnsupportedFormatError(IngestionError):
     pass
 
 
+SUPPORTED_FILE_FORMATS = {".txt", ".md"}
+
+# Inputs at least this large are hashed with BLAKE3's multithreaded mode; below
+# it, thread startup costs more than it saves
+_PARALLEL_HASH_MIN_BYTES = 1 << 20
+
+
+def _split_text(
+    text: str, min_chunk_size: int, max_chunk_size: int, stride: int | None
+) -> list[ChunkInfo]:
+    """Split normalized text with the paragraph or sliding-window chunker."""
+    if stride is not None:
+        return sliding_window_chunks(
+            text, window_size=max_chunk_size, stride=stride, assume_normalized=True
+        )
+    return chunk_text(
+        text,
+        min_chunk_size=min_chunk_size,
+        max_chunk_size=max_chunk_size,
+        assume_normalized=True,
+    )
+
+
+def _prepare_file(
+    file_path: str, min_chunk_size: int, max_chunk_size: int, stride: int | None
+) -> tuple[str, str, list[ChunkInfo]]:
+    """
+    Read, normalize, hash and chunk a file.
+
+    Runs in ingest_files worker processes, so it only touches the filesystem.
+
+    Returns:
+        Tuple of (normalized text, content hash, chunk infos)
+
+    Raises:
+        IngestionError: If the file cannot be read or is empty
+    """
+    try:
+        text = IngestionService._read_text_file(Path(file_path))
+    except Exception as e:
+        raise IngestionError(f"Failed to read file {file_path}: {e}") from e
+
+    normalized_text = normalize_text(text)
+    if not normalized_text:
+        raise IngestionError("Cannot ingest empty text")
+    return (
+        normalized_text,
+        IngestionService._compute_hash(normalized_text),
+        _split_text(normalized_text, min_chunk_size, max_chunk_size, stride),
+    )
+
+
 class IngestionService:
     """
     Service for ingesting documents from various sources.
@@ -48,6 +109,10 @@ class IngestionService:
         embedding_service: EmbeddingServiceProtocol | None = None,
         vector_search_service: VectorSearchService | None = None,
         persona_registry=None,
+        stride: int | None = None,
+        near_duplicate_threshold: float | None = None,
+        max_pending: int = 0,
+        max_pending_age: float = 4.0,
     ):
         """
         Initialize the ingestion service.
@@ -55,17 +120,45 @@ class IngestionService:
         Args:
             corpus_store: Storage backend for corpora and documents
             min_chunk_size: Minimum chunk size in characters
-            max_chunk_size: Maximum chunk size in characters
+            max_chunk_size: Maximum chunk size in characters (window size when `stride` is set)
             embedding_service: Optional embedding backend for chunk vectors
             vector_search_service: Optional vector index backend
             persona_registry: Optional PersonaRegistry for persona-specific ingestion
+            stride: Optional sliding-window stride in characters. When set, documents are
+                split into overlapping max_chunk_size windows instead of paragraph chunks.
+            near_duplicate_threshold: Optional MinHash Jaccard threshold (e.g. 0.8). When set,
+                documents at least this similar to an existing document in the corpus are
+                treated as duplicates and are not stored or embedded again.
+            max_pending: Number of documents to buffer before writing them in one batch.
+                0 (default) writes each document as it is ingested. Buffered documents
+                are not visible to readers of the corpus store until written, so call
+                `flush()` before reading them back and `close()` (or use the service
+                as a context manager) before shutdown.
+            max_pending_age: Age in seconds of the oldest buffered document past which
+                the next ingest flushes the buffer. There is no background timer: an
+                idle buffer is only written by `flush()` or `close()`.
         """
         self.corpus_store = corpus_store
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
+        self.stride = stride
         self.embedding_service = embedding_service
         self.vector_search_service = vector_search_service
         self.persona_registry = persona_registry
+        # corpus_id -> BLAKE3 hash of chunk text -> its embedding, so repeated text
+        # (e.g. unchanged paragraphs of an edited document) is embedded once
+        self._chunk_vectors: dict[str, dict[str, np.ndarray]] = {}
+        self.near_duplicate_threshold = near_duplicate_threshold
+        # corpus_id -> LSH index of document MinHash signatures, built on first use
+        self._near_duplicate_indexes: dict[str, MinHashLSH] = {}
+        self.max_pending = max_pending
+        self.max_pending_age = max_pending_age
+        self._pending: list[tuple[Document, list[Chunk]]] = []
+        self._pending_by_hash: dict[tuple[str, str], Document] = {}
+        self._pending_since: float | None = None
+        # document_id -> (corpus_id, MinHash signature) of buffered documents, moved
+        # into the LSH index once the document is written
+        self._pending_signatures: dict[str, tuple[str, np.ndarray]] = {}
 
     def ingest_text(
         self,
@@ -100,12 +193,44 @@ class IngestionService:
         # Compute content hash for deduplication
         content_hash = self._compute_hash(normalized_text)
 
-        # Check for duplicates
-        existing_doc = self.corpus_store.find_by_hash(corpus_id, content_hash)
+        return self._ingest_normalized(corpus_id, normalized_text, content_hash, metadata)
+
+    def _ingest_normalized(
+        self,
+        corpus_id: str,
+        normalized_text: str,
+        content_hash: str,
+        metadata: dict[str, Any] | None,
+        chunk_infos: list[ChunkInfo] | None = None,
+    ) -> tuple[Document, list[Chunk]]:
+        """
+        Deduplicate, chunk and store already normalized text.
+
+        Args:
+            corpus_id: ID of the target corpus (must exist)
+            normalized_text: Output of normalize_text, non-empty
+            content_hash: Hash of normalized_text
+            metadata: Optional metadata
+            chunk_infos: Precomputed chunk boundaries, if already split
+
+        Returns:
+            Tuple of (Document, list of Chunks)
+        """
+        # Check for duplicates (including documents still waiting to be written)
+        existing_doc = self._pending_by_hash.get(
+            (corpus_id, content_hash)
+        ) or self.corpus_store.find_by_hash(corpus_id, content_hash)
         if existing_doc:
             # Return existing document with its chunks
-            chunks = self._create_chunks(existing_doc)
-            return existing_doc, chunks
+            return existing_doc, self._get_chunks(existing_doc)
+
+        # Check for near-duplicates before paying for storage and embeddings
+        signature = None
+        if self.near_duplicate_threshold is not None:
+            signature = minhash_signature(normalized_text)
+            near_doc = self._find_near_duplicate(corpus_id, signature)
+            if near_doc:
+                return near_doc, self._get_chunks(near_doc)
 
         # Create new document
         doc_metadata = metadata or {}
@@ -119,17 +244,158 @@ class IngestionService:
             metadata=doc_metadata,
         )
 
-        # Store document
-        self.corpus_store.add_document(document)
-
         # Create chunks
-        chunks = self._create_chunks(document)
-
-        # Optionally embed and index
-        self._embed_and_index_chunks(document.corpus_id, chunks)
+        chunks = self._create_chunks(document, chunk_infos)
+
+        if self.max_pending > 0:
+            if signature is not None:
+                self._pending_signatures[document.id] = (corpus_id, signature)
+            self._enqueue(document, chunks)
+        else:
+            # Store document and chunks, then optionally embed and index
+            self.corpus_store.add_document_with_chunks(document, chunks)
+            if signature is not None:
+                self._near_duplicate_indexes[corpus_id].insert(document.id, signature)
+            self._embed_and_index_chunks(document.corpus_id, chunks)
 
         return document, chunks
 
+    def ingest_texts(
+        self,
+        corpus_id: str,
+        items: list[tuple[str, dict[str, Any] | None]],
+    ) -> list[tuple[Document, list[Chunk]]]:
+        """
+        Ingest several texts into a corpus with batched writes.
+
+        Equivalent to calling ingest_text for each item inside bulk_ingest, so
+        documents and chunks are written in a few transactions instead of one
+        per document.
+
+        Args:
+            corpus_id: ID of the target corpus
+            items: (text, metadata) pairs; metadata may be None
+
+        Returns:
+            List of (Document, list of Chunks) tuples, in input order
+
+        Raises:
+            IngestionError: If the corpus doesn't exist or any text is empty
+        """
+        with self.bulk_ingest():
+            return [self.ingest_text(corpus_id, text, metadata) for text, metadata in items]
+
+    @contextlib.contextmanager
+    def bulk_ingest(self, batch_size: int = 256) -> Iterator["IngestionService"]:
+        """
+        Context manager for loading many documents at once.
+
+        Inside the block documents are buffered and written `batch_size` at a time,
+        and a vector backend that supports it (FaissVectorSearchService.bulk) defers
+        rewriting its on-disk index until the block exits. Everything buffered is
+        flushed on exit.
+
+        Args:
+            batch_size: Documents per batched write
+
+        Yields:
+            This service
+        """
+        previous_max_pending = self.max_pending
+        self.max_pending = max(batch_size, 1)
+        vector_bulk = getattr(self.vector_search_service, "bulk", None)
+        try:
+            with vector_bulk() if vector_bulk else contextlib.nullcontext():
+                try:
+                    yield self
+                finally:
+                    self.flush()
+        finally:
+            self.max_pending = previous_max_pending
+
+    def flush(self) -> None:
+        """
+        Write all buffered documents and embed their chunks.
+
+        Documents are inserted in a single transaction; chunks are embedded with one
+        embedding call per corpus. A no-op when nothing is buffered. If the write
+        fails the documents stay buffered, so a later flush can retry them.
+
+        Raises:
+            IngestionError: If writing or embedding fails
+        """
+        if not self._pending:
+            return
+
+        pending = self._pending
+        try:
+            self.corpus_store.add_documents([document for document, _ in pending])
+            self.corpus_store.add_chunks_batch(
+                {document.id: chunks for document, chunks in pending}
+            )
+        except Exception as e:
+            raise IngestionError("Failed to write buffered documents") from e
+
+        self._pending = []
+        self._pending_by_hash = {}
+        self._pending_since = None
+        for document_id, (corpus_id, signature) in self._pending_signatures.items():
+            self._near_duplicate_indexes[corpus_id].insert(document_id, signature)
+        self._pending_signatures = {}
+
+        chunks_by_corpus: dict[str, list[Chunk]] = {}
+        for document, chunks in pending:
+            chunks_by_corpus.setdefault(document.corpus_id, []).extend(chunks)
+        for corpus_id, chunks in chunks_by_corpus.items():
+            self._embed_and_index_chunks(corpus_id, chunks)
+
+    def close(self) -> None:
+        """
+        Write any buffered documents.
+
+        Raises:
+            IngestionError: If writing or embedding fails
+        """
+        self.flush()
+
+    def __enter__(self) -> "IngestionService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _enqueue(self, document: Document, chunks: list[Chunk]) -> None:
+        """Buffer a document for the next flush, flushing if size or age limits are hit."""
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._pending.append((document, chunks))
+        self._pending_by_hash[(document.corpus_id, document.content_hash)] = document
+
+        if (
+            len(self._pending) >= self.max_pending
+            or now - self._pending_since >= self.max_pending_age
+        ):
+            self.flush()
+
+    def delete_corpus(self, corpus_id: str) -> bool:
+        """
+        Delete a corpus and its documents, dropping this service's caches for it.
+
+        Buffered documents are written first, so none of the corpus's documents
+        outlive the deletion.
+
+        Args:
+            corpus_id: ID of the corpus to delete
+
+        Returns:
+            True if the corpus was deleted, False if not found
+        """
+        self.flush()
+        self._chunk_vectors.pop(corpus_id, None)
+        self._near_duplicate_indexes.pop(corpus_id, None)
+        return self.corpus_store.delete_corpus(corpus_id)
+
     def ingest_file(
         self,
         corpus_id: str,
@@ -156,7 +422,90 @@ class IngestionService:
             UnsupportedFormatError: If file format is not supported
         """
         file_path = Path(file_path)
+        suffix = self._check_file(file_path)
+
+        # Read file content
+        try:
+            text = self._read_text_file(file_path)
+        except Exception as e:
+            raise IngestionError(f"Failed to read file {file_path}: {e}") from e
 
+        # Ingest as text
+        return self.ingest_text(
+            corpus_id, text, self._file_metadata(file_path, suffix, metadata or {})
+        )
+
+    def ingest_files(
+        self,
+        corpus_id: str,
+        file_paths: list[Path | str],
+        metadata: dict[str, Any] | None = None,
+        max_workers: int | None = None,
+    ) -> list[tuple[Document, list[Chunk]]]:
+        """
+        Ingest several files into a corpus, preparing them in parallel.
+
+        Reading, normalization, hashing and chunking run in a process pool. The
+        results are deduplicated and written from this process in batched
+        transactions (see bulk_ingest), since SQLite only has a single writer.
+
+        Args:
+            corpus_id: ID of the target corpus
+            file_paths: Paths to the files
+            metadata: Optional metadata applied to every file
+            max_workers: Worker processes (defaults to os.cpu_count()); 1 prepares
+                files in this process
+
+        Returns:
+            List of (Document, list of Chunks) tuples, in the order of file_paths
+
+        Raises:
+            IngestionError: If the corpus doesn't exist or a file cannot be read
+            UnsupportedFormatError: If a file format is not supported
+        """
+        if not self.corpus_store.get_corpus(corpus_id):
+            raise IngestionError(f"Corpus '{corpus_id}' not found")
+
+        paths = [Path(file_path) for file_path in file_paths]
+        suffixes = [self._check_file(path) for path in paths]
+        chunk_args = (self.min_chunk_size, self.max_chunk_size, self.stride)
+
+        if max_workers == 1 or len(paths) <= 1:
+            prepared = [_prepare_file(str(path), *chunk_args) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                prepared = list(
+                    executor.map(
+                        _prepare_file,
+                        [str(path) for path in paths],
+                        *(repeat(arg) for arg in chunk_args),
+                    )
+                )
+
+        results = []
+        with self.bulk_ingest():
+            for path, suffix, (normalized_text, content_hash, chunk_infos) in zip(
+                paths, suffixes, prepared, strict=True
+            ):
+                file_metadata = self._file_metadata(path, suffix, dict(metadata or {}))
+                results.append(
+                    self._ingest_normalized(
+                        corpus_id, normalized_text, content_hash, file_metadata, chunk_infos
+                    )
+                )
+        return results
+
+    def _check_file(self, file_path: Path) -> str:
+        """
+        Validate that a path is an existing file in a supported format.
+
+        Returns:
+            Lower-cased file suffix
+
+        Raises:
+            IngestionError: If the file does not exist or is not a file
+            UnsupportedFormatError: If the format is not supported
+        """
         if not file_path.exists():
             raise IngestionError(f"File not found: {file_path}")
 
@@ -165,34 +514,21 @@ class IngestionService:
 
         # Check supported formats
         suffix = file_path.suffix.lower()
-        supported_formats = {".txt", ".md"}
-
-        if suffix not in supported_formats:
+        if suffix not in SUPPORTED_FILE_FORMATS:
             raise UnsupportedFormatError(
-                f"Unsupported file format: {suffix}. Supported: {supported_formats}"
+                f"Unsupported file format: {suffix}. Supported: {SUPPORTED_FILE_FORMATS}"
             )
-
-        # Read file content
-        try:
-            text = file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try with latin-1 as fallback
-            try:
-                text = file_path.read_text(encoding="latin-1")
-            except Exception as e:
-                raise IngestionError(f"Failed to read file {file_path}: {e}") from e
-        except Exception as e:
-            raise IngestionError(f"Failed to read file {file_path}: {e}") from e
-
-        # Prepare metadata
-        file_metadata = metadata or {}
-        file_metadata.setdefault("source_type", "file")
-        file_metadata.setdefault("source_path", str(file_path))
-        file_metadata.setdefault("file_name", file_path.name)
-        file_metadata.setdefault("file_format", suffix)
-
-        # Ingest as text
-        return self.ingest_text(corpus_id, text, file_metadata)
+        return suffix
+
+    def _file_metadata(
+        self, file_path: Path, suffix: str, metadata: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Add file source fields to metadata without overriding caller values."""
+        metadata.setdefault("source_type", "file")
+        metadata.setdefault("source_path", str(file_path))
+        metadata.setdefault("file_name", file_path.name)
+        metadata.setdefault("file_format", suffix)
+        return metadata
 
     def ingest_url(
         self,
@@ -242,7 +578,7 @@ class IngestionService:
         Raises:
             IngestionError: If PersonaRegistry not configured or persona not found
         """
-        if not self.persona_registry:
+        if self.persona_registry is None:
             raise IngestionError("PersonaRegistry not configured for persona ingestion")
 
         # Get persona's manual corpus ID
@@ -281,7 +617,7 @@ class IngestionService:
         Raises:
             IngestionError: If PersonaRegistry not configured or persona not found
         """
-        if not self.persona_registry:
+        if self.persona_registry is None:
             raise IngestionError("PersonaRegistry not configured for persona ingestion")
 
         # Get persona's manual corpus ID
@@ -320,7 +656,7 @@ class IngestionService:
         Raises:
             IngestionError: If PersonaRegistry not configured or persona not found
         """
-        if not self.persona_registry:
+        if self.persona_registry is None:
             raise IngestionError("PersonaRegistry not configured for persona ingestion")
 
         # Get persona's manual corpus ID
@@ -339,37 +675,132 @@ class IngestionService:
         # Delegate to standard ingestion
         return self.ingest_url(corpus_id, url, persona_metadata)
 
-    def _compute_hash(self, text: str) -> str:
+    @staticmethod
+    def _read_text_file(file_path: Path) -> str:
+        """
+        Read a text file, decoding as UTF-8 with a latin-1 fallback.
+
+        The file is memory-mapped and decoded straight from the page cache, so no
+        intermediate bytes copy is made and the fallback decode does not re-read
+        the file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Decoded file content
         """
-        Compute SHA-256 hash of text for deduplication.
+        with open(file_path, "rb") as f:
+            if f.seek(0, 2) == 0:
+                # mmap cannot map empty files
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    try:
+                        return str(view, "utf-8")
+                    except UnicodeDecodeError:
+                        return str(view, "latin-1")
+
+    @staticmethod
+    def _compute_hash(text: str) -> str:
+        """
+        Compute BLAKE3 hash of text for deduplication.
 
         Args:
             text: Text to hash
 
         Returns:
-            Hex-encoded SHA-256 hash
+            Hex-encoded BLAKE3 hash (256-bit)
+        """
+        data = text.encode("utf-8")
+        if len(data) >= _PARALLEL_HASH_MIN_BYTES:
+            return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+        return blake3.blake3(data).hexdigest()
+
+    def _find_near_duplicate(self, corpus_id: str, signature) -> Document | None:
+        """
+        Look up a stored document whose MinHash similarity meets the threshold.
+
+        The corpus's LSH index is built from its stored documents on first use
+        and kept up to date by subsequent ingests through this service. Buffered
+        documents are not indexed until written, so they are compared directly.
+
+        Args:
+            corpus_id: ID of the corpus to search
+            signature: MinHash signature of the incoming text (None if it has no words)
+
+        Returns:
+            The matching Document, or None
         """
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+        lsh = self._near_duplicate_indexes.get(corpus_id)
+        if lsh is None:
+            lsh = MinHashLSH(threshold=self.near_duplicate_threshold)
+            for doc in self.corpus_store.list_documents(corpus_id):
+                doc_signature = minhash_signature(doc.text)
+                if doc_signature is not None:
+                    lsh.insert(doc.id, doc_signature)
+            self._near_duplicate_indexes[corpus_id] = lsh
+
+        if signature is None:
+            return None
+        match_id = lsh.query(signature)
+        if match_id:
+            return self.corpus_store.get_document(match_id)
+
+        best_id = None
+        best_score = 0.0
+        for document_id, (pending_corpus_id, pending_signature) in self._pending_signatures.items():
+            if pending_corpus_id != corpus_id:
+                continue
+            score = estimate_jaccard(signature, pending_signature)
+            if score >= lsh.threshold and score > best_score:
+                best_id, best_score = document_id, score
+        for document, _ in self._pending:
+            if document.id == best_id:
+                return document
+        return None
+
+    def _get_chunks(self, document: Document) -> list[Chunk]:
+        """
+        Get the chunks of an already ingested document.
+
+        Uses the chunks stored at ingestion time, falling back to re-chunking for
+        documents that are still buffered or were stored without chunks.
 
-    def _create_chunks(self, document: Document) -> list[Chunk]:
+        Args:
+            document: Existing document
+
+        Returns:
+            List of Chunk objects
+        """
+        if (document.corpus_id, document.content_hash) not in self._pending_by_hash:
+            chunks = self.corpus_store.get_chunks(document.id)
+            if chunks:
+                return chunks
+        return self._create_chunks(document)
+
+    def _create_chunks(
+        self, document: Document, chunk_infos: list[ChunkInfo] | None = None
+    ) -> list[Chunk]:
         """
         Create chunks from a document.
 
         Args:
             document: Document to chunk
+            chunk_infos: Precomputed chunk boundaries; computed from the text if None
 
         Returns:
             List of Chunk objects
         """
-        chunk_infos = chunk_text(
-            document.text,
-            min_chunk_size=self.min_chunk_size,
-            max_chunk_size=self.max_chunk_size,
-        )
+        if chunk_infos is None:
+            chunk_infos = _split_text(
+                document.text, self.min_chunk_size, self.max_chunk_size, self.stride
+            )
 
+        # Fields come straight from the chunker, so pydantic validation is skipped
         chunks = []
         for i, chunk_info in enumerate(chunk_infos):
-            chunk = Chunk(
+            chunk = Chunk.model_construct(
                 id=f"{document.id}::chunk_{i}",
                 document_id=document.id,
                 corpus_id=document.corpus_id,
@@ -386,19 +817,46 @@ class IngestionService:
         return chunks
 
     def _embed_and_index_chunks(self, corpus_id: str, chunks: list[Chunk]) -> None:
-        """Embed and index chunks if services are configured."""
-        if not self.embedding_service or not self.vector_search_service:
+        """
+        Embed and index chunks if services are configured.
+
+        Every chunk is indexed under its own document and chunk IDs, but only
+        text not yet embedded in this corpus (e.g. new paragraphs of an edited
+        document) is sent to the embedding backend; repeated text reuses the
+        cached vector.
+        """
+        if not self.embedding_service or not self.vector_search_service or not chunks:
             return
-        texts = [chunk.text for chunk in chunks]
+
+        cached = self._chunk_vectors.setdefault(corpus_id, {})
+        hashes = [self._compute_hash(chunk.text) for chunk in chunks]
+        missing: dict[str, str] = {}
+        for chunk_hash, chunk in zip(hashes, chunks, strict=True):
+            if chunk_hash not in cached and chunk_hash not in missing:
+                missing[chunk_hash] = chunk.text
+
         try:
-            vectors = self._run_coro(self.embedding_service.embed_texts(texts))
+            fresh: dict[str, np.ndarray] = {}
+            if missing:
+                vectors = self._run_coro(self.embedding_service.embed_texts(list(missing.values())))
+                fresh = {
+                    chunk_hash: np.asarray(vector, dtype=np.float32)
+                    for chunk_hash, vector in zip(missing, vectors, strict=True)
+                }
             items = [
-                (chunk.document_id, chunk.id, vectors[i]) for i, chunk in enumerate(chunks)
+                (
+                    chunk.document_id,
+                    chunk.id,
+                    (fresh[chunk_hash] if chunk_hash in fresh else cached[chunk_hash]).tolist(),
+                )
+                for chunk_hash, chunk in zip(hashes, chunks, strict=True)
             ]
             self._run_coro(self.vector_search_service.index_embeddings(corpus_id, items))
         except Exception as e:
             raise IngestionError("Failed to embed or index document chunks") from e
 
+        cached.update(fresh)
+
     def _run_coro(self, coro):
         """Run an async coroutine from sync context."""
         try:
@@ -4,11 +4,62 @@ Logging configuration for Alavista.
 Provides structured logging with support for both standard and JSON formats.
 """
 
+import json
 import logging
 import sys
+from functools import lru_cache
 
 from alavista.core.config import get_settings
 
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except Exception:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+JSON_LOG_FORMAT = (
+    '{"timestamp":"%(asctime)s","level":"%(levelname)s",'
+    '"logger":"%(name)s","message":"%(message)s"}'
+)
+STANDARD_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+STANDARD_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter that emits one JSON object per record.
+
+    Builds a dict per record and serializes it in a single call (orjson when
+    installed), so messages containing quotes or newlines still produce valid
+    JSON. `_fmt` keeps the equivalent template for introspection.
+    """
+
+    def __init__(self):
+        super().__init__(JSON_LOG_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if _HAS_ORJSON:
+            return orjson.dumps(payload).decode("utf-8")
+        return json.dumps(payload, ensure_ascii=False)
+
+
+@lru_cache(maxsize=2)
+def _get_formatter(use_json: bool) -> logging.Formatter:
+    """Return the shared formatter instance for the requested style."""
+    if use_json:
+        return JsonFormatter()
+    return logging.Formatter(STANDARD_LOG_FORMAT, datefmt=STANDARD_DATE_FORMAT)
+
 
 def configure_logging(level: str | None = None, json_format: bool | None = None) -> None:
     """
@@ -38,20 +89,7 @@ def configure_logging(level: str | None = None, json_format: bool | None = None)
     console_handler.setLevel(log_level.upper())
 
     # Set format based on json_format flag
-    if use_json:
-        # JSON format for structured logging
-        # In production, you might want to use python-json-logger or similar
-        formatter = logging.Formatter(
-            '{"timestamp":"%(asctime)s","level":"%(levelname)s",'
-            '"logger":"%(name)s","message":"%(message)s"}'
-        )
-    else:
-        # Standard format
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
-
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_get_formatter(use_json))
     root_logger.addHandler(console_handler)
 
 
@@ -0,0 +1,142 @@
+"""
+MinHash signatures and LSH banding for near-duplicate document detection.
+
+Signatures estimate the Jaccard similarity of two documents' word-shingle sets;
+the LSH index buckets signatures by band so candidate near-duplicates can be
+found without comparing against every stored document.
+"""
+
+import re
+
+import blake3
+import numpy as np
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+
+# Universal hashing parameters (same scheme as datasketch): h(x) = (a*x + b) mod p
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_PERM_SEED = 1
+
+
+def _permutations(num_perm: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(_PERM_SEED)
+    a = rng.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+_PERM_A, _PERM_B = _permutations(NUM_PERM)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """
+    Build the set of word n-gram shingles for a text.
+
+    Args:
+        text: Input text
+        size: Number of words per shingle
+
+    Returns:
+        Set of shingles; texts shorter than `size` words yield a single shingle
+    """
+    words = re.findall(r"\w+", text.lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(text: str, shingle_size: int = SHINGLE_SIZE) -> np.ndarray | None:
+    """
+    Compute a MinHash signature over a text's word shingles.
+
+    Args:
+        text: Input text
+        shingle_size: Number of words per shingle
+
+    Returns:
+        Array of NUM_PERM uint64 values, or None if the text has no words
+    """
+    shingle_set = shingles(text, shingle_size)
+    if not shingle_set:
+        return None
+
+    hashes = np.fromiter(
+        (
+            int.from_bytes(blake3.blake3(s.encode("utf-8")).digest(length=4), "little")
+            for s in shingle_set
+        ),
+        dtype=np.uint64,
+        count=len(shingle_set),
+    )
+    # uint64 multiplication wraps, which is intended for the hash family
+    permuted = np.bitwise_and((np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME, _MAX_HASH)
+    return permuted.min(axis=0)
+
+
+def estimate_jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimate Jaccard similarity from two MinHash signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+class MinHashLSH:
+    """
+    Banded LSH index over MinHash signatures.
+
+    Candidates share at least one identical band; they are then verified
+    against `threshold` using the estimated Jaccard similarity.
+    """
+
+    def __init__(self, threshold: float = 0.8, bands: int = 18, rows: int = 7):
+        """
+        Initialize the LSH index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity to report a match
+            bands: Number of bands
+            rows: Signature values per band (bands * rows must not exceed NUM_PERM)
+        """
+        if bands * rows > NUM_PERM:
+            raise ValueError(f"bands * rows must be <= {NUM_PERM}")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self._buckets: list[dict[bytes, list[str]]] = [{} for _ in range(bands)]
+        self._signatures: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        return [
+            signature[i * self.rows : (i + 1) * self.rows].tobytes() for i in range(self.bands)
+        ]
+
+    def insert(self, key: str, signature: np.ndarray) -> None:
+        """Add a signature to the index under `key`."""
+        self._signatures[key] = signature
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            bucket.setdefault(band_key, []).append(key)
+
+    def query(self, signature: np.ndarray) -> str | None:
+        """
+        Find the most similar indexed key at or above the threshold.
+
+        Args:
+            signature: MinHash signature to look up
+
+        Returns:
+            Key of the best match, or None if no candidate reaches the threshold
+        """
+        candidates: set[str] = set()
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            candidates.update(bucket.get(band_key, ()))
+
+        best_key = None
+        best_score = 0.0
+        for key in sorted(candidates):
+            score = estimate_jaccard(signature, self._signatures[key])
+            if score >= self.threshold and (best_key is None or score > best_score):
+                best_key, best_score = key, score
+        return best_key
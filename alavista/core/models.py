@@ -44,7 +44,7 @@ class Document(BaseModel):
     id: str = Field(..., description="Unique identifier for the document")
     corpus_id: str = Field(..., description="ID of the corpus this document belongs to")
     text: str = Field(..., description="Full text content of the document")
-    content_hash: str = Field(..., description="SHA-256 hash of normalized text for deduplication")
+    content_hash: str = Field(..., description="BLAKE3 hash of normalized text for deduplication")
     metadata: dict[str, Any] = Field(
         default_factory=dict,
         description="Document metadata (source_type, source_path, title, etc.)",
@@ -0,0 +1,32 @@
+"""
+Top-k selection shared by the keyword and vector search backends.
+"""
+
+import numpy as np
+
+
+def top_k_indices(scores: np.ndarray, candidates: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select the k highest scoring candidates, sorted by score descending.
+
+    Runs in O(n + k log k) via a partial partition rather than a full sort.
+    Ties are broken by ascending index, including ties at the k-th score,
+    so the result equals a stable full sort truncated to k.
+
+    Args:
+        scores: Scores indexed by position
+        candidates: Ascending positions to rank
+        k: Number of results; at most len(candidates) are returned
+
+    Returns:
+        Positions of the top k candidates in rank order
+    """
+    if k <= 0:
+        return candidates[:0]
+    if k < len(candidates):
+        candidate_scores = scores[candidates]
+        kth_score = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+        above = candidates[candidate_scores > kth_score]
+        tied = candidates[candidate_scores == kth_score][: k - len(above)]
+        candidates = np.concatenate((above, tied))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
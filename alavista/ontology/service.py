@@ -1,55 +1,114 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except Exception:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
 
 class OntologyError(Exception):
     pass
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON to read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively copy a frozen value back to plain dicts and lists."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=32)
+def _load_ontology(path: Path, mtime_ns: int, size: int) -> MappingProxyType:
+    """Parse an ontology file; cached per file version (mtime and size).
+
+    The result is frozen because it is shared by every service loaded from
+    that version.
+    """
+    raw = path.read_bytes()
+    return _freeze(orjson.loads(raw) if _HAS_ORJSON else json.loads(raw))
+
+
 class OntologyService:
     def __init__(self, ontology_path: Path):
         self.ontology_path = Path(ontology_path)
         if not self.ontology_path.exists():
             raise OntologyError(f"Ontology file not found: {self.ontology_path}")
         self._data = self._load()
+        self._alias_to_type = self._build_alias_map()
+        self._relation_domain_range = self._build_relation_domain_range()
+        self._entity_types = frozenset(self._data.get("entities", {}))
+        self._relation_types = frozenset(self._data.get("relations", {}))
 
-    def _load(self) -> dict[str, Any]:
+    def _load(self) -> MappingProxyType:
         try:
-            with self.ontology_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            path = self.ontology_path.resolve()
+            stat = path.stat()
+            return _load_ontology(path, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             raise OntologyError(f"Failed to load ontology: {e}") from e
 
+    def _build_alias_map(self) -> dict[str, str]:
+        # Earlier entities (and names before aliases) win on collisions,
+        # matching a linear scan of the ontology in file order.
+        alias_to_type: dict[str, str] = {}
+        for etype, info in self._data.get("entities", {}).items():
+            alias_to_type.setdefault(etype.lower(), etype)
+            for alias in info.get("aliases", []):
+                alias_to_type.setdefault(alias.lower(), etype)
+        return alias_to_type
+
+    def _build_relation_domain_range(self) -> dict[str, tuple[frozenset[str], frozenset[str]]]:
+        return {
+            rtype: (frozenset(info.get("domain", [])), frozenset(info.get("range", [])))
+            for rtype, info in self._data.get("relations", {}).items()
+            if info
+        }
+
     def list_entity_types(self) -> list[str]:
         return list(self._data.get("entities", {}).keys())
 
     def list_relation_types(self) -> list[str]:
         return list(self._data.get("relations", {}).keys())
 
+    def unknown_entity_types(self, entity_types: Iterable[str]) -> list[str]:
+        return sorted(frozenset(entity_types) - self._entity_types)
+
+    def unknown_relation_types(self, relation_types: Iterable[str]) -> list[str]:
+        return sorted(frozenset(relation_types) - self._relation_types)
+
     def get_entity_info(self, entity_type: str) -> dict | None:
-        return self._data.get("entities", {}).get(entity_type)
+        return _thaw(self._data.get("entities", {}).get(entity_type))
 
     def get_relation_info(self, relation_type: str) -> dict | None:
-        return self._data.get("relations", {}).get(relation_type)
+        return _thaw(self._data.get("relations", {}).get(relation_type))
 
     def resolve_entity_type(self, name_or_alias: str) -> str | None:
-        name_lower = name_or_alias.lower()
-        entities = self._data.get("entities", {})
-        for etype, info in entities.items():
-            if etype.lower() == name_lower:
-                return etype
-            for alias in info.get("aliases", []):
-                if alias.lower() == name_lower:
-                    return etype
-        return None
+        return self._alias_to_type.get(name_or_alias.lower())
 
     def validate_relation(self, subject_type: str, relation_type: str, object_type: str) -> bool:
-        rel = self._data.get("relations", {}).get(relation_type)
-        if not rel:
+        domain_range = self._relation_domain_range.get(relation_type)
+        if domain_range is None:
             return False
-        domain = rel.get("domain", [])
-        range_ = rel.get("range", [])
+        domain, range_ = domain_range
         return subject_type in domain and object_type in range_
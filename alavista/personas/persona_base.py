@@ -2,10 +2,17 @@
 
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from alavista.personas.models import PersonaAnswer, PersonaConfig, QuestionCategory
 
 
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Combine patterns into one alternation so a question is scanned once."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
 class PersonaBase(ABC):
     """Abstract base class for all personas."""
 
@@ -68,6 +75,32 @@ class PersonaBase(ABC):
 class DefaultPersona(PersonaBase):
     """Default persona implementation with heuristic-based logic."""
 
+    # Preferred tools per question category, in priority order
+    CATEGORY_TOOLS = {
+        # Prioritize graph tools for structural questions, with search for context
+        "structural": ("graph_find_entity", "graph_neighbors", "graph_paths", "semantic_search"),
+        # Timeline questions benefit from search + potential graph context
+        "timeline": ("semantic_search", "keyword_search"),
+        # Comparison needs search to gather both sides
+        "comparison": ("semantic_search", "graph_neighbors"),
+        # Semantic default: hybrid search
+        "semantic": ("semantic_search", "keyword_search"),
+    }
+
+    def __init__(self, config: PersonaConfig):
+        """Initialize persona and resolve its per-category tool lists.
+
+        Args:
+            config: Persona configuration loaded from YAML
+        """
+        super().__init__(config)
+        # Filter against the whitelist once instead of on every question
+        allowed = set(self.tools_allowed)
+        self._category_tools = {
+            category: tuple(tool for tool in tools if tool in allowed)
+            for category, tools in self.CATEGORY_TOOLS.items()
+        }
+
     # Question categorization patterns
     STRUCTURAL_PATTERNS = [
         r"\bconnected to\b",
@@ -114,21 +147,21 @@ class DefaultPersona(PersonaBase):
         question_lower = question.lower()
 
         # Check patterns in priority order
-        if any(re.search(pattern, question_lower) for pattern in self.STRUCTURAL_PATTERNS):
+        if _compile_patterns(tuple(self.STRUCTURAL_PATTERNS)).search(question_lower):
             return QuestionCategory(
                 category="structural",
                 confidence=0.8,
                 reasoning="Question contains structural/relationship keywords",
             )
 
-        if any(re.search(pattern, question_lower) for pattern in self.TIMELINE_PATTERNS):
+        if _compile_patterns(tuple(self.TIMELINE_PATTERNS)).search(question_lower):
             return QuestionCategory(
                 category="timeline",
                 confidence=0.7,
                 reasoning="Question contains temporal keywords",
             )
 
-        if any(re.search(pattern, question_lower) for pattern in self.COMPARISON_PATTERNS):
+        if _compile_patterns(tuple(self.COMPARISON_PATTERNS)).search(question_lower):
             return QuestionCategory(
                 category="comparison",
                 confidence=0.7,
@@ -152,43 +185,8 @@ class DefaultPersona(PersonaBase):
         Returns:
             List of tool names to use
         """
-        tools = []
-
-        if category.category == "structural":
-            # Prioritize graph tools for structural questions
-            if "graph_find_entity" in self.tools_allowed:
-                tools.append("graph_find_entity")
-            if "graph_neighbors" in self.tools_allowed:
-                tools.append("graph_neighbors")
-            if "graph_paths" in self.tools_allowed:
-                tools.append("graph_paths")
-            # Still include search for context
-            if "semantic_search" in self.tools_allowed:
-                tools.append("semantic_search")
-
-        elif category.category == "timeline":
-            # Timeline questions benefit from search + potential graph context
-            if "semantic_search" in self.tools_allowed:
-                tools.append("semantic_search")
-            if "keyword_search" in self.tools_allowed:
-                tools.append("keyword_search")
-
-        elif category.category == "comparison":
-            # Comparison needs search to gather both sides
-            if "semantic_search" in self.tools_allowed:
-                tools.append("semantic_search")
-            if "graph_neighbors" in self.tools_allowed:
-                tools.append("graph_neighbors")
-
-        else:
-            # Semantic default: hybrid search
-            if "semantic_search" in self.tools_allowed:
-                tools.append("semantic_search")
-            if "keyword_search" in self.tools_allowed:
-                tools.append("keyword_search")
-
-        # Return only allowed tools
-        return [tool for tool in tools if tool in self.tools_allowed]
+        tools = self._category_tools.get(category.category, self._category_tools["semantic"])
+        return list(tools)
 
     def format_answer(self, result: PersonaAnswer) -> str:
         """Format answer with citations and disclaimers.
@@ -208,10 +206,10 @@ class DefaultPersona(PersonaBase):
         # Add evidence if present
         if result.evidence:
             output.append("## Evidence")
-            for i, ev in enumerate(result.evidence[:5], 1):  # Limit to top 5
-                doc_id = ev.get("document_id", "unknown")
-                excerpt = ev.get("excerpt", "")[:200]
-                output.append(f"{i}. `{doc_id}`: {excerpt}...")
+            output.extend(
+                f"{i}. `{ev.get('document_id', 'unknown')}`: {ev.get('excerpt', '')[:200]}..."
+                for i, ev in enumerate(result.evidence[:5], 1)  # Limit to top 5
+            )
 
             if len(result.evidence) > 5:
                 output.append(f"\n_({len(result.evidence) - 5} more citations available)_")
@@ -220,10 +218,10 @@ class DefaultPersona(PersonaBase):
         # Add graph evidence if present
         if result.graph_evidence:
             output.append("## Graph Connections")
-            for i, ge in enumerate(result.graph_evidence[:5], 1):
-                node_type = ge.get("type", "Node")
-                name = ge.get("name", "unknown")
-                output.append(f"{i}. **{node_type}**: {name}")
+            output.extend(
+                f"{i}. **{ge.get('type', 'Node')}**: {ge.get('name', 'unknown')}"
+                for i, ge in enumerate(result.graph_evidence[:5], 1)
+            )
 
             if len(result.graph_evidence) > 5:
                 output.append(
@@ -239,7 +237,6 @@ class DefaultPersona(PersonaBase):
         # Add disclaimers
         if result.disclaimers:
             output.append("---")
-            for disclaimer in result.disclaimers:
-                output.append(f"_{disclaimer}_")
+            output.extend(f"_{disclaimer}_" for disclaimer in result.disclaimers)
 
         return "\n".join(output)
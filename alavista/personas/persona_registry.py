@@ -1,11 +1,18 @@
 """Persona registry for loading and managing persona configurations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from alavista.ontology.service import OntologyService
 from alavista.personas.models import PersonaConfig
 from alavista.personas.persona_base import DefaultPersona, PersonaBase
@@ -13,6 +20,34 @@ from alavista.personas.persona_base import DefaultPersona, PersonaBase
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _load_persona_yaml(filepath: Path, mtime_ns: int, size: int) -> PersonaConfig:
+    """Parse a persona YAML file; cached per file version (mtime and size)."""
+    with open(filepath) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return PersonaConfig(**data)
+
+
+def _read_persona_config(filepath: Path) -> PersonaConfig:
+    """Parse a persona YAML file into a private copy of its (cached) config."""
+    stat = filepath.stat()
+    # Copy so registries never share (and mutate) the cached config
+    return _load_persona_yaml(filepath, stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
+
+
+def _try_read_persona_config(filepath: Path) -> PersonaConfig | Exception:
+    """Like _read_persona_config, but return the error instead of raising it."""
+    try:
+        return _read_persona_config(filepath)
+    except Exception as e:
+        return e
+
+
+def _quoted(names: list[str]) -> str:
+    """Format names for a validation message, e.g. "'A', 'B'"."""
+    return ", ".join(f"'{name}'" for name in names)
+
+
 class PersonaValidationError(Exception):
     """Raised when a persona configuration is invalid."""
 
@@ -39,6 +74,7 @@ class PersonaRegistry:
         """
         self.ontology_service = ontology_service
         self.allowed_tools = allowed_tools or []
+        self._allowed_tool_set = frozenset(self.allowed_tools)
         self.corpus_store = corpus_store
         self.auto_create_corpora = auto_create_corpora
         self._personas: dict[str, PersonaBase] = {}
@@ -63,9 +99,18 @@ class PersonaRegistry:
             logger.warning(f"No YAML files found in {directory}")
             return
 
-        for yaml_file in yaml_files:
+        if len(yaml_files) > 2:
+            # Overlap file reads and parsing; registration stays serial, in file order
+            with ThreadPoolExecutor(max_workers=min(8, len(yaml_files))) as executor:
+                parsed = list(executor.map(_try_read_persona_config, yaml_files))
+        else:
+            parsed = [_try_read_persona_config(yaml_file) for yaml_file in yaml_files]
+
+        for yaml_file, config in zip(yaml_files, parsed, strict=True):
             try:
-                self.load_from_file(yaml_file)
+                if isinstance(config, Exception):
+                    raise config
+                self._register_config(config)
             except Exception as e:
                 logger.error(f"Failed to load persona from {yaml_file}: {e}")
                 raise PersonaValidationError(
@@ -86,11 +131,34 @@ class PersonaRegistry:
         Raises:
             PersonaValidationError: If persona is invalid
         """
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        return self._register_config(_read_persona_config(Path(filepath)))
+
+    def load_from_mapping(self, data: dict) -> PersonaBase:
+        """Load a single persona from already parsed configuration data.
+
+        Args:
+            data: Persona configuration, in the same shape as a persona YAML file
+
+        Returns:
+            Loaded PersonaBase instance
+
+        Raises:
+            PersonaValidationError: If persona is invalid
+        """
+        return self._register_config(PersonaConfig(**data))
+
+    def _register_config(self, config: PersonaConfig) -> PersonaBase:
+        """Validate a persona configuration and register the resulting persona.
 
-        config = PersonaConfig(**data)
+        Args:
+            config: Persona configuration
+
+        Returns:
+            Registered PersonaBase instance
 
+        Raises:
+            PersonaValidationError: If persona is invalid
+        """
         # Validate the configuration
         self._validate_config(config)
 
@@ -116,41 +184,48 @@ class PersonaRegistry:
         Raises:
             PersonaValidationError: If configuration is invalid
         """
+        # Each check reports every offending name at once via a set difference
         # Validate entity types
-        entity_types = self.ontology_service.list_entity_types()
-        for entity_type in config.entity_whitelist:
-            if entity_type not in entity_types:
-                raise PersonaValidationError(
-                    f"Unknown entity type '{entity_type}' in persona '{config.id}'. "
-                    f"Valid types: {entity_types}"
-                )
+        unknown = self.ontology_service.unknown_entity_types(config.entity_whitelist)
+        if unknown:
+            raise PersonaValidationError(
+                f"Unknown entity type(s) {_quoted(unknown)} in persona '{config.id}'. "
+                f"Valid types: {self.ontology_service.list_entity_types()}"
+            )
 
         # Validate relation types
-        relation_types = self.ontology_service.list_relation_types()
-        for relation_type in config.relation_whitelist:
-            if relation_type not in relation_types:
-                raise PersonaValidationError(
-                    f"Unknown relation type '{relation_type}' in persona '{config.id}'. "
-                    f"Valid types: {relation_types}"
-                )
+        unknown = self.ontology_service.unknown_relation_types(config.relation_whitelist)
+        if unknown:
+            raise PersonaValidationError(
+                f"Unknown relation type(s) {_quoted(unknown)} in persona '{config.id}'. "
+                f"Valid types: {self.ontology_service.list_relation_types()}"
+            )
 
         # Validate tools (if allowed_tools is specified)
         if self.allowed_tools:
-            for tool in config.tools_allowed:
-                if tool not in self.allowed_tools:
-                    raise PersonaValidationError(
-                        f"Unknown tool '{tool}' in persona '{config.id}'. "
-                        f"Valid tools: {self.allowed_tools}"
-                    )
+            unknown = sorted(frozenset(config.tools_allowed) - self._allowed_tool_set)
+            if unknown:
+                raise PersonaValidationError(
+                    f"Unknown tool(s) {_quoted(unknown)} in persona '{config.id}'. "
+                    f"Valid tools: {self.allowed_tools}"
+                )
 
         # Validate strength rules reference valid relations
-        for strength_category in config.strength_rules.values():
-            for relation in strength_category:
-                if relation not in config.relation_whitelist:
-                    raise PersonaValidationError(
-                        f"Strength rule references relation '{relation}' "
-                        f"not in relation_whitelist for persona '{config.id}'"
-                    )
+        strength_relations = frozenset().union(*config.strength_rules.values())
+        unknown = sorted(strength_relations.difference(config.relation_whitelist))
+        if unknown:
+            raise PersonaValidationError(
+                f"Strength rule references relation(s) {_quoted(unknown)} "
+                f"not in relation_whitelist for persona '{config.id}'"
+            )
+
+    def __contains__(self, persona_id: object) -> bool:
+        """Check whether a persona ID is registered."""
+        return persona_id in self._personas
+
+    def __len__(self) -> int:
+        """Number of registered personas."""
+        return len(self._personas)
 
     def get_persona(self, persona_id: str) -> Optional[PersonaBase]:
         """Get a persona by ID.
@@ -188,10 +263,22 @@ class PersonaRegistry:
         Returns:
             Dictionary with id, name, description or None if not found
         """
-        persona = self.get_persona(persona_id)
+        persona = self._personas.get(persona_id)
         if not persona:
             return None
+        return self._summarize(persona)
+
+    def list_persona_summaries(self) -> list[dict]:
+        """List summaries of all personas.
+
+        Returns:
+            List of persona summary dictionaries
+        """
+        return [self._summarize(persona) for persona in self._personas.values()]
 
+    @staticmethod
+    def _summarize(persona: PersonaBase) -> dict:
+        """Build the API-safe summary dictionary for a persona."""
         return {
             "id": persona.id,
             "name": persona.name,
@@ -201,18 +288,6 @@ class PersonaRegistry:
             "tools": persona.tools_allowed,
         }
 
-    def list_persona_summaries(self) -> list[dict]:
-        """List summaries of all personas.
-
-        Returns:
-            List of persona summary dictionaries
-        """
-        return [
-            self.get_persona_summary(persona_id)
-            for persona_id in self.list_persona_ids()
-            if self.get_persona_summary(persona_id) is not None
-        ]
-
     def _ensure_persona_corpus(self, persona_id: str) -> str:
         """Ensure a manual corpus exists for a persona.
 
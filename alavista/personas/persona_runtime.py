@@ -4,7 +4,7 @@ import logging
 from typing import Any, Optional
 
 from alavista.core.corpus_store import CorpusStore
-from alavista.core.models import Chunk
+from alavista.core.models import Chunk, SearchResult
 from alavista.graph.graph_service import GraphService
 from alavista.personas.models import PersonaAnswer
 from alavista.personas.persona_base import PersonaBase
@@ -69,6 +69,86 @@ class PersonaRuntime:
         Raises:
             PersonaRuntimeError: If persona not found or execution fails
         """
+        return self._answer(persona_id, question, corpus_id, k, use_persona_manual)
+
+    def answer_questions(
+        self,
+        pairs: list[tuple[str, str]],
+        corpus_id: str,
+        k: int = 20,
+        use_persona_manual: bool = True,
+    ) -> list[PersonaAnswer]:
+        """Answer several (persona, question) pairs against one corpus.
+
+        Questions that would run a corpus search in `answer_question` are
+        searched together in a single batched BM25 call; each answer is otherwise
+        produced as by `answer_question`. No search runs when no question needs one.
+
+        Args:
+            pairs: (persona_id, question) pairs to answer
+            corpus_id: ID of the corpus to search
+            k: Number of search results to retrieve per question
+            use_persona_manual: Whether to include persona manual corpus content as context
+
+        Returns:
+            PersonaAnswer objects in the same order as `pairs`
+
+        Raises:
+            PersonaRuntimeError: If any persona is not found
+        """
+        for persona_id, _ in pairs:
+            if not self.persona_registry.get_persona(persona_id):
+                raise PersonaRuntimeError(f"Persona '{persona_id}' not found")
+
+        batched = [
+            i for i, (persona_id, question) in enumerate(pairs)
+            if self._uses_corpus_search(persona_id, question)
+        ]
+        search_evidence: list[list[dict[str, Any]] | None] = [None] * len(pairs)
+        if batched:
+            results = self._run_search_batch(
+                corpus_id=corpus_id,
+                queries=[pairs[i][1] for i in batched],
+                k=k,
+            )
+            for i, evidence in zip(batched, results, strict=True):
+                search_evidence[i] = evidence
+        return [
+            self._answer(persona_id, question, corpus_id, k, use_persona_manual, evidence)
+            for (persona_id, question), evidence in zip(pairs, search_evidence, strict=True)
+        ]
+
+    def _uses_corpus_search(self, persona_id: str, question: str) -> bool:
+        """Whether `_answer` would search the corpus for this question.
+
+        Mirrors its routing: structural, timeline and comparison questions go to
+        GraphRAG when available, and the rest search only if the persona selects
+        a search tool.
+        """
+        persona = self.persona_registry.get_persona(persona_id)
+        category = persona.categorize_question(question)
+        if (
+            self.graph_rag_service
+            and category.category in ["structural", "timeline", "comparison"]
+        ):
+            return False
+        tools = persona.select_tools(question, category)
+        return "semantic_search" in tools or "keyword_search" in tools
+
+    def _answer(
+        self,
+        persona_id: str,
+        question: str,
+        corpus_id: str,
+        k: int,
+        use_persona_manual: bool,
+        search_evidence: list[dict[str, Any]] | None = None,
+    ) -> PersonaAnswer:
+        """Answer one question as described in `answer_question`.
+
+        `search_evidence`, when given, is evidence already retrieved for this
+        question by a batched search and replaces the per-question corpus search.
+        """
         # 1. Retrieve persona
         persona = self.persona_registry.get_persona(persona_id)
         if not persona:
@@ -130,7 +210,8 @@ class PersonaRuntime:
         logger.info(f"Selected tools: {tools}")
 
         # 4. Run retrieval based on selected tools
-        evidence = []
+        # Evidence is deduplicated by chunk_id as it arrives, keeping the best score
+        evidence_by_chunk: dict[str, dict[str, Any]] = {}
         graph_evidence = []
 
         # 4a. Optionally retrieve from persona manual corpus
@@ -150,15 +231,15 @@ class PersonaRuntime:
 
         # Execute search tools
         if "semantic_search" in tools or "keyword_search" in tools:
-            search_mode = "hybrid" if "semantic_search" in tools else "bm25"
-            evidence.extend(
-                self._run_search(
+            if search_evidence is None:
+                search_mode = "hybrid" if "semantic_search" in tools else "bm25"
+                search_evidence = self._run_search(
                     corpus_id=corpus_id,
                     query=question,
                     mode=search_mode,
                     k=k,
                 )
-            )
+            self._merge_evidence(evidence_by_chunk, search_evidence)
 
         # Execute graph tools
         if any(
@@ -173,7 +254,7 @@ class PersonaRuntime:
             )
 
         # 5. Aggregate evidence
-        evidence = self._deduplicate_evidence(evidence)
+        evidence = sorted(evidence_by_chunk.values(), key=lambda ev: ev["score"], reverse=True)
         graph_evidence = self._deduplicate_graph_evidence(graph_evidence)
 
         # 6. Construct answer
@@ -218,48 +299,84 @@ class PersonaRuntime:
             List of evidence dictionaries
         """
         try:
-            # Get chunks from corpus
-            documents = self.corpus_store.list_documents(corpus_id)
-            chunks = []
-            for doc in documents:
-                doc_chunks = [
-                    Chunk(
-                        id=f"{doc.id}::chunk_{i}",
-                        document_id=doc.id,
-                        corpus_id=corpus_id,
-                        text=doc.text,  # Simplified - would use actual chunks
-                        start_offset=0,
-                        end_offset=len(doc.text),
-                        metadata={"chunk_index": i, "total_chunks": 1},
-                    )
-                    for i in range(1)
-                ]
-                chunks.extend(doc_chunks)
-
             # Run search
             results = self.search_service.search_bm25(
                 corpus_id=corpus_id,
-                chunks=chunks,
+                chunks=self._corpus_chunks(corpus_id),
                 query=query,
                 k=k,
             )
-
-            # Convert to evidence format
-            return [
-                {
-                    "document_id": result.doc_id,
-                    "chunk_id": result.chunk_id,
-                    "score": result.score,
-                    "excerpt": result.excerpt,
-                    "metadata": result.metadata,
-                }
-                for result in results
-            ]
+            return self._to_evidence(results)
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    def _run_search_batch(
+        self,
+        corpus_id: str,
+        queries: list[str],
+        k: int = 20,
+    ) -> list[list[dict[str, Any]]]:
+        """Run one batched BM25 search and return evidence per query.
+
+        Args:
+            corpus_id: Corpus to search
+            queries: Search queries
+            k: Number of results per query
+
+        Returns:
+            One list of evidence dictionaries per query
+        """
+        try:
+            results = self.search_service.search_bm25_batch(
+                corpus_id=corpus_id,
+                chunks=self._corpus_chunks(corpus_id),
+                queries=queries,
+                k=k,
+            )
+            return [self._to_evidence(query_results) for query_results in results]
+
+        except Exception as e:
+            logger.error(f"Batched search failed: {e}")
+            return [[] for _ in queries]
+
+    def _corpus_chunks(self, corpus_id: str) -> list[Chunk]:
+        """Build searchable chunks for a corpus, streaming its documents.
+
+        Args:
+            corpus_id: Corpus to read
+
+        Returns:
+            One chunk per document
+        """
+        return [
+            Chunk(
+                id=f"{doc.id}::chunk_0",
+                document_id=doc.id,
+                corpus_id=corpus_id,
+                text=doc.text,  # Simplified - would use actual chunks
+                start_offset=0,
+                end_offset=len(doc.text),
+                metadata={"chunk_index": 0, "total_chunks": 1},
+            )
+            for doc in self.corpus_store.iter_documents(corpus_id)
+        ]
+
+    @staticmethod
+    def _to_evidence(results: list[SearchResult]) -> list[dict[str, Any]]:
+        """Convert search results to evidence dictionaries."""
+        return [
+            {
+                "document_id": result.doc_id,
+                "chunk_id": result.chunk_id,
+                "score": result.score,
+                "excerpt": result.excerpt,
+                "metadata": result.metadata,
+            }
+            for result in results
+        ]
+
     def _run_graph_queries(
         self,
         question: str,
@@ -305,23 +422,22 @@ class PersonaRuntime:
 
         return evidence
 
-    def _deduplicate_evidence(self, evidence: list[dict]) -> list[dict]:
-        """Deduplicate evidence by chunk_id.
+    def _merge_evidence(
+        self, evidence_by_chunk: dict[str, dict[str, Any]], evidence: list[dict]
+    ) -> None:
+        """Merge evidence into a chunk_id-keyed map, keeping the highest score.
 
         Args:
-            evidence: List of evidence dicts
-
-        Returns:
-            Deduplicated list
+            evidence_by_chunk: Map of chunk_id to best evidence so far, updated in place
+            evidence: List of evidence dicts to merge
         """
-        seen = set()
-        result = []
         for ev in evidence:
             chunk_id = ev.get("chunk_id")
-            if chunk_id and chunk_id not in seen:
-                seen.add(chunk_id)
-                result.append(ev)
-        return result
+            if not chunk_id:
+                continue
+            current = evidence_by_chunk.get(chunk_id)
+            if current is None or ev["score"] > current["score"]:
+                evidence_by_chunk[chunk_id] = ev
 
     def _deduplicate_graph_evidence(self, evidence: list[dict]) -> list[dict]:
         """Deduplicate graph evidence by node/edge ID.
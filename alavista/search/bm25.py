@@ -5,10 +5,17 @@ BM25 is a probabilistic ranking function used for information retrieval.
 This module provides an in-memory BM25 index builder and search functionality.
 """
 
-import math
-from collections import Counter, defaultdict
+from __future__ import annotations
+
+import json
+from array import array
+from collections import Counter
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from alavista.core.ranking import top_k_indices
 from alavista.search.tokenizer import tokenize
 
 
@@ -17,6 +24,16 @@ class BM25Index:
     BM25 index for keyword-based search.
 
     Builds an inverted index from documents and scores queries using BM25 algorithm.
+    Postings form a sparse term-by-document matrix in compressed sparse column
+    layout: term `t`'s postings are `_indices[_indptr[t]:_indptr[t + 1]]`
+    (document positions), with raw term frequencies in `_tfs` and precomputed
+    BM25 term scores in `_data`. A query sums the score columns of its terms
+    in a single `np.bincount`.
+
+    Documents can also be added or removed one at a time. Updates only tokenize
+    the changed document; since IDF and average length depend on the whole
+    corpus, term scores are recomputed from the stored term frequencies on the
+    next search.
     """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75, remove_stopwords: bool = False):
@@ -35,11 +52,38 @@ class BM25Index:
         # Index structures
         self.doc_count = 0
         self.avg_doc_length = 0.0
-        self.doc_lengths: dict[str, int] = {}
-        self.doc_term_freqs: dict[str, Counter[str]] = {}
-        self.inverted_index: dict[str, set[str]] = defaultdict(set)
-        self.idf_cache: dict[str, float] = {}
+        # Document ID per index position; None marks a removed document
+        self.doc_ids: list[str | None] = []
         self.documents: dict[str, dict[str, Any]] = {}
+        self._doc_positions: dict[str, int] = {}
+        # Token counts of refreshed documents, by position, and of those added since
+        self._doc_lengths = np.empty(0, dtype=np.int32)
+        self._pending_lengths = array("i")
+        # Term -> column of the postings matrix, and column -> term
+        self._vocab: dict[str, int] = {}
+        self._terms: list[str] = []
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._tfs = np.empty(0, dtype=np.int32)
+        self._data = np.empty(0, dtype=np.float32)
+        # IDF per postings column (0 for terms no longer in any document)
+        self._idf = np.empty(0, dtype=np.float64)
+        # Postings of documents added since the last refresh as parallel
+        # (term ID, position, tf) C int arrays, read into NumPy without conversion;
+        # their terms are already in the vocabulary
+        self._pending_term_ids = array("i")
+        self._pending_positions = array("i")
+        self._pending_tfs = array("i")
+        # Positions of documents removed since the last refresh
+        self._removed: list[int] = []
+        self._stale = False
+
+    @property
+    def idf_cache(self) -> dict[str, float]:
+        """IDF of each indexed term, built on access from the per-column IDF array."""
+        self._refresh()
+        present = np.flatnonzero(np.diff(self._indptr))
+        return dict(zip([self._terms[i] for i in present], self._idf[present].tolist(), strict=True))
 
     def build(self, documents: list[dict[str, Any]]) -> None:
         """
@@ -50,6 +94,9 @@ class BM25Index:
         - 'text': text content to index
         - any other fields to store as document metadata
 
+        If an ID appears more than once, the last document with that ID wins,
+        as if it had been added with add_document.
+
         Args:
             documents: List of document dictionaries
         """
@@ -59,87 +106,171 @@ class BM25Index:
         # Clear existing index
         self._clear()
 
-        # Index each document
-        total_length = 0
-        for doc in documents:
-            doc_id = doc['id']
-            text = doc['text']
-
-            # Tokenize
-            tokens = tokenize(text, lowercase=True, remove_stopwords=self.remove_stopwords)
-
-            # Store document
-            self.documents[doc_id] = doc
-
-            # Compute term frequencies
-            term_freqs = Counter(tokens)
-            self.doc_term_freqs[doc_id] = term_freqs
-
-            # Track document length
-            doc_length = len(tokens)
-            self.doc_lengths[doc_id] = doc_length
-            total_length += doc_length
-
-            # Update inverted index
-            for term in term_freqs:
-                self.inverted_index[term].add(doc_id)
-
-        # Compute average document length
-        self.doc_count = len(documents)
-        self.avg_doc_length = total_length / self.doc_count if self.doc_count > 0 else 0.0
-
-        # Pre-compute IDF values
-        self._compute_idf()
+        for doc in {doc['id']: doc for doc in documents}.values():
+            self._append(doc)
+        self._refresh()
 
-    def _clear(self) -> None:
-        """Clear the index."""
-        self.doc_count = 0
-        self.avg_doc_length = 0.0
-        self.doc_lengths.clear()
-        self.doc_term_freqs.clear()
-        self.inverted_index.clear()
-        self.idf_cache.clear()
-        self.documents.clear()
+    def add_document(self, doc: dict[str, Any]) -> None:
+        """
+        Add a document to the index, replacing any document with the same ID.
 
-    def _compute_idf(self) -> None:
-        """Compute IDF values for all terms in the index."""
-        for term, doc_set in self.inverted_index.items():
-            df = len(doc_set)  # document frequency
-            # IDF formula: log((N - df + 0.5) / (df + 0.5) + 1)
-            idf = math.log((self.doc_count - df + 0.5) / (df + 0.5) + 1.0)
-            self.idf_cache[term] = idf
+        Args:
+            doc: Document dictionary with 'id' and 'text'
+        """
+        self.remove_document(doc['id'])
+        self._append(doc)
 
-    def _score_document(self, doc_id: str, query_terms: list[str]) -> float:
+    def remove_document(self, doc_id: str) -> bool:
         """
-        Compute BM25 score for a document given query terms.
+        Remove a document from the index.
+
+        Its postings are purged on the next refresh.
 
         Args:
             doc_id: Document ID
-            query_terms: List of query terms
 
         Returns:
-            BM25 score
+            True if the document was indexed, False otherwise
         """
-        score = 0.0
-        doc_length = self.doc_lengths[doc_id]
-        term_freqs = self.doc_term_freqs[doc_id]
-
-        # Compute normalized document length
-        norm_doc_length = doc_length / self.avg_doc_length if self.avg_doc_length > 0 else 0.0
-
-        for term in query_terms:
-            if term not in self.idf_cache:
-                continue
+        position = self._doc_positions.pop(doc_id, None)
+        if position is None:
+            return False
+        del self.documents[doc_id]
+        self.doc_ids[position] = None
+        self._removed.append(position)
+        self._stale = True
+        return True
+
+    def _append(self, doc: dict[str, Any]) -> None:
+        """Tokenize a document and queue its postings for the next refresh."""
+        doc_id = doc['id']
+
+        # Tokenize
+        tokens = tokenize(doc['text'], lowercase=True, remove_stopwords=self.remove_stopwords)
+
+        # Store document
+        position = len(self.doc_ids)
+        self.documents[doc_id] = doc
+        self.doc_ids.append(doc_id)
+        self._doc_positions[doc_id] = position
+        self._pending_lengths.append(len(tokens))
+
+        counts = Counter(tokens)
+        vocab = self._vocab
+        for term in counts:
+            if term not in vocab:
+                vocab[term] = len(self._terms)
+                self._terms.append(term)
+        self._pending_term_ids.fromlist([vocab[term] for term in counts])
+        self._pending_positions.fromlist([position] * len(counts))
+        self._pending_tfs.fromlist(list(counts.values()))
+        self._stale = True
+
+    def _refresh(self) -> None:
+        """Fold pending additions and removals into the postings and rescore them."""
+        if not self._stale:
+            return
 
-            idf = self.idf_cache[term]
-            tf = term_freqs.get(term, 0)
+        # Expand the current postings to (term, position, tf) triples
+        old_columns = len(self._indptr) - 1
+        term_ids = np.repeat(np.arange(old_columns, dtype=np.int32), np.diff(self._indptr))
+        positions = np.asarray(self._indices)
+        tfs = np.asarray(self._tfs)
+
+        if self._pending_term_ids:
+            term_ids = np.concatenate(
+                (term_ids, np.frombuffer(self._pending_term_ids, dtype=np.intc))
+            )
+            positions = np.concatenate(
+                (positions, np.frombuffer(self._pending_positions, dtype=np.intc))
+            )
+            tfs = np.concatenate((tfs, np.frombuffer(self._pending_tfs, dtype=np.intc)))
+            self._pending_term_ids = array("i")
+            self._pending_positions = array("i")
+            self._pending_tfs = array("i")
+            # Group by term; stable, so each column keeps ascending positions
+            order = np.argsort(term_ids, kind="stable")
+            term_ids, positions, tfs = term_ids[order], positions[order], tfs[order]
+
+        doc_lengths = self._doc_lengths
+        if self._pending_lengths:
+            doc_lengths = np.concatenate(
+                (doc_lengths, np.frombuffer(self._pending_lengths, dtype=np.intc))
+            )
+            self._pending_lengths = array("i")
+
+        if self._removed:
+            # Drop removed documents' postings and renumber the remaining positions
+            live = np.ones(len(self.doc_ids), dtype=bool)
+            live[self._removed] = False
+            keep = live[positions]
+            term_ids, positions, tfs = term_ids[keep], positions[keep], tfs[keep]
+            positions = (np.cumsum(live, dtype=np.int32) - 1)[positions]
+            doc_lengths = doc_lengths[live]
+            self.doc_ids = [self.doc_ids[i] for i in np.flatnonzero(live).tolist()]
+            self._doc_positions = {doc_id: i for i, doc_id in enumerate(self.doc_ids)}
+            self._removed = []
+        self._doc_lengths = doc_lengths
+
+        doc_freqs = np.bincount(term_ids, minlength=len(self._terms))
+        self._indptr = np.zeros(len(self._terms) + 1, dtype=np.int64)
+        np.cumsum(doc_freqs, out=self._indptr[1:])
+        self._indices = positions
+        self._tfs = tfs
+        self._stale = False
 
-            # BM25 formula
-            numerator = tf * (self.k1 + 1)
-            denominator = tf + self.k1 * (1 - self.b + self.b * norm_doc_length)
-            score += idf * (numerator / denominator)
+        # Compute average document length
+        self.doc_count = len(self.doc_ids)
+        if self.doc_count == 0:
+            self.avg_doc_length = 0.0
+            self._idf = np.zeros(len(self._terms), dtype=np.float64)
+            self._data = np.empty(0, dtype=np.float32)
+            return
+        self.avg_doc_length = float(doc_lengths.sum()) / self.doc_count
+        if self.avg_doc_length > 0:
+            norm_doc_lengths = doc_lengths / self.avg_doc_length
+        else:
+            norm_doc_lengths = np.zeros(self.doc_count, dtype=np.float64)
+        length_norms = self.k1 * (1 - self.b + self.b * norm_doc_lengths)
+
+        self._idf = self._compute_idf(doc_freqs, self.doc_count)
+
+        # k1, b and document lengths are fixed until the next update, so each
+        # posting's BM25 term score (idf * saturated tf) is computed here, not per query
+        # Stored as float32 to halve the postings' memory; searches sum in float64
+        self._data = (
+            self._idf[term_ids] * (tfs * (self.k1 + 1) / (tfs + length_norms[positions]))
+        ).astype(np.float32)
+
+    @staticmethod
+    def _compute_idf(doc_freqs: np.ndarray, doc_count: int) -> np.ndarray:
+        """IDF per term; terms in no document get 0."""
+        # IDF formula: log((N - df + 0.5) / (df + 0.5) + 1)
+        idf = np.log((doc_count - doc_freqs + 0.5) / (doc_freqs + 0.5) + 1.0)
+        idf[doc_freqs == 0] = 0.0
+        return idf
 
-        return score
+    def _clear(self) -> None:
+        """Clear the index."""
+        self.doc_count = 0
+        self.avg_doc_length = 0.0
+        self.doc_ids = []
+        self.documents = {}
+        self._doc_positions = {}
+        self._doc_lengths = np.empty(0, dtype=np.int32)
+        self._pending_lengths = array("i")
+        self._vocab = {}
+        self._terms = []
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int32)
+        self._tfs = np.empty(0, dtype=np.int32)
+        self._data = np.empty(0, dtype=np.float32)
+        self._idf = np.empty(0, dtype=np.float64)
+        self._pending_term_ids = array("i")
+        self._pending_positions = array("i")
+        self._pending_tfs = array("i")
+        self._removed = []
+        self._stale = False
 
     def search(self, query: str, k: int = 20) -> list[tuple[str, float]]:
         """
@@ -152,34 +283,109 @@ class BM25Index:
         Returns:
             List of (doc_id, score) tuples, sorted by score descending
         """
-        if not query or self.doc_count == 0:
+        if not query:
             return []
 
         # Tokenize query
         query_terms = tokenize(query, lowercase=True, remove_stopwords=self.remove_stopwords)
 
-        if not query_terms:
+        # The vocabulary already covers pending additions, so a query with no
+        # indexed terms returns before any pending updates are folded in
+        columns = [self._vocab[term] for term in query_terms if term in self._vocab]
+        if not columns:
             return []
 
-        # Find candidate documents (documents containing at least one query term)
-        candidate_docs = set()
-        for term in query_terms:
-            if term in self.inverted_index:
-                candidate_docs.update(self.inverted_index[term])
+        # Apply any document additions or removals since the last search
+        self._refresh()
+        if self.doc_count == 0:
+            return []
 
-        if not candidate_docs:
+        # Gather the score columns of the query's indexed terms
+        indptr = self._indptr
+        slices = [slice(indptr[column], indptr[column + 1]) for column in columns]
+
+        # bincount sums each document's entries in query term order
+        scores = np.bincount(
+            np.concatenate([self._indices[s] for s in slices]),
+            weights=np.concatenate([self._data[s] for s in slices]),
+            minlength=self.doc_count,
+        )
+
+        # Sort by score descending (ties keep index order) and return top k
+        candidates = np.flatnonzero(scores > 0)
+        limit = min(max(k, 0), len(candidates))
+        if limit == 0:
             return []
+        ranked = top_k_indices(scores, candidates, limit)
+        return [(self.doc_ids[i], float(scores[i])) for i in ranked]
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the index next to `path`.
+
+        The postings matrix is written as `<path>.indptr.npy`,
+        `<path>.indices.npy`, `<path>.tfs.npy` and `<path>.scores.npy`, with
+        document lengths in `<path>.lengths.npy`; parameters, vocabulary and
+        document IDs go to `<path>.meta.json` and stored documents to
+        `<path>.documents.json`.
+
+        Args:
+            path: Base path for the index files
+        """
+        self._refresh()
+        np.save(f"{path}.indptr.npy", self._indptr)
+        np.save(f"{path}.indices.npy", self._indices)
+        np.save(f"{path}.tfs.npy", self._tfs)
+        np.save(f"{path}.scores.npy", self._data)
+        np.save(f"{path}.lengths.npy", self._doc_lengths)
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "remove_stopwords": self.remove_stopwords,
+            "doc_count": self.doc_count,
+            "avg_doc_length": self.avg_doc_length,
+            "doc_ids": self.doc_ids,
+            "terms": self._terms,
+        }
+        with Path(f"{path}.meta.json").open("w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        with Path(f"{path}.documents.json").open("w", encoding="utf-8") as f:
+            json.dump(self.documents, f, default=str)
+
+    @classmethod
+    def load(cls, path: Path) -> BM25Index:
+        """
+        Load an index written by `save` without re-tokenizing documents.
+
+        Posting arrays are memory-mapped read-only, so loading costs no
+        per-term work and pages are read on demand by searches. Later updates
+        build new arrays rather than writing to the mapped files.
 
-        # Score each candidate document
-        scores: list[tuple[str, float]] = []
-        for doc_id in candidate_docs:
-            score = self._score_document(doc_id, query_terms)
-            if score > 0:
-                scores.append((doc_id, score))
+        Args:
+            path: Base path the index was saved under
 
-        # Sort by score descending and return top k
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:k]
+        Returns:
+            BM25Index ready for search
+        """
+        with Path(f"{path}.meta.json").open("r", encoding="utf-8") as f:
+            meta = json.load(f)
+        index = cls(k1=meta["k1"], b=meta["b"], remove_stopwords=meta["remove_stopwords"])
+        index.doc_count = meta["doc_count"]
+        index.avg_doc_length = meta["avg_doc_length"]
+        index.doc_ids = meta["doc_ids"]
+        index._terms = meta["terms"]
+        index._vocab = {term: i for i, term in enumerate(index._terms)}
+        with Path(f"{path}.documents.json").open("r", encoding="utf-8") as f:
+            index.documents = json.load(f)
+        index._doc_positions = {doc_id: i for i, doc_id in enumerate(index.doc_ids)}
+        index._doc_lengths = np.load(f"{path}.lengths.npy")
+
+        index._indptr = np.load(f"{path}.indptr.npy")
+        index._idf = cls._compute_idf(np.diff(index._indptr), index.doc_count)
+        index._indices = np.load(f"{path}.indices.npy", mmap_mode="r")
+        index._tfs = np.load(f"{path}.tfs.npy", mmap_mode="r")
+        index._data = np.load(f"{path}.scores.npy", mmap_mode="r")
+        return index
 
     def get_document(self, doc_id: str) -> dict[str, Any] | None:
         """
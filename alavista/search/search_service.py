@@ -8,10 +8,13 @@ vector and hybrid search for Phase 3.3.
 import asyncio
 from typing import Protocol
 
+import blake3
+import numpy as np
+
 from alavista.core.models import Chunk, SearchResult
 from alavista.vector import VectorHit, VectorSearchService
 from alavista.search.bm25 import BM25Index
-from alavista.core.embeddings import get_default_embedding_service
+from alavista.core.embeddings import CachingEmbeddingService, get_default_embedding_service
 
 
 class CorpusStoreProtocol(Protocol):
@@ -49,17 +52,20 @@ class SearchService:
             b: BM25 b parameter (length normalization)
             remove_stopwords: Whether to remove stopwords during indexing
             vector_search_service: Optional vector backend
-            embedding_service: Optional embedding backend for query embeddings
+            embedding_service: Optional embedding backend for query embeddings;
+                wrapped in a CachingEmbeddingService so repeated queries skip the backend
         """
         self.corpus_store = corpus_store
         self.k1 = k1
         self.b = b
         self.remove_stopwords = remove_stopwords
         self.vector_search_service = vector_search_service
-        self.embedding_service = embedding_service
+        self.embedding_service = (
+            CachingEmbeddingService(embedding_service) if embedding_service is not None else None
+        )
 
-        # Cache of indices by corpus_id
-        self._indices: dict[str, BM25Index] = {}
+        # Cache of indices by corpus_id, with the fingerprint of the chunks each was built from
+        self._indices: dict[str, tuple[bytes, BM25Index]] = {}
 
     def _build_index_for_corpus(self, corpus_id: str, chunks: list[Chunk]) -> BM25Index:
         """
@@ -95,6 +101,12 @@ class SearchService:
         """
         Get cached index or build a new one.
 
+        The cached index is reused while the chunks passed in have the same IDs,
+        parents, offsets and text lengths as the ones it was built from, and
+        rebuilt when they differ. Stored chunks never change text under the same
+        ID (documents are keyed by content hash); callers that edit chunk text in
+        place without changing its length must call invalidate_cache.
+
         Args:
             corpus_id: Corpus ID
             chunks: List of chunks (used if index needs to be built)
@@ -102,9 +114,13 @@ class SearchService:
         Returns:
             BM25Index instance
         """
-        if corpus_id not in self._indices:
-            self._indices[corpus_id] = self._build_index_for_corpus(corpus_id, chunks)
-        return self._indices[corpus_id]
+        fingerprint = _fingerprint_chunks(chunks)
+        cached = self._indices.get(corpus_id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        index = self._build_index_for_corpus(corpus_id, chunks)
+        self._indices[corpus_id] = (fingerprint, index)
+        return index
 
     def invalidate_cache(self, corpus_id: str | None = None) -> None:
         """
@@ -138,38 +154,84 @@ class SearchService:
         if corpus is None:
             raise ValueError(f"Corpus {corpus_id} not found")
 
-        if not chunks:
+        # Nothing can match, so skip building or fingerprinting the index
+        if not chunks or not query:
             return []
 
         # Get or build index
         index = self._get_or_build_index(corpus_id, chunks)
 
         # Search
-        results = index.search(query, k=k)
+        return self._format_bm25_hits(index, index.search(query, k=k), excerpt_length)
+
+    def search_bm25_batch(self, corpus_id: str, chunks: list[Chunk], queries: list[str],
+                          k: int = 20, excerpt_length: int = 200) -> list[list[SearchResult]]:
+        """
+        Search a corpus with several queries using BM25 scoring.
+
+        The corpus is validated and its index fetched (or built) once for the
+        whole batch rather than once per query.
+
+        Args:
+            corpus_id: ID of the corpus to search
+            chunks: List of Chunk objects to search over
+            queries: Search query strings
+            k: Maximum number of results to return per query (default: 20)
+            excerpt_length: Maximum length of excerpt to include (default: 200)
+
+        Returns:
+            One list of SearchResult objects per query, each sorted by relevance score
+        """
+        # Validate corpus exists
+        corpus = self.corpus_store.get_corpus(corpus_id)
+        if corpus is None:
+            raise ValueError(f"Corpus {corpus_id} not found")
+
+        if not chunks:
+            return [[] for _ in queries]
+
+        index = self._get_or_build_index(corpus_id, chunks)
+        return [
+            self._format_bm25_hits(index, index.search(query, k=k), excerpt_length)
+            for query in queries
+        ]
 
-        # Format results
+    def _format_bm25_hits(self, index: BM25Index, results: list[tuple[str, float]],
+                          excerpt_length: int) -> list[SearchResult]:
+        """
+        Convert BM25 (chunk ID, score) hits into SearchResult objects.
+
+        Args:
+            index: Index the hits came from
+            results: (chunk ID, score) tuples from the index
+            excerpt_length: Maximum length of excerpt to include
+
+        Returns:
+            List of SearchResult objects in hit order
+        """
+        # Bind the lookups once; this loop runs for every hit of every query
+        documents = index.documents
+        construct = SearchResult.model_construct
         search_results = []
         for doc_id, score in results:
-            doc = index.get_document(doc_id)
+            doc = documents.get(doc_id)
             if doc is None:
                 continue
 
             # Create excerpt (truncate if needed)
             text = doc['text']
-            if len(text) > excerpt_length:
-                excerpt = text[:excerpt_length] + "..."
-            else:
-                excerpt = text
-
-            # Build SearchResult
-            search_result = SearchResult(
-                doc_id=doc['document_id'],
-                chunk_id=doc['id'],
-                score=score,
-                excerpt=excerpt,
-                metadata=doc['metadata']
+            excerpt = text[:excerpt_length] + "..." if len(text) > excerpt_length else text
+
+            # Build SearchResult; fields come from indexed chunks, so validation is skipped
+            search_results.append(
+                construct(
+                    doc_id=doc['document_id'],
+                    chunk_id=doc_id,
+                    score=score,
+                    excerpt=excerpt,
+                    metadata=dict(doc['metadata']),
+                )
             )
-            search_results.append(search_result)
 
         return search_results
 
@@ -224,6 +286,9 @@ class SearchService:
     ) -> list[SearchResult]:
         """Run vector-only search."""
         query_vec = self._embed_query(query)[0]
+        # A zero vector has no direction to rank by
+        if not any(query_vec):
+            return []
         hits = self._run_coro(self.vector_search_service.search(corpus_id, query_vec, k=k))
         results: list[SearchResult] = []
         for hit in hits:
@@ -232,13 +297,14 @@ class SearchService:
                 continue
             text = chunk.text
             excerpt = text[:excerpt_length] + ("..." if len(text) > excerpt_length else "")
+            # Fields come from indexed chunks and hits, so validation is skipped
             results.append(
-                SearchResult(
+                SearchResult.model_construct(
                     doc_id=hit.document_id,
                     chunk_id=hit.chunk_id,
-                    score=hit.score,
+                    score=float(hit.score),
                     excerpt=excerpt,
-                    metadata=chunk.metadata,
+                    metadata=dict(chunk.metadata),
                 )
             )
         return results
@@ -251,58 +317,46 @@ class SearchService:
         w_vector: float,
     ) -> list[SearchResult]:
         """Combine BM25 and vector hits with normalized scores."""
-        bm25_norm = self._normalize_hits(bm25_hits)
-        vector_norm = self._normalize_hits(vector_hits)
-
-        combined: dict[tuple[str, str], float] = {}
-        keys = set(bm25_norm.keys()) | set(vector_norm.keys())
-        for key in keys:
-            score = 0.0
-            if key in bm25_norm:
-                score += w_bm25 * bm25_norm[key]
-            if key in vector_norm:
-                score += w_vector * vector_norm[key]
-            combined[key] = score
-
-        # Produce SearchResult objects using whichever hit object is available
-        hit_lookup: dict[tuple[str, str], SearchResult] = {}
+        # One row per distinct (doc_id, chunk_id), backed by the first hit seen for it
+        rows: dict[tuple[str, str], int] = {}
+        base_hits: list[SearchResult] = []
         for hit in bm25_hits + vector_hits:
             key = (hit.doc_id, hit.chunk_id)
-            if key not in hit_lookup:
-                hit_lookup[key] = hit
+            if key not in rows:
+                rows[key] = len(base_hits)
+                base_hits.append(hit)
+        if not base_hits:
+            return []
 
-        results = []
-        for key, score in combined.items():
-            base_hit = hit_lookup.get(key)
-            if not base_hit:
-                continue
-            results.append(
-                SearchResult(
-                    doc_id=base_hit.doc_id,
-                    chunk_id=base_hit.chunk_id,
-                    score=score,
-                    excerpt=base_hit.excerpt,
-                    metadata=base_hit.metadata,
-                )
-            )
+        combined = np.zeros(len(base_hits), dtype=np.float64)
+        for hits, weight in ((bm25_hits, w_bm25), (vector_hits, w_vector)):
+            if hits:
+                hit_rows = [rows[(hit.doc_id, hit.chunk_id)] for hit in hits]
+                combined[hit_rows] += weight * self._normalize_scores(hits)
 
         # Deterministic tie-breaking by doc_id/chunk_id
-        results.sort(key=lambda r: (-r.score, r.doc_id, r.chunk_id))
-        return results
-
-    def _normalize_hits(self, hits: list[SearchResult]) -> dict[tuple[str, str], float]:
-        if not hits:
-            return {}
-        scores = [h.score for h in hits]
-        max_s = max(scores)
-        min_s = min(scores)
-        if max_s == min_s:
-            return {(h.doc_id, h.chunk_id): 1.0 for h in hits}
-        return {(h.doc_id, h.chunk_id): (h.score - min_s) / (max_s - min_s) for h in hits}
+        order = np.lexsort((
+            np.array([hit.chunk_id for hit in base_hits]),
+            np.array([hit.doc_id for hit in base_hits]),
+            -combined,
+        ))
+        return [
+            base_hits[i].model_copy(update={"score": score})
+            for i, score in zip(order.tolist(), combined[order].tolist(), strict=True)
+        ]
+
+    def _normalize_scores(self, hits: list[SearchResult]) -> np.ndarray:
+        """Min-max normalize hit scores to [0, 1]; all-equal scores map to 1."""
+        scores = np.array([hit.score for hit in hits], dtype=np.float64)
+        min_s = scores.min()
+        spread = scores.max() - min_s
+        if spread == 0:
+            return np.ones_like(scores)
+        return (scores - min_s) / spread
 
     def _embed_query(self, query: str) -> list[list[float]]:
         if self.embedding_service is None:
-            self.embedding_service = get_default_embedding_service()
+            self.embedding_service = CachingEmbeddingService(get_default_embedding_service())
         return self._run_coro(self.embedding_service.embed_texts([query]))
 
     def _run_coro(self, coro):
@@ -311,3 +365,17 @@ class SearchService:
             return asyncio.run_coroutine_threadsafe(coro, loop).result()
         except RuntimeError:
             return asyncio.run(coro)
+
+
+def _fingerprint_chunks(chunks: list[Chunk]) -> bytes:
+    """
+    Digest of the chunks' IDs, parent document IDs, offsets and text lengths, in order.
+
+    The text itself is not hashed, so a cache hit costs O(number of chunks)
+    rather than O(corpus text).
+    """
+    joined = "\0".join(
+        f"{chunk.id}\0{chunk.document_id}\0{chunk.start_offset}:{chunk.end_offset}:{len(chunk.text)}"
+        for chunk in chunks
+    )
+    return blake3.blake3(joined.encode("utf-8")).digest()
@@ -6,7 +6,7 @@ Provides simple tokenization for BM25 indexing and search.
 
 import re
 import unicodedata
-from collections.abc import Sequence
+from collections.abc import Sequence, Set
 
 # Common English stopwords (minimal set for MVP)
 DEFAULT_STOPWORDS = frozenset([
@@ -15,6 +15,16 @@ DEFAULT_STOPWORDS = frozenset([
     "to", "was", "will", "with"
 ])
 
+# Alphanumeric sequences (including numbers); compiled once for all calls
+_TOKEN_RE = re.compile(r"\w+")
+
+# Byte table mapping every ASCII non-word character (anything \w does not
+# match) to a space, for splitting ASCII text without the regex engine
+_ASCII_NON_WORD_TO_SPACE = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) == "_") else ord(" ")
+    for c in range(256)
+)
+
 
 def normalize_unicode(text: str) -> str:
     """
@@ -30,7 +40,7 @@ def normalize_unicode(text: str) -> str:
 
 
 def tokenize(text: str, lowercase: bool = True, remove_stopwords: bool = False,
-             stopwords: Sequence[str] | None = None) -> list[str]:
+             stopwords: Sequence[str] | Set[str] | None = None) -> list[str]:
     """
     Tokenize text into words.
 
@@ -41,7 +51,8 @@ def tokenize(text: str, lowercase: bool = True, remove_stopwords: bool = False,
         text: Input text to tokenize
         lowercase: Whether to convert tokens to lowercase (default: True)
         remove_stopwords: Whether to filter out stopwords (default: False)
-        stopwords: Custom stopword list (default: uses DEFAULT_STOPWORDS)
+        stopwords: Custom stopword list (default: uses DEFAULT_STOPWORDS);
+            sets and frozensets are used as-is without copying
 
     Returns:
         List of tokens
@@ -61,11 +72,20 @@ def tokenize(text: str, lowercase: bool = True, remove_stopwords: bool = False,
 
     # Split on whitespace and punctuation
     # Keep alphanumeric sequences, including numbers
-    tokens = re.findall(r'\w+', text)
+    if text.isascii():
+        # Same tokens as the regex: blank out non-word bytes, then split
+        tokens = text.encode("ascii").translate(_ASCII_NON_WORD_TO_SPACE).decode("ascii").split()
+    else:
+        tokens = _TOKEN_RE.findall(text)
 
     # Remove stopwords if requested
     if remove_stopwords:
-        stop_set = set(stopwords) if stopwords else DEFAULT_STOPWORDS
+        if not stopwords:
+            stop_set = DEFAULT_STOPWORDS
+        elif isinstance(stopwords, Set):
+            stop_set = stopwords
+        else:
+            stop_set = frozenset(stopwords)
         tokens = [t for t in tokens if t not in stop_set]
 
     return tokens
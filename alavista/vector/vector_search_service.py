@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from json import load as json_load, dump as json_dump
-from math import sqrt
+from json import dump as json_dump, dumps as json_dumps, load as json_load, loads as json_loads
 from pathlib import Path
-from typing import List, Protocol, Tuple
+from typing import List, Literal, Protocol
 
 import numpy as np
 from pydantic import BaseModel
 
+from alavista.core.ranking import top_k_indices
+
 try:
     import faiss  # type: ignore
 
@@ -18,6 +21,19 @@ except Exception:  # pragma: no cover - exercised by alt backend selection
     _HAS_FAISS = False
 
 
+# Bits per product-quantizer code for ivfpq indexes
+_PQ_NBITS = 8
+
+# Rows decoded per block when scoring quantized in-memory matrices
+_SCORE_BLOCK_ROWS = 4096
+
+# Memory-mapped vector files grow in whole multiples of this many bytes
+_MMAP_GROWTH_BYTES = 2 << 20
+
+VectorQuantization = Literal["none", "float16", "int8"]
+_QUANTIZED_DTYPES = {"none": np.float32, "float16": np.float16, "int8": np.int8}
+
+
 class VectorSearchError(Exception):
     """Raised when vector search operations fail."""
 
@@ -32,7 +48,7 @@ class VectorSearchService(Protocol):
     async def index_embeddings(
         self,
         corpus_id: str,
-        items: List[Tuple[str, str, List[float]]],  # (document_id, chunk_id, vector)
+        items: List[tuple[str, str, List[float]]],  # (document_id, chunk_id, vector)
     ) -> None:
         ...
 
@@ -42,10 +58,143 @@ class VectorSearchService(Protocol):
 
 @dataclass
 class _CorpusIndex:
+    """
+    Per-corpus index stored as parallel arrays (structure of arrays).
+
+    Row i of the matrix belongs to document_ids[i] / chunk_ids[i]. All arrays
+    grow by doubling; only the first `size` rows are populated. With int8
+    quantization each row also carries a float32 scale in `row_scales`.
+
+    When `path` is set, the matrix and row scales are memory-mapped from
+    `<path>.vectors` / `<path>.scales` and the keys are appended to
+    `<path>.keys.jsonl`, so the corpus can be reopened without re-embedding.
+    """
+
     dim: int
-    vectors: List[List[float]] = field(default_factory=list)
-    keys: List[Tuple[str, str]] = field(default_factory=list)
-    key_index: dict[Tuple[str, str], int] = field(default_factory=dict)
+    quantization: VectorQuantization = "none"
+    path: Path | None = None
+    size: int = 0
+    key_index: dict[tuple[str, str], int] = field(default_factory=dict)
+    matrix: np.ndarray = field(init=False)
+    row_scales: np.ndarray = field(init=False)
+    document_ids: np.ndarray = field(init=False)
+    chunk_ids: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.matrix = np.empty((0, self.dim), dtype=_QUANTIZED_DTYPES[self.quantization])
+        self.row_scales = np.empty(0, dtype=np.float32)
+        self.document_ids = np.empty(0, dtype=object)
+        self.chunk_ids = np.empty(0, dtype=object)
+
+    @classmethod
+    def open(cls, path: Path) -> _CorpusIndex:
+        """Reopen a corpus persisted under `path` (see the class docstring)."""
+        with Path(f"{path}.meta.json").open("r", encoding="utf-8") as f:
+            meta = json_load(f)
+        index = cls(dim=int(meta["dim"]), quantization=meta["quantization"], path=path)
+
+        keys_path = Path(f"{path}.keys.jsonl")
+        with keys_path.open("r", encoding="utf-8") as f:
+            keys = [tuple(json_loads(line)) for line in f if line.strip()]
+        # Vectors are flushed before their keys are appended, so the keys file
+        # decides how many rows are valid.
+        index.size = len(keys)
+        index.key_index = {key: i for i, key in enumerate(keys)}
+
+        row_bytes = index.dim * index.matrix.itemsize
+        capacity = Path(f"{path}.vectors").stat().st_size // row_bytes
+        if capacity:
+            index.matrix = index._map(".vectors", index.matrix.dtype, (capacity, index.dim))
+            if index.quantization == "int8":
+                index.row_scales = index._map(".scales", np.float32, (capacity,))
+        index.document_ids = np.empty(capacity, dtype=object)
+        index.chunk_ids = np.empty(capacity, dtype=object)
+        for i, (document_id, chunk_id) in enumerate(keys):
+            index.document_ids[i] = document_id
+            index.chunk_ids[i] = chunk_id
+        return index
+
+    def create_files(self) -> None:
+        """Write the metadata and empty data files for a new persisted corpus."""
+        with Path(f"{self.path}.meta.json").open("w", encoding="utf-8") as f:
+            json_dump({"dim": self.dim, "quantization": self.quantization}, f)
+        for suffix in (".vectors", ".keys.jsonl"):
+            Path(f"{self.path}{suffix}").write_bytes(b"")
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self.matrix[: self.size]
+
+    def append(self, keys: List[tuple[str, str]], rows: np.ndarray) -> None:
+        size = self.size
+        needed = size + rows.shape[0]
+        if needed > self.matrix.shape[0]:
+            capacity = max(needed, 2 * self.matrix.shape[0], 16)
+            if self.path is not None:
+                # Round the file up to the growth granularity to amortize remaps
+                row_bytes = self.dim * self.matrix.itemsize
+                file_bytes = -(-capacity * row_bytes // _MMAP_GROWTH_BYTES) * _MMAP_GROWTH_BYTES
+                capacity = file_bytes // row_bytes
+                self.matrix = self._map(".vectors", self.matrix.dtype, (capacity, self.dim))
+                if self.quantization == "int8":
+                    self.row_scales = self._map(".scales", np.float32, (capacity,))
+            else:
+                self.matrix = self._grow(self.matrix, (capacity, self.dim))
+                if self.quantization == "int8":
+                    self.row_scales = self._grow(self.row_scales, (capacity,))
+            self.document_ids = self._grow(self.document_ids, (capacity,))
+            self.chunk_ids = self._grow(self.chunk_ids, (capacity,))
+
+        if self.quantization == "int8":
+            scales = np.abs(rows).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self.matrix[size:needed] = np.rint(rows / scales[:, None])
+            self.row_scales[size:needed] = scales
+        else:
+            self.matrix[size:needed] = rows
+
+        for offset, (document_id, chunk_id) in enumerate(keys):
+            self.document_ids[size + offset] = document_id
+            self.chunk_ids[size + offset] = chunk_id
+            self.key_index[(document_id, chunk_id)] = size + offset
+
+        if self.path is not None:
+            if isinstance(self.matrix, np.memmap):
+                self.matrix.flush()
+            if isinstance(self.row_scales, np.memmap):
+                self.row_scales.flush()
+            with Path(f"{self.path}.keys.jsonl").open("a", encoding="utf-8") as f:
+                f.writelines(json_dumps(list(key)) + "\n" for key in keys)
+        self.size = needed
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Inner products of every stored row with a float32 query vector."""
+        if self.quantization == "none":
+            return self.vectors @ query
+
+        # Decode quantized rows block by block so only a bounded float32
+        # working set is materialized per query.
+        scores = np.empty(self.size, dtype=np.float32)
+        for start in range(0, self.size, _SCORE_BLOCK_ROWS):
+            stop = min(start + _SCORE_BLOCK_ROWS, self.size)
+            scores[start:stop] = self.matrix[start:stop].astype(np.float32) @ query
+        if self.quantization == "int8":
+            scores *= self.row_scales[: self.size]
+        return scores
+
+    def _grow(self, array: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+        grown = np.empty(shape, dtype=array.dtype)
+        grown[: self.size] = array[: self.size]
+        return grown
+
+    def _map(self, suffix: str, dtype: np.dtype, shape: tuple[int, ...]) -> np.memmap:
+        """Map `<path><suffix>`, extending the file to hold `shape` if needed."""
+        file_path = Path(f"{self.path}{suffix}")
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        with file_path.open("ab") as f:
+            if f.tell() < nbytes:
+                f.truncate(nbytes)
+        return np.memmap(file_path, dtype=dtype, mode="r+", shape=shape)
 
 
 @dataclass
@@ -56,18 +205,27 @@ class InMemoryVectorSearchService:
     This follows the roadmap for Phase 3.2 by providing:
     - per-corpus vector storage
     - optional L2 normalization for cosine similarity
-    - kNN search with inner product scoring
+    - kNN search with inner product scoring over a contiguous float32 matrix
+    - optional float16 or int8 (per-row scale) storage to cut memory per vector
+    - optional persistence under `root_dir`, one memory-mapped vector file per
+      corpus that grows in place and is reopened lazily on first use
     """
 
     normalize: bool = True
+    quantization: VectorQuantization = "none"
+    root_dir: Path | None = None
 
     def __post_init__(self) -> None:
+        if self.quantization not in _QUANTIZED_DTYPES:
+            raise VectorSearchError(f"unsupported vector quantization: {self.quantization}")
+        if self.root_dir is not None:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
         self._corpora: dict[str, _CorpusIndex] = {}
 
     async def index_embeddings(
         self,
         corpus_id: str,
-        items: List[Tuple[str, str, List[float]]],
+        items: List[tuple[str, str, List[float]]],
     ) -> None:
         if items is None:
             raise VectorSearchError("items cannot be None")
@@ -79,18 +237,25 @@ class InMemoryVectorSearchService:
             raise VectorSearchError("embedding vectors cannot be empty")
         dim = len(first_vector)
 
-        corpus_idx = self._corpora.get(corpus_id)
+        corpus_idx = self._load_corpus_if_exists(corpus_id)
         if corpus_idx is None:
-            corpus_idx = _CorpusIndex(dim=dim)
+            path = self.root_dir / corpus_id if self.root_dir is not None else None
+            corpus_idx = _CorpusIndex(dim=dim, quantization=self.quantization, path=path)
+            if path is not None:
+                corpus_idx.create_files()
             self._corpora[corpus_id] = corpus_idx
         elif corpus_idx.dim != dim:
             raise VectorSearchError(
                 f"dimension mismatch for corpus {corpus_id}: expected {corpus_idx.dim}, got {dim}"
             )
 
+        # Validate the whole batch before touching the index so a bad item
+        # cannot leave it partially updated.
+        new_keys: list[tuple[str, str]] = []
+        pending: set[tuple[str, str]] = set()
         for document_id, chunk_id, vector in items:
             key = (document_id, chunk_id)
-            if key in corpus_idx.key_index:
+            if key in corpus_idx.key_index or key in pending:
                 raise VectorSearchError(
                     f"duplicate embedding for corpus={corpus_id} document_id={document_id} chunk_id={chunk_id}"
                 )
@@ -98,14 +263,18 @@ class InMemoryVectorSearchService:
                 raise VectorSearchError(
                     f"embedding dimension mismatch: expected {corpus_idx.dim}, got {len(vector)}"
                 )
-            processed = self._normalize(vector) if self.normalize else vector
-            corpus_idx.vectors.append(processed)
-            corpus_idx.keys.append(key)
-            corpus_idx.key_index[key] = len(corpus_idx.vectors) - 1
+            pending.add(key)
+            new_keys.append(key)
+
+        rows = np.asarray([item[2] for item in items], dtype=np.float32)
+        if self.normalize:
+            rows = self._normalize_rows(rows)
+
+        corpus_idx.append(new_keys, rows)
 
     async def search(self, corpus_id: str, query_vector: List[float], k: int = 20) -> List[VectorHit]:
-        corpus_idx = self._corpora.get(corpus_id)
-        if corpus_idx is None or not corpus_idx.vectors:
+        corpus_idx = self._load_corpus_if_exists(corpus_id)
+        if corpus_idx is None or not corpus_idx.size:
             return []
 
         if len(query_vector) != corpus_idx.dim:
@@ -113,40 +282,58 @@ class InMemoryVectorSearchService:
                 f"query vector dimension mismatch: expected {corpus_idx.dim}, got {len(query_vector)}"
             )
 
-        processed_query = self._normalize(query_vector) if self.normalize else query_vector
+        query = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        if self.normalize:
+            query = self._normalize_rows(query)
 
-        scores: list[tuple[int, float]] = []
-        for idx, vec in enumerate(corpus_idx.vectors):
-            score = self._dot(processed_query, vec)
-            scores.append((idx, score))
+        scores = corpus_idx.scores(query[0])
 
-        scores.sort(key=lambda item: item[1], reverse=True)
+        limit = min(max(k, 0), scores.shape[0])
+        if limit == 0:
+            return []
+        # Ties keep insertion order
+        top = top_k_indices(scores, np.arange(scores.shape[0]), limit)
+
+        return [
+            VectorHit(document_id=document_id, chunk_id=chunk_id, score=score)
+            for document_id, chunk_id, score in zip(
+                corpus_idx.document_ids[top],
+                corpus_idx.chunk_ids[top],
+                scores[top].tolist(),
+                strict=True,
+            )
+        ]
 
-        limit = min(max(k, 0), len(scores))
-        results: list[VectorHit] = []
-        for idx, score in scores[:limit]:
-            document_id, chunk_id = corpus_idx.keys[idx]
-            results.append(VectorHit(document_id=document_id, chunk_id=chunk_id, score=score))
-        return results
+    def _load_corpus_if_exists(self, corpus_id: str) -> _CorpusIndex | None:
+        if corpus_id in self._corpora or self.root_dir is None:
+            return self._corpora.get(corpus_id)
+        path = self.root_dir / corpus_id
+        if not Path(f"{path}.meta.json").exists():
+            return None
+        try:
+            corpus_idx = _CorpusIndex.open(path)
+        except Exception as e:  # pragma: no cover - defensive
+            raise VectorSearchError(f"failed to load corpus vectors for {corpus_id}") from e
+        self._corpora[corpus_id] = corpus_idx
+        return corpus_idx
 
-    def _normalize(self, vector: List[float]) -> List[float]:
-        norm = sqrt(sum(v * v for v in vector))
-        if norm == 0:
+    def _normalize_rows(self, rows: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        if np.any(norms == 0):
             raise VectorSearchError("cannot normalize zero vector")
-        return [v / norm for v in vector]
+        rows /= norms
+        return rows
+
 
-    def _dot(self, a: List[float], b: List[float]) -> float:
-        if len(a) != len(b):
-            raise VectorSearchError("dimension mismatch during dot product")
-        return float(sum(x * y for x, y in zip(a, b)))
+FaissIndexType = Literal["flat", "hnsw", "ivfpq"]
 
 
 @dataclass
 class _FaissCorpus:
     dim: int
-    index: "faiss.IndexFlatIP"
-    keys: list[Tuple[str, str]]
-    key_index: dict[Tuple[str, str], int]
+    index: faiss.Index
+    keys: list[tuple[str, str]]
+    key_index: dict[tuple[str, str], int]
     meta_path: Path
     index_path: Path
 
@@ -157,21 +344,56 @@ class FaissVectorSearchService:
     FAISS-backed implementation aligned with Phase 3.2 requirements.
 
     Persist indexes and metadata per corpus under `root_dir`.
+
+    `index_type` selects the index built for new corpora:
+    - "flat": exact inner-product scan (IndexFlatIP)
+    - "hnsw": approximate graph search (IndexHNSWFlat), no training required
+    - "ivfpq": inverted lists over product-quantized codes (IndexIVFPQ); trained on
+      the first batch, which must hold at least max(ivf_nlist, 2**8) vectors
+
+    Indexes already persisted on disk keep the type they were created with.
     """
 
     root_dir: Path
     normalize: bool = True
+    index_type: FaissIndexType = "flat"
+    hnsw_m: int = 32
+    ivf_nlist: int = 100
+    ivf_nprobe: int = 8
 
     def __post_init__(self) -> None:
         if not _HAS_FAISS:
             raise VectorSearchError("faiss is not installed; cannot use FaissVectorSearchService")
+        if self.index_type not in ("flat", "hnsw", "ivfpq"):
+            raise VectorSearchError(f"unsupported faiss index type: {self.index_type}")
         self.root_dir.mkdir(parents=True, exist_ok=True)
         self._corpora: dict[str, _FaissCorpus] = {}
+        self._bulk_depth = 0
+        self._dirty: set[str] = set()
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Defer writing indexes to disk until the outermost bulk block exits.
+
+        Every index_embeddings call otherwise rewrites the corpus's whole index
+        file; inside a bulk block each touched corpus is written once at the end.
+        Searches inside the block see the in-memory index.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                dirty, self._dirty = self._dirty, set()
+                for corpus_id in sorted(dirty):
+                    self._persist_corpus(self._corpora[corpus_id])
 
     async def index_embeddings(
         self,
         corpus_id: str,
-        items: List[Tuple[str, str, List[float]]],
+        items: List[tuple[str, str, List[float]]],
     ) -> None:
         if items is None:
             raise VectorSearchError("items cannot be None")
@@ -185,9 +407,11 @@ class FaissVectorSearchService:
 
         corpus_idx = self._load_or_create_corpus(corpus_id, dim)
 
+        new_keys: list[tuple[str, str]] = []
+        pending: set[tuple[str, str]] = set()
         for document_id, chunk_id, vector in items:
             key = (document_id, chunk_id)
-            if key in corpus_idx.key_index:
+            if key in corpus_idx.key_index or key in pending:
                 raise VectorSearchError(
                     f"duplicate embedding for corpus={corpus_id} document_id={document_id} chunk_id={chunk_id}"
                 )
@@ -195,12 +419,28 @@ class FaissVectorSearchService:
                 raise VectorSearchError(
                     f"embedding dimension mismatch: expected {corpus_idx.dim}, got {len(vector)}"
                 )
-            arr = self._prepare_vector(vector)
-            corpus_idx.index.add(arr)
+            pending.add(key)
+            new_keys.append(key)
+
+        # Normalize the batch once and add it in a single call
+        arr = self._prepare_vectors([item[2] for item in items])
+        if not corpus_idx.index.is_trained:
+            min_train = max(self.ivf_nlist, 2**_PQ_NBITS)
+            if arr.shape[0] < min_train:
+                raise VectorSearchError(
+                    f"ivfpq index for corpus {corpus_id} needs at least {min_train} vectors "
+                    f"in its first batch to train, got {arr.shape[0]}"
+                )
+            corpus_idx.index.train(arr)
+        corpus_idx.index.add(arr)
+        for key in new_keys:
+            corpus_idx.key_index[key] = len(corpus_idx.keys)
             corpus_idx.keys.append(key)
-            corpus_idx.key_index[key] = len(corpus_idx.keys) - 1
 
-        self._persist_corpus(corpus_idx)
+        if self._bulk_depth:
+            self._dirty.add(corpus_id)
+        else:
+            self._persist_corpus(corpus_idx)
 
     async def search(self, corpus_id: str, query_vector: List[float], k: int = 20) -> List[VectorHit]:
         corpus_idx = self._load_corpus_if_exists(corpus_id)
@@ -212,8 +452,9 @@ class FaissVectorSearchService:
                 f"query vector dimension mismatch: expected {corpus_idx.dim}, got {len(query_vector)}"
             )
 
-        query = self._prepare_vector(query_vector)
+        query = self._prepare_vectors([query_vector])
         limit = min(max(k, 0), corpus_idx.index.ntotal)
+        self._tune_search(corpus_idx.index, limit)
         # FAISS expects shape (n_queries, dim)
         scores, ids = corpus_idx.index.search(query, limit)
         # scores shape (1, limit), ids shape (1, limit)
@@ -225,16 +466,15 @@ class FaissVectorSearchService:
             hits.append(VectorHit(document_id=document_id, chunk_id=chunk_id, score=float(score)))
         return hits
 
-    def _prepare_vector(self, vector: List[float]) -> np.ndarray:
-        arr = np.array(vector, dtype=np.float32)
-        if arr.ndim != 1:
-            raise VectorSearchError("embedding vector must be one-dimensional")
+    def _prepare_vectors(self, vectors: List[List[float]]) -> np.ndarray:
+        arr = np.array(vectors, dtype=np.float32)
+        if arr.ndim != 2:
+            raise VectorSearchError("embedding vectors must be a 2-D batch of equal-length vectors")
         if self.normalize:
-            norm = np.linalg.norm(arr)
-            if norm == 0:
+            if np.any(np.linalg.norm(arr, axis=1) == 0):
                 raise VectorSearchError("cannot normalize zero vector")
-            arr = arr / norm
-        return arr.reshape(1, -1)
+            faiss.normalize_L2(arr)
+        return arr
 
     def _load_or_create_corpus(self, corpus_id: str, dim: int) -> _FaissCorpus:
         existing = self._load_corpus_if_exists(corpus_id)
@@ -245,7 +485,7 @@ class FaissVectorSearchService:
                 )
             return existing
         index_path, meta_path = self._paths_for_corpus(corpus_id)
-        index = faiss.IndexFlatIP(dim)
+        index = self._create_index(dim)
         corpus = _FaissCorpus(
             dim=dim,
             index=index,
@@ -257,6 +497,29 @@ class FaissVectorSearchService:
         self._corpora[corpus_id] = corpus
         return corpus
 
+    def _create_index(self, dim: int) -> faiss.Index:
+        if self.index_type == "hnsw":
+            return faiss.IndexHNSWFlat(dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        if self.index_type == "ivfpq":
+            # One PQ sub-quantizer per 4 dimensions (4-byte float32 -> 1-byte code)
+            if dim % 4 != 0:
+                raise VectorSearchError(
+                    f"ivfpq index requires a dimension divisible by 4, got {dim}"
+                )
+            pq_m = dim // 4
+            quantizer = faiss.IndexFlatIP(dim)
+            return faiss.IndexIVFPQ(
+                quantizer, dim, self.ivf_nlist, pq_m, _PQ_NBITS, faiss.METRIC_INNER_PRODUCT
+            )
+        return faiss.IndexFlatIP(dim)
+
+    def _tune_search(self, index: faiss.Index, limit: int) -> None:
+        if isinstance(index, faiss.IndexHNSW):
+            # HNSW returns at most efSearch candidates per query
+            index.hnsw.efSearch = max(index.hnsw.efSearch, limit)
+        elif isinstance(index, faiss.IndexIVF):
+            index.nprobe = min(self.ivf_nprobe, index.nlist)
+
     def _load_corpus_if_exists(self, corpus_id: str) -> _FaissCorpus | None:
         if corpus_id in self._corpora:
             return self._corpora[corpus_id]
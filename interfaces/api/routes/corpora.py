@@ -21,7 +21,7 @@ def list_corpora():
             type=corpus.type,
             name=corpus.name,
             created_at=corpus.created_at,
-            document_count=len(corpus_store.list_documents(corpus.id)),
+            document_count=len(corpus_store.list_document_ids(corpus.id)),
         )
         for corpus in corpora
     ]
@@ -41,7 +41,7 @@ def get_corpus(corpus_id: str):
         type=corpus.type,
         name=corpus.name,
         created_at=corpus.created_at,
-        document_count=len(corpus_store.list_documents(corpus.id)),
+        document_count=len(corpus_store.list_document_ids(corpus.id)),
     )
 
 
@@ -30,6 +30,151 @@ from interfaces.mcp import (
 
 logger = logging.getLogger(__name__)
 
+# Tool name -> implementation, built once at import and copied per server
+_TOOL_REGISTRY: dict[str, Callable] = {
+    # Corpus management tools
+    "alavista.list_corpora": list_corpora_tool,
+    "alavista.get_corpus": get_corpus_tool,
+
+    # Search tools
+    "alavista.semantic_search": semantic_search_tool,
+    "alavista.keyword_search": keyword_search_tool,
+
+    # Graph tools
+    "alavista.graph_find_entity": graph_find_entity_tool,
+    "alavista.graph_neighbors": graph_neighbors_tool,
+    "alavista.graph_paths": graph_paths_tool,
+
+    # Persona tools
+    "alavista.list_personas": list_personas_tool,
+    "alavista.persona_query": persona_query_tool,
+    "alavista.persona_ingest_resource": persona_ingest_resource_tool,
+
+    # Ontology tools
+    "alavista.ontology_list_entities": ontology_list_entities_tool,
+    "alavista.ontology_list_relations": ontology_list_relations_tool,
+    "alavista.ontology_describe_type": ontology_describe_type_tool,
+
+    # Ingestion tools
+    "alavista.ingest_text": ingest_text_tool,
+    "alavista.ingest_file": ingest_file_tool,
+
+    # Graph RAG tools
+    "alavista.graph_rag": graph_rag_tool,
+}
+
+
+# Tool name -> description and argument summary, reported by get_tool_info
+_TOOL_INFO: dict[str, dict[str, Any]] = {
+    "alavista.list_corpora": {
+        "description": "List all available corpora",
+        "args": {},
+    },
+    "alavista.get_corpus": {
+        "description": "Get detailed information about a specific corpus",
+        "args": {"corpus_id": "string (required)"},
+    },
+    "alavista.semantic_search": {
+        "description": "Execute semantic/hybrid search over a corpus",
+        "args": {
+            "corpus_id": "string (required)",
+            "query": "string (required)",
+            "k": "integer (optional, default 20)",
+        },
+    },
+    "alavista.keyword_search": {
+        "description": "Execute keyword (BM25) search over a corpus",
+        "args": {
+            "corpus_id": "string (required)",
+            "query": "string (required)",
+            "k": "integer (optional, default 20)",
+        },
+    },
+    "alavista.graph_find_entity": {
+        "description": "Find entities by name in the knowledge graph",
+        "args": {"name": "string (required)"},
+    },
+    "alavista.graph_neighbors": {
+        "description": "Get neighbors of a node in the knowledge graph",
+        "args": {
+            "node_id": "string (required)",
+            "depth": "integer (optional, default 1)",
+        },
+    },
+    "alavista.graph_paths": {
+        "description": "Find paths between two nodes",
+        "args": {
+            "start_id": "string (required)",
+            "end_id": "string (required)",
+            "max_hops": "integer (optional, default 4)",
+        },
+    },
+    "alavista.list_personas": {
+        "description": "List all available personas (analysis profiles)",
+        "args": {},
+    },
+    "alavista.persona_query": {
+        "description": "Execute a persona-scoped question answering pass",
+        "args": {
+            "persona_id": "string (required)",
+            "question": "string (required)",
+            "corpus_id": "string (required)",
+            "k": "integer (optional, default 20)",
+        },
+    },
+    "alavista.persona_ingest_resource": {
+        "description": "Ingest a resource (text, file, or URL) into a persona's manual corpus",
+        "args": {
+            "persona_id": "string (required)",
+            "resource_type": "string (required) - 'text', 'file', or 'url'",
+            "content": "string (required for resource_type='text')",
+            "file_path": "string (required for resource_type='file')",
+            "url": "string (required for resource_type='url')",
+            "metadata": "object (optional)",
+        },
+    },
+    "alavista.ontology_list_entities": {
+        "description": "List all entity types in the ontology",
+        "args": {},
+    },
+    "alavista.ontology_list_relations": {
+        "description": "List all relation types in the ontology",
+        "args": {},
+    },
+    "alavista.ontology_describe_type": {
+        "description": "Get detailed information about an entity or relation type",
+        "args": {
+            "type_name": "string (required)",
+            "type_kind": "string (optional, 'entity' or 'relation', default 'entity')",
+        },
+    },
+    "alavista.ingest_text": {
+        "description": "Ingest raw text into a corpus",
+        "args": {
+            "corpus_id": "string (required)",
+            "text": "string (required)",
+            "metadata": "object (optional)",
+        },
+    },
+    "alavista.ingest_file": {
+        "description": "Ingest a file into a corpus",
+        "args": {
+            "corpus_id": "string (required)",
+            "file_path": "string (required)",
+            "metadata": "object (optional)",
+        },
+    },
+    "alavista.graph_rag": {
+        "description": "Execute graph-guided RAG to answer a question",
+        "args": {
+            "question": "string (required)",
+            "persona_id": "string (required)",
+            "corpus_id": "string (optional)",
+            "k": "integer (optional, default 20)",
+        },
+    },
+}
+
 
 class MCPServer:
     """MCP server that exposes Alavista tools to LLM clients."""
@@ -41,36 +186,7 @@ class MCPServer:
 
     def _register_tools(self) -> None:
         """Register all available tools with the server."""
-        # Corpus management tools
-        self.tools["alavista.list_corpora"] = list_corpora_tool
-        self.tools["alavista.get_corpus"] = get_corpus_tool
-
-        # Search tools
-        self.tools["alavista.semantic_search"] = semantic_search_tool
-        self.tools["alavista.keyword_search"] = keyword_search_tool
-
-        # Graph tools
-        self.tools["alavista.graph_find_entity"] = graph_find_entity_tool
-        self.tools["alavista.graph_neighbors"] = graph_neighbors_tool
-        self.tools["alavista.graph_paths"] = graph_paths_tool
-
-        # Persona tools
-        self.tools["alavista.list_personas"] = list_personas_tool
-        self.tools["alavista.persona_query"] = persona_query_tool
-        self.tools["alavista.persona_ingest_resource"] = persona_ingest_resource_tool
-
-        # Ontology tools
-        self.tools["alavista.ontology_list_entities"] = ontology_list_entities_tool
-        self.tools["alavista.ontology_list_relations"] = ontology_list_relations_tool
-        self.tools["alavista.ontology_describe_type"] = ontology_describe_type_tool
-
-        # Ingestion tools
-        self.tools["alavista.ingest_text"] = ingest_text_tool
-        self.tools["alavista.ingest_file"] = ingest_file_tool
-
-        # Graph RAG tools
-        self.tools["alavista.graph_rag"] = graph_rag_tool
-
+        self.tools.update(_TOOL_REGISTRY)
         logger.info(f"Registered {len(self.tools)} MCP tools")
 
     def list_tools(self) -> list[str]:
@@ -119,113 +235,7 @@ class MCPServer:
             Dict mapping tool names to their info
         """
         return {
-            "alavista.list_corpora": {
-                "description": "List all available corpora",
-                "args": {},
-            },
-            "alavista.get_corpus": {
-                "description": "Get detailed information about a specific corpus",
-                "args": {"corpus_id": "string (required)"},
-            },
-            "alavista.semantic_search": {
-                "description": "Execute semantic/hybrid search over a corpus",
-                "args": {
-                    "corpus_id": "string (required)",
-                    "query": "string (required)",
-                    "k": "integer (optional, default 20)",
-                },
-            },
-            "alavista.keyword_search": {
-                "description": "Execute keyword (BM25) search over a corpus",
-                "args": {
-                    "corpus_id": "string (required)",
-                    "query": "string (required)",
-                    "k": "integer (optional, default 20)",
-                },
-            },
-            "alavista.graph_find_entity": {
-                "description": "Find entities by name in the knowledge graph",
-                "args": {"name": "string (required)"},
-            },
-            "alavista.graph_neighbors": {
-                "description": "Get neighbors of a node in the knowledge graph",
-                "args": {
-                    "node_id": "string (required)",
-                    "depth": "integer (optional, default 1)",
-                },
-            },
-            "alavista.graph_paths": {
-                "description": "Find paths between two nodes",
-                "args": {
-                    "start_id": "string (required)",
-                    "end_id": "string (required)",
-                    "max_hops": "integer (optional, default 4)",
-                },
-            },
-            "alavista.list_personas": {
-                "description": "List all available personas (analysis profiles)",
-                "args": {},
-            },
-            "alavista.persona_query": {
-                "description": "Execute a persona-scoped question answering pass",
-                "args": {
-                    "persona_id": "string (required)",
-                    "question": "string (required)",
-                    "corpus_id": "string (required)",
-                    "k": "integer (optional, default 20)",
-                },
-            },
-            "alavista.persona_ingest_resource": {
-                "description": "Ingest a resource (text, file, or URL) into a persona's manual corpus",
-                "args": {
-                    "persona_id": "string (required)",
-                    "resource_type": "string (required) - 'text', 'file', or 'url'",
-                    "content": "string (required for resource_type='text')",
-                    "file_path": "string (required for resource_type='file')",
-                    "url": "string (required for resource_type='url')",
-                    "metadata": "object (optional)",
-                },
-            },
-            "alavista.ontology_list_entities": {
-                "description": "List all entity types in the ontology",
-                "args": {},
-            },
-            "alavista.ontology_list_relations": {
-                "description": "List all relation types in the ontology",
-                "args": {},
-            },
-            "alavista.ontology_describe_type": {
-                "description": "Get detailed information about an entity or relation type",
-                "args": {
-                    "type_name": "string (required)",
-                    "type_kind": "string (optional, 'entity' or 'relation', default 'entity')",
-                },
-            },
-            "alavista.ingest_text": {
-                "description": "Ingest raw text into a corpus",
-                "args": {
-                    "corpus_id": "string (required)",
-                    "text": "string (required)",
-                    "metadata": "object (optional)",
-                },
-            },
-            "alavista.ingest_file": {
-                "description": "Ingest a file into a corpus",
-                "args": {
-                    "corpus_id": "string (required)",
-                    "file_path": "string (required)",
-                    "metadata": "object (optional)",
-                },
-            },
-            "alavista.graph_rag": {
-                "description": "Execute graph-guided RAG to answer a question",
-                "args": {
-                    "question": "string (required)",
-                    "persona_id": "string (required)",
-                    "corpus_id": "string (optional)",
-                    "k": "integer (optional, default 20)",
-                },
-            },
+            name: {**info, "args": dict(info["args"])} for name, info in _TOOL_INFO.items()
         }
 
 
@@ -3,6 +3,8 @@
 from alavista.core.container import Container
 from alavista.core.models import Chunk
 
+_EXCERPT_LENGTH = 200
+
 
 def semantic_search_tool(args: dict) -> dict:
     """Execute semantic (hybrid) search over a corpus.
@@ -74,13 +76,49 @@ def semantic_search_tool(args: dict) -> dict:
 def keyword_search_tool(args: dict) -> dict:
     """Execute keyword (BM25) search over a corpus.
 
-    This is an alias for semantic_search_tool with mode='bm25'.
-    Currently both use BM25 search.
+    Uses the corpus store's FTS5 index when available, so documents are ranked
+    inside SQLite instead of being loaded and scored in Python. Falls back to
+    semantic_search_tool otherwise.
 
     Args:
         args: dict with 'corpus_id', 'query', and optional 'k' (default 20)
 
     Returns:
         dict with 'hits' list containing search results
+
+    Raises:
+        ValueError: If required args missing or corpus not found
     """
-    return semantic_search_tool(args)
+    corpus_id = args.get("corpus_id")
+    query = args.get("query")
+    k = int(args.get("k", 20))
+
+    if not corpus_id:
+        raise ValueError("corpus_id is required")
+    if not query:
+        raise ValueError("query is required")
+
+    corpus_store = Container.get_corpus_store()
+    if not getattr(corpus_store, "has_fts", False):
+        return semantic_search_tool(args)
+
+    # Verify corpus exists
+    corpus = corpus_store.get_corpus(corpus_id)
+    if not corpus:
+        raise ValueError(f"Corpus '{corpus_id}' not found")
+
+    hits = []
+    for doc, score in corpus_store.search_documents(corpus_id, query, k=k):
+        excerpt = doc.text
+        if len(excerpt) > _EXCERPT_LENGTH:
+            excerpt = excerpt[:_EXCERPT_LENGTH] + "..."
+        hits.append(
+            {
+                "document_id": doc.id,
+                "chunk_id": f"{doc.id}::chunk_0",
+                "score": score,
+                "excerpt": excerpt,
+                "metadata": {"chunk_index": 0, "total_chunks": 1},
+            }
+        )
+    return {"hits": hits}
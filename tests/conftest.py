@@ -9,6 +9,26 @@ from pathlib import Path
 import pytest
 
 from alavista.core.config import Settings
+from alavista.core.container import Container
+from alavista.core.corpus_store import SQLiteCorpusStore
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """
+    Point the Container's default settings at a per-session data directory.
+
+    Container singletons otherwise open ./data, which parallel (pytest-xdist)
+    workers would share; tmp_path_factory gives each worker its own directory.
+
+    Yields:
+        Path: Data directory used by Container.get_settings
+    """
+    data_dir = tmp_path_factory.mktemp("data")
+    settings = Settings(data_dir=data_dir, vector_index_dir=data_dir / "vector_index")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Container, "get_settings", staticmethod(lambda: settings))
+        yield data_dir
 
 
 @pytest.fixture
@@ -31,6 +51,34 @@ def test_settings() -> Settings:
         yield settings
 
 
+@pytest.fixture(scope="session")
+def _shared_corpus_store() -> Generator[SQLiteCorpusStore, None, None]:
+    """Build the session-wide in-memory corpus store (and its schema) once."""
+    store = SQLiteCorpusStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def shared_corpus_store(
+    _shared_corpus_store: SQLiteCorpusStore,
+) -> Generator[SQLiteCorpusStore, None, None]:
+    """
+    Provide the session-wide corpus store, emptied after each test.
+
+    Store methods commit their own transactions, so tests cannot share one
+    rolled-back transaction; instead all corpora are deleted on teardown,
+    cascading to their documents and chunks.
+
+    Yields:
+        SQLiteCorpusStore: Shared corpus store
+    """
+    yield _shared_corpus_store
+    with _shared_corpus_store._get_connection() as conn:
+        conn.execute("DELETE FROM corpora")
+        conn.commit()
+
+
 @pytest.fixture
 def tmp_data_dir() -> Generator[Path, None, None]:
     """
@@ -2,7 +2,7 @@
 Tests for text chunking utilities.
 """
 
-from alavista.core.chunking import chunk_text, normalize_text
+from alavista.core.chunking import chunk_text, normalize_text, sliding_window_chunks
 
 
 class TestNormalization:
@@ -32,6 +32,12 @@ class TestNormalization:
         normalized = normalize_text(text)
         assert normalized == "Line 1\nLine 2\nLine 3"
 
+    def test_normalize_mixed_tabs_and_spaces(self):
+        """Test that mixed tab/space runs collapse to a single space."""
+        text = "a \t b\t\tc \t\n\n\n\n\td"
+        normalized = normalize_text(text)
+        assert normalized == "a b c\n\nd"
+
     def test_empty_text(self):
         """Test normalization of empty text."""
         assert normalize_text("") == ""
@@ -194,3 +200,70 @@ Third paragraph with even more content."""
 
         # Should have fewer chunks than paragraphs due to merging
         assert len(chunks) < 5
+
+    def test_merged_chunk_text_and_offsets(self):
+        """Test that merged chunks join parts with blank lines and keep offsets consistent."""
+        text = "A.\n\nB.\n\nC."
+
+        chunks = chunk_text(text, min_chunk_size=10, max_chunk_size=100)
+
+        assert len(chunks) == 1
+        assert chunks[0].text == "A.\n\nB.\n\nC."
+        assert chunks[0].start_offset == 0
+        assert chunks[0].end_offset == len(chunks[0].text)
+
+
+class TestAssumeNormalized:
+    """Test suite for chunking pre-normalized text."""
+
+    def test_chunk_text_matches_default_path(self, sample_text: str):
+        """Test that skipping normalization on normalized input changes nothing."""
+        normalized = normalize_text(sample_text)
+
+        assert chunk_text(normalized, min_chunk_size=50, assume_normalized=True) == chunk_text(
+            sample_text, min_chunk_size=50
+        )
+
+    def test_sliding_window_uses_text_as_is(self):
+        """Test that pre-normalized text is windowed without re-normalizing."""
+        text = "a\n\n\n\nb"
+
+        chunks = sliding_window_chunks(text, window_size=10, assume_normalized=True)
+
+        assert chunks[0].text == text
+
+
+class TestSlidingWindowChunks:
+    """Test suite for sliding-window chunking."""
+
+    def test_short_text_single_window(self):
+        """Test that text shorter than the window yields one chunk."""
+        chunks = sliding_window_chunks("Short text.", window_size=100)
+
+        assert len(chunks) == 1
+        assert chunks[0].text == "Short text."
+        assert chunks[0].start_offset == 0
+        assert chunks[0].end_offset == len("Short text.")
+
+    def test_windows_overlap_by_window_minus_stride(self):
+        """Test window positions, overlap and tail handling."""
+        text = "".join(str(i % 10) for i in range(250))
+
+        chunks = sliding_window_chunks(text, window_size=100, stride=75)
+
+        # ceil((250 - 100) / 75) + 1 windows
+        assert [c.start_offset for c in chunks] == [0, 75, 150]
+        assert chunks[-1].end_offset == 250
+        for chunk in chunks:
+            assert chunk.text == text[chunk.start_offset:chunk.end_offset]
+        assert chunks[0].text[75:] == chunks[1].text[:25]
+
+    def test_default_stride(self):
+        """Test that stride defaults to 0.75 of the window size."""
+        chunks = sliding_window_chunks("x" * 300, window_size=100)
+
+        assert [c.start_offset for c in chunks] == [0, 75, 150, 225]
+
+    def test_empty_text(self):
+        """Test that empty text produces no chunks."""
+        assert sliding_window_chunks("   ", window_size=100) == []
@@ -3,22 +3,26 @@ Tests for CorpusStore implementation.
 """
 
 import sqlite3
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from alavista.core.corpus_store import SQLiteCorpusStore
-from alavista.core.models import Corpus, Document
+from alavista.core.models import Chunk, Corpus, Document
 
 
 class TestSQLiteCorpusStore:
     """Test suite for SQLiteCorpusStore."""
 
     @pytest.fixture
-    def store(self, tmp_path: Path) -> SQLiteCorpusStore:
+    def store(self, tmp_path: Path) -> Generator[SQLiteCorpusStore, None, None]:
         """Create a test corpus store."""
         db_path = tmp_path / "test_corpus.db"
-        return SQLiteCorpusStore(db_path)
+        store = SQLiteCorpusStore(db_path, fast_mode=True)
+        yield store
+        store.close()
 
     @pytest.fixture
     def sample_corpus(self) -> Corpus:
@@ -100,6 +104,21 @@ class TestSQLiteCorpusStore:
         corpus_ids = {c.id for c in corpora}
         assert corpus_ids == {"corpus-1", "corpus-2", "corpus-3"}
 
+    def test_list_corpora_sees_writes_from_other_stores(self, tmp_path: Path):
+        """Test that cached corpus listings are invalidated by any writer."""
+        db_path = tmp_path / "shared.db"
+        store = SQLiteCorpusStore(db_path)
+        other = SQLiteCorpusStore(db_path)
+        store.create_corpus(Corpus(id="corpus-1", type="research", name="Corpus 1"))
+        assert [c.id for c in store.list_corpora()] == ["corpus-1"]
+
+        other.create_corpus(Corpus(id="corpus-2", type="research", name="Corpus 2"))
+        assert {c.id for c in store.list_corpora()} == {"corpus-1", "corpus-2"}
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM corpora WHERE id = 'corpus-1'")
+        assert [c.id for c in store.list_corpora()] == ["corpus-2"]
+
     def test_list_corpora_empty(self, store: SQLiteCorpusStore):
         """Test listing corpora when none exist."""
         corpora = store.list_corpora()
@@ -150,6 +169,41 @@ class TestSQLiteCorpusStore:
         assert added.id == sample_document.id
         assert added.text == sample_document.text
 
+    def test_add_documents_batch(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus
+    ):
+        """Test adding several documents in one call."""
+        store.create_corpus(sample_corpus)
+        docs = [
+            Document(
+                id=f"doc-{i}",
+                corpus_id=sample_corpus.id,
+                text=f"Document {i}",
+                content_hash=f"hash{i}",
+            )
+            for i in range(3)
+        ]
+
+        added = store.add_documents(docs)
+
+        assert added == docs
+        assert len(store.list_documents(sample_corpus.id)) == 3
+
+    def test_add_documents_is_atomic(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that a failing batch writes nothing."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+        new_doc = Document(
+            id="doc-2", corpus_id=sample_corpus.id, text="New", content_hash="new"
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_documents([new_doc, sample_document])
+
+        assert store.get_document("doc-2") is None
+
     def test_get_document(
         self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
     ):
@@ -214,6 +268,39 @@ class TestSQLiteCorpusStore:
         documents = store.list_documents(sample_corpus.id)
         assert documents == []
 
+    def test_iter_documents(self, store: SQLiteCorpusStore, sample_corpus: Corpus):
+        """Test iterating documents across several fetch batches."""
+        store.create_corpus(sample_corpus)
+        for i in range(5):
+            store.add_document(
+                Document(
+                    id=f"doc-{i}",
+                    corpus_id=sample_corpus.id,
+                    text=f"Document {i}",
+                    content_hash=f"hash{i}",
+                )
+            )
+
+        documents = list(store.iter_documents(sample_corpus.id, batch_size=2))
+
+        assert [d.id for d in documents] == [d.id for d in store.list_documents(sample_corpus.id)]
+        assert list(store.iter_documents("missing")) == []
+
+    def test_list_document_ids(self, store: SQLiteCorpusStore):
+        """Test listing only the document IDs of one corpus."""
+        for corpus_id in ("c1", "c2"):
+            store.create_corpus(Corpus(id=corpus_id, type="research", name=corpus_id))
+        store.add_documents(
+            [
+                Document(id="d1", corpus_id="c1", text="One", content_hash="h1"),
+                Document(id="d2", corpus_id="c1", text="Two", content_hash="h2"),
+                Document(id="d3", corpus_id="c2", text="Three", content_hash="h3"),
+            ]
+        )
+
+        assert store.list_document_ids("c1") == frozenset({"d1", "d2"})
+        assert store.list_document_ids("missing") == frozenset()
+
     def test_find_by_hash(
         self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
     ):
@@ -264,6 +351,159 @@ class TestSQLiteCorpusStore:
         found = store.find_by_hash(corpus2.id, "hash123")
         assert found is None
 
+    def test_duplicate_content_hash_rejected(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that a content hash can only be stored once per corpus."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+
+        duplicate = sample_document.model_copy(update={"id": "doc-2"})
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_document(duplicate)
+
+    def test_in_memory_store_persists_across_connections(self, sample_corpus: Corpus):
+        """Test that an in-memory store keeps data between calls and is private."""
+        store = SQLiteCorpusStore(":memory:")
+        store.create_corpus(sample_corpus)
+
+        assert store.get_corpus(sample_corpus.id) is not None
+        assert SQLiteCorpusStore(":memory:").get_corpus(sample_corpus.id) is None
+
+    def test_fast_mode_uses_wal(self, tmp_path: Path):
+        """Test that fast mode switches the database to WAL journaling."""
+        db_path = tmp_path / "fast.db"
+        store = SQLiteCorpusStore(db_path, fast_mode=True)
+
+        with store._get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+
+    def test_connection_reused_per_thread(self, store: SQLiteCorpusStore):
+        """Test that each thread keeps its own connection across calls."""
+        conn = store._get_connection()
+        assert store._get_connection() is conn
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(store._get_connection).result()
+        assert other is not conn
+
+    def test_close_releases_connections(self, sample_corpus: Corpus):
+        """Test that close shuts the thread's connection and the in-memory keep-alive."""
+        store = SQLiteCorpusStore(":memory:")
+        store.create_corpus(sample_corpus)
+        conn = store._get_connection()
+        keepalive = store._keepalive
+
+        store.close()
+
+        for closed in (conn, keepalive):
+            with pytest.raises(sqlite3.ProgrammingError):
+                closed.execute("SELECT 1")
+
+    def test_find_by_hash_uses_index(self, tmp_path: Path):
+        """Test that dedup lookups seek the (corpus_id, content_hash) index."""
+        db_path = tmp_path / "plan.db"
+        SQLiteCorpusStore(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM documents "
+                "WHERE corpus_id = ? AND content_hash = ? LIMIT 1",
+                ("c", "h"),
+            ).fetchall()
+
+        assert any("idx_documents_corpus_hash" in row[-1] for row in plan)
+
+    def test_legacy_duplicate_hashes_still_open(self, tmp_path: Path):
+        """Test that databases holding duplicate hashes fall back to a plain index."""
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE documents (id TEXT PRIMARY KEY, corpus_id TEXT NOT NULL, "
+                "text TEXT NOT NULL, content_hash TEXT NOT NULL, metadata TEXT NOT NULL, "
+                "created_at TEXT NOT NULL)"
+            )
+            conn.executemany(
+                "INSERT INTO documents VALUES (?, 'c', 't', 'h', '{}', '2024-01-01T00:00:00')",
+                [("d1",), ("d2",)],
+            )
+
+        store = SQLiteCorpusStore(db_path)
+
+        assert store.find_by_hash("c", "h") is not None
+
+    def test_search_documents(self, store: SQLiteCorpusStore):
+        """Test keyword search ranks matching documents within one corpus."""
+        for corpus_id in ("c1", "c2"):
+            store.create_corpus(Corpus(id=corpus_id, type="research", name=corpus_id))
+        store.add_documents(
+            [
+                Document(id="d1", corpus_id="c1", text="neural networks and neural nets",
+                         content_hash="h1"),
+                Document(id="d2", corpus_id="c1", text="a note on networks", content_hash="h2"),
+                Document(id="d3", corpus_id="c1", text="unrelated text", content_hash="h3"),
+                Document(id="d4", corpus_id="c2", text="neural networks", content_hash="h4"),
+            ]
+        )
+
+        results = store.search_documents("c1", "neural networks")
+
+        assert [doc.id for doc, _ in results] == ["d1", "d2"]
+        assert results[0][1] > results[1][1]
+        assert store.search_documents("c1", '"* OR') == []
+
+    def test_search_documents_after_delete(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that deleted documents drop out of the keyword index."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+        query = sample_document.text.split()[0]
+        assert store.search_documents(sample_corpus.id, query)
+
+        store.delete_corpus(sample_corpus.id)
+
+        assert store.search_documents(sample_corpus.id, query) == []
+
+    def test_search_documents_index_tracks_documents_rows(self, store: SQLiteCorpusStore):
+        """Test that the external-content index stays consistent as documents are deleted."""
+        for corpus_id in ("c1", "c2"):
+            store.create_corpus(Corpus(id=corpus_id, type="research", name=corpus_id))
+        store.add_documents(
+            [
+                Document(id="d1", corpus_id="c1", text="shared words", content_hash="h1"),
+                Document(id="d2", corpus_id="c2", text="shared words", content_hash="h2"),
+            ]
+        )
+
+        store.delete_corpus("c1")
+
+        assert store.search_documents("c1", "shared") == []
+        assert [doc.id for doc, _ in store.search_documents("c2", "shared")] == ["d2"]
+        with store._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO documents_fts (documents_fts, rank) VALUES ('integrity-check', 1)"
+            )
+
+    def test_search_documents_indexes_existing_rows(self, tmp_path: Path):
+        """Test that documents written before the FTS index existed are searchable."""
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE documents (id TEXT PRIMARY KEY, corpus_id TEXT NOT NULL, "
+                "text TEXT NOT NULL, content_hash TEXT NOT NULL, metadata TEXT NOT NULL, "
+                "created_at TEXT NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO documents VALUES "
+                "('d1', 'c', 'legacy text', 'h', '{}', '2024-01-01T00:00:00')"
+            )
+
+        store = SQLiteCorpusStore(db_path)
+
+        assert [doc.id for doc, _ in store.search_documents("c", "legacy")] == ["d1"]
+
     def test_duplicate_corpus_id(
         self, store: SQLiteCorpusStore, sample_corpus: Corpus
     ):
@@ -282,3 +522,135 @@ class TestSQLiteCorpusStore:
 
         with pytest.raises(sqlite3.IntegrityError):
             store.add_document(sample_document)
+
+    def test_add_and_get_chunks(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that packed chunks round-trip in order."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+        chunks = [
+            Chunk(
+                id=f"{sample_document.id}::chunk_{i}",
+                document_id=sample_document.id,
+                corpus_id=sample_corpus.id,
+                text=f"Chunk {i} text",
+                start_offset=i * 20,
+                end_offset=i * 20 + 12,
+                metadata={"chunk_index": i, "total_chunks": 3},
+            )
+            for i in range(3)
+        ]
+
+        store.add_chunks(sample_document.id, chunks)
+
+        assert store.get_chunks(sample_document.id) == chunks
+
+    def test_add_document_with_chunks(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that a document and its chunks are stored together, or not at all."""
+        store.create_corpus(sample_corpus)
+        chunk = Chunk(
+            id=f"{sample_document.id}::chunk_0",
+            document_id=sample_document.id,
+            corpus_id=sample_corpus.id,
+            text="Chunk",
+            start_offset=0,
+            end_offset=5,
+        )
+
+        store.add_document_with_chunks(sample_document, [chunk])
+
+        assert store.get_document(sample_document.id) == sample_document
+        assert store.get_chunks(sample_document.id) == [chunk]
+
+        duplicate = sample_document.model_copy(update={"id": "doc-2"})
+        duplicate_chunk = chunk.model_copy(update={"document_id": "doc-2"})
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_document_with_chunks(duplicate, [duplicate_chunk])
+        assert store.get_chunks("doc-2") == []
+
+    def test_add_chunks_batch(self, store: SQLiteCorpusStore, sample_corpus: Corpus):
+        """Test that chunks for several documents are stored in one call."""
+        store.create_corpus(sample_corpus)
+        documents = [
+            Document(
+                id=f"doc-{i}", corpus_id=sample_corpus.id, text=f"Text {i}", content_hash=f"h{i}"
+            )
+            for i in range(2)
+        ]
+        store.add_documents(documents)
+        chunks_by_document = {
+            document.id: [
+                Chunk(
+                    id=f"{document.id}::chunk_0",
+                    document_id=document.id,
+                    corpus_id=sample_corpus.id,
+                    text=document.text,
+                    start_offset=0,
+                    end_offset=len(document.text),
+                )
+            ]
+            for document in documents
+        }
+
+        store.add_chunks_batch(chunks_by_document)
+
+        for document_id, chunks in chunks_by_document.items():
+            assert store.get_chunks(document_id) == chunks
+
+    def test_add_chunks_batch_unknown_document_is_atomic(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that a batch referencing a missing document writes nothing."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+
+        def chunk_for(document_id: str) -> Chunk:
+            return Chunk(
+                id=f"{document_id}::chunk_0",
+                document_id=document_id,
+                corpus_id=sample_corpus.id,
+                text="Text",
+                start_offset=0,
+                end_offset=4,
+            )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.add_chunks_batch(
+                {
+                    sample_document.id: [chunk_for(sample_document.id)],
+                    "missing-doc": [chunk_for("missing-doc")],
+                }
+            )
+
+        assert store.get_chunks(sample_document.id) == []
+
+    def test_get_chunks_missing(self, store: SQLiteCorpusStore):
+        """Test that documents without stored chunks return an empty list."""
+        assert store.get_chunks("nonexistent-id") == []
+
+    def test_delete_corpus_cascades_to_chunks(
+        self, store: SQLiteCorpusStore, sample_corpus: Corpus, sample_document: Document
+    ):
+        """Test that deleting a corpus removes its packed chunks."""
+        store.create_corpus(sample_corpus)
+        store.add_document(sample_document)
+        store.add_chunks(
+            sample_document.id,
+            [
+                Chunk(
+                    id=f"{sample_document.id}::chunk_0",
+                    document_id=sample_document.id,
+                    corpus_id=sample_corpus.id,
+                    text="Chunk",
+                    start_offset=0,
+                    end_offset=5,
+                )
+            ],
+        )
+
+        store.delete_corpus(sample_corpus.id)
+
+        assert store.get_chunks(sample_document.id) == []
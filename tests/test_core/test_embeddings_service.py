@@ -1,6 +1,7 @@
 import asyncio
 
 from alavista.core.embeddings.service import (
+    CachingEmbeddingService,
     DeterministicFallbackEmbeddingService,
     EmbeddingError,
     SentenceTransformersEmbeddingService,
@@ -37,3 +38,24 @@ def test_sentence_transformers_installed():
     assert len(out) == 3
     # all-MiniLM-L6-v2 produces 384-dim vectors
     assert all(len(v) == 384 for v in out)
+
+
+def test_caching_service_embeds_only_misses():
+    inner = DeterministicFallbackEmbeddingService(dim=8)
+    calls = []
+
+    class Recording:
+        async def embed_texts(self, texts):
+            calls.append(list(texts))
+            return await inner.embed_texts(texts)
+
+    svc = CachingEmbeddingService(Recording(), max_entries=2)
+    first = asyncio.run(svc.embed_texts(["a", "b", "a"]))
+    second = asyncio.run(svc.embed_texts(["b", "c"]))
+
+    assert calls == [["a", "b"], ["c"]]
+    assert first == asyncio.run(inner.embed_texts(["a", "b", "a"]))
+    assert second == asyncio.run(inner.embed_texts(["b", "c"]))
+    # "a" was least recently used, so it was evicted
+    asyncio.run(svc.embed_texts(["a"]))
+    assert calls[-1] == ["a"]
@@ -3,8 +3,10 @@ Tests for IngestionService.
 """
 
 import asyncio
+from collections.abc import Generator
 from pathlib import Path
 
+import blake3
 import pytest
 
 from alavista.core.corpus_store import SQLiteCorpusStore
@@ -14,7 +16,7 @@ from alavista.core.ingestion_service import (
     IngestionService,
     UnsupportedFormatError,
 )
-from alavista.core.models import Corpus
+from alavista.core.models import Chunk, Corpus
 from alavista.vector import InMemoryVectorSearchService
 
 
@@ -30,10 +32,12 @@ class TestIngestionService:
     """Test suite for IngestionService."""
 
     @pytest.fixture
-    def store(self, tmp_path: Path) -> SQLiteCorpusStore:
+    def store(self, tmp_path: Path) -> Generator[SQLiteCorpusStore, None, None]:
         """Create a test corpus store."""
         db_path = tmp_path / "test_corpus.db"
-        return SQLiteCorpusStore(db_path)
+        store = SQLiteCorpusStore(db_path, fast_mode=True)
+        yield store
+        store.close()
 
     @pytest.fixture
     def service(self, store: SQLiteCorpusStore) -> IngestionService:
@@ -111,6 +115,33 @@ class TestIngestionService:
         # Chunks should also be the same
         assert len(chunks1) == len(chunks2)
 
+    def test_chunks_are_stored(
+        self, service: IngestionService, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that ingested chunks are persisted and reused for duplicates."""
+        text = "First paragraph.\n\nSecond paragraph."
+
+        doc, chunks = service.ingest_text(corpus.id, text)
+        _, dup_chunks = service.ingest_text(corpus.id, text)
+
+        assert store.get_chunks(doc.id) == chunks
+        assert dup_chunks == chunks
+
+    def test_large_text_hash_matches_single_threaded(self):
+        """Test that multithreaded hashing of large texts yields the same digest."""
+        text = "word " * 300_000
+
+        assert IngestionService._compute_hash(text) == blake3.blake3(text.encode()).hexdigest()
+
+    def test_chunks_match_validated_models(
+        self, service: IngestionService, corpus: Corpus
+    ):
+        """Test that unvalidated chunk construction matches validated models."""
+        _, chunks = service.ingest_text(corpus.id, "First paragraph.\n\nSecond paragraph.")
+
+        for chunk in chunks:
+            assert Chunk.model_validate(chunk.model_dump()) == chunk
+
     def test_deduplication_ignores_whitespace(
         self, service: IngestionService, corpus: Corpus
     ):
@@ -208,6 +239,27 @@ class TestIngestionService:
         assert "markdown" in doc.text
         assert doc.metadata["file_format"] == ".md"
 
+    def test_ingest_file_latin1_fallback(
+        self, service: IngestionService, corpus: Corpus, tmp_path: Path
+    ):
+        """Test that non-UTF-8 files are decoded as latin-1."""
+        file_path = tmp_path / "legacy.txt"
+        file_path.write_bytes("Caf\u00e9 r\u00e9sum\u00e9".encode("latin-1"))
+
+        doc, _ = service.ingest_file(corpus.id, file_path)
+
+        assert doc.text == "Caf\u00e9 r\u00e9sum\u00e9"
+
+    def test_ingest_empty_file(
+        self, service: IngestionService, corpus: Corpus, tmp_path: Path
+    ):
+        """Test that an empty file is rejected as empty text."""
+        file_path = tmp_path / "empty.txt"
+        file_path.write_bytes(b"")
+
+        with pytest.raises(IngestionError, match="empty"):
+            service.ingest_file(corpus.id, file_path)
+
     def test_ingest_file_not_found(
         self, service: IngestionService, corpus: Corpus
     ):
@@ -226,6 +278,55 @@ class TestIngestionService:
         with pytest.raises(UnsupportedFormatError):
             service.ingest_file(corpus.id, file_path)
 
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_ingest_files(
+        self,
+        service: IngestionService,
+        store: SQLiteCorpusStore,
+        corpus: Corpus,
+        tmp_path: Path,
+        max_workers: int,
+    ):
+        """Test that several files are ingested in order and deduplicated."""
+        paths = []
+        for name, text in [("a.txt", "Alpha text."), ("b.md", "# Beta"), ("c.txt", "Alpha  text.")]:
+            path = tmp_path / name
+            path.write_text(text)
+            paths.append(path)
+
+        results = service.ingest_files(
+            corpus.id, paths, metadata={"batch": "x"}, max_workers=max_workers
+        )
+
+        assert [doc.metadata["file_name"] for doc, _ in results] == ["a.txt", "b.md", "a.txt"]
+        assert results[2][0].id == results[0][0].id
+        assert all(doc.metadata["batch"] == "x" for doc, _ in results)
+        assert len(store.list_documents(corpus.id)) == 2
+        assert store.get_chunks(results[1][0].id) == results[1][1]
+
+    def test_ingest_files_unsupported_format(
+        self, service: IngestionService, corpus: Corpus, tmp_path: Path
+    ):
+        """Test that an unsupported file is rejected before any file is ingested."""
+        good = tmp_path / "good.txt"
+        good.write_text("Fine.")
+        bad = tmp_path / "bad.pdf"
+        bad.write_text("PDF content")
+
+        with pytest.raises(UnsupportedFormatError):
+            service.ingest_files(corpus.id, [good, bad])
+
+    def test_ingest_files_empty_file(
+        self, service: IngestionService, corpus: Corpus, tmp_path: Path
+    ):
+        """Test that worker errors surface as IngestionError."""
+        paths = [tmp_path / "one.txt", tmp_path / "empty.txt"]
+        paths[0].write_text("Some text.")
+        paths[1].write_bytes(b"")
+
+        with pytest.raises(IngestionError, match="empty"):
+            service.ingest_files(corpus.id, paths, max_workers=2)
+
     def test_ingest_file_with_metadata(
         self, service: IngestionService, corpus: Corpus, tmp_path: Path
     ):
@@ -276,6 +377,33 @@ class TestIngestionService:
         # Small chunks should produce more chunks
         assert len(small_chunks) > len(large_chunks)
 
+    def test_sliding_window_chunking(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that a stride switches ingestion to overlapping windows."""
+        service = IngestionService(corpus_store=store, max_chunk_size=100, stride=75)
+        text = "word " * 100
+
+        doc, chunks = service.ingest_text(corpus.id, text)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk.text) <= 100
+            assert chunk.text == doc.text[chunk.start_offset:chunk.end_offset]
+        assert chunks[1].start_offset - chunks[0].start_offset == 75
+
+    def test_sliding_window_offsets_index_document_text(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that window offsets index the stored text, which is not re-normalized."""
+        service = IngestionService(corpus_store=store, max_chunk_size=20, stride=10)
+        text = "alpha beta\n\n \n\ngamma delta epsilon zeta"
+
+        doc, chunks = service.ingest_text(corpus.id, text)
+
+        for chunk in chunks:
+            assert chunk.text == doc.text[chunk.start_offset:chunk.end_offset]
+
     def test_unicode_handling(
         self, service: IngestionService, corpus: Corpus
     ):
@@ -323,3 +451,201 @@ class TestIngestionService:
 
         hits = _run(vector_svc.search(corpus.id, _run(embed_svc.embed_texts(["Vector search"]))[0], k=1))
         assert hits
+
+    def test_unchanged_chunks_are_not_re_embedded(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Ensure only chunks with new content are embedded on re-ingest."""
+
+        class RecordingEmbeddingService:
+            def __init__(self):
+                self.inner = DeterministicFallbackEmbeddingService(dim=8)
+                self.calls: list[list[str]] = []
+
+            async def embed_texts(self, texts):
+                self.calls.append(list(texts))
+                return await self.inner.embed_texts(texts)
+
+        embed_svc = RecordingEmbeddingService()
+        service = IngestionService(
+            corpus_store=store,
+            min_chunk_size=0,
+            embedding_service=embed_svc,
+            vector_search_service=InMemoryVectorSearchService(),
+        )
+
+        service.ingest_text(corpus.id, "First paragraph.\n\nSecond paragraph.")
+        service.ingest_text(corpus.id, "First paragraph.\n\nEdited paragraph.")
+
+        assert embed_svc.calls == [
+            ["First paragraph.", "Second paragraph."],
+            ["Edited paragraph."],
+        ]
+
+    def test_shared_chunk_text_is_indexed_for_each_document(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Ensure a reused embedding is still indexed under the new document's chunk."""
+        embed_svc = DeterministicFallbackEmbeddingService(dim=8)
+        vector_svc = InMemoryVectorSearchService()
+        service = IngestionService(
+            corpus_store=store,
+            min_chunk_size=0,
+            embedding_service=embed_svc,
+            vector_search_service=vector_svc,
+        )
+
+        doc1, _ = service.ingest_text(corpus.id, "Shared paragraph.\n\nOnly in one.")
+        doc2, _ = service.ingest_text(corpus.id, "Shared paragraph.\n\nOnly in two.")
+
+        query = _run(embed_svc.embed_texts(["Shared paragraph."]))[0]
+        hits = _run(vector_svc.search(corpus.id, query, k=2))
+        assert {hit.document_id for hit in hits} == {doc1.id, doc2.id}
+
+    def test_delete_corpus_drops_cached_vectors(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Ensure deleting a corpus forgets the embeddings cached for it."""
+        service = IngestionService(
+            corpus_store=store,
+            embedding_service=DeterministicFallbackEmbeddingService(dim=8),
+            vector_search_service=InMemoryVectorSearchService(),
+        )
+        service.ingest_text(corpus.id, "Cached content.")
+        assert service._chunk_vectors[corpus.id]
+
+        assert service.delete_corpus(corpus.id) is True
+        assert corpus.id not in service._chunk_vectors
+        assert store.get_corpus(corpus.id) is None
+
+    def test_near_duplicate_rejection(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that near-duplicates resolve to the existing document when enabled."""
+        service = IngestionService(corpus_store=store, near_duplicate_threshold=0.8)
+        text = " ".join(f"word{i}" for i in range(200))
+
+        doc1, _ = service.ingest_text(corpus.id, text)
+        doc2, _ = service.ingest_text(corpus.id, text.replace("word100", "changed"))
+        doc3, _ = service.ingest_text(corpus.id, "An entirely different document.")
+
+        assert doc2.id == doc1.id
+        assert doc3.id != doc1.id
+        assert len(store.list_documents(corpus.id)) == 2
+
+    def test_near_duplicate_index_built_from_existing_documents(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that documents stored before the service started are matched."""
+        text = " ".join(f"word{i}" for i in range(200))
+        doc1, _ = IngestionService(corpus_store=store).ingest_text(corpus.id, text)
+
+        service = IngestionService(corpus_store=store, near_duplicate_threshold=0.8)
+        doc2, _ = service.ingest_text(corpus.id, text.replace("word100", "changed"))
+
+        assert doc2.id == doc1.id
+
+    def test_buffered_ingestion_flushes_on_size(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that buffered documents are written once the buffer is full."""
+        service = IngestionService(corpus_store=store, max_pending=3)
+
+        service.ingest_text(corpus.id, "First document.")
+        service.ingest_text(corpus.id, "Second document.")
+        assert store.list_documents(corpus.id) == []
+
+        service.ingest_text(corpus.id, "Third document.")
+        assert len(store.list_documents(corpus.id)) == 3
+
+    def test_buffered_ingestion_explicit_flush_and_dedup(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that pending documents deduplicate and are written by flush()."""
+        service = IngestionService(corpus_store=store, max_pending=10)
+
+        doc1, _ = service.ingest_text(corpus.id, "Buffered document.")
+        doc2, _ = service.ingest_text(corpus.id, "Buffered   document.")
+        assert doc1.id == doc2.id
+
+        service.flush()
+
+        stored = store.list_documents(corpus.id)
+        assert [d.id for d in stored] == [doc1.id]
+
+    def test_buffered_ingestion_flushes_on_age(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that an expired flush interval writes the buffer on the next ingest."""
+        service = IngestionService(corpus_store=store, max_pending=10, max_pending_age=0.0)
+
+        service.ingest_text(corpus.id, "Old enough to flush.")
+
+        assert len(store.list_documents(corpus.id)) == 1
+
+    def test_failed_flush_keeps_documents_buffered(
+        self, store: SQLiteCorpusStore, corpus: Corpus, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a failed write leaves the buffer intact for a retry."""
+        service = IngestionService(
+            corpus_store=store, max_pending=10, near_duplicate_threshold=0.8
+        )
+        text = " ".join(f"word{i}" for i in range(200))
+        doc1, _ = service.ingest_text(corpus.id, text)
+
+        def fail(documents):
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(store, "add_documents", fail)
+        with pytest.raises(IngestionError):
+            service.flush()
+        monkeypatch.undo()
+
+        # Still buffered: near-duplicates resolve to it and it is not yet indexed
+        doc2, _ = service.ingest_text(corpus.id, text.replace("word100", "changed"))
+        assert doc2.id == doc1.id
+        assert len(service._near_duplicate_indexes[corpus.id]) == 0
+
+        service.flush()
+        assert [d.id for d in store.list_documents(corpus.id)] == [doc1.id]
+        assert len(service._near_duplicate_indexes[corpus.id]) == 1
+
+    def test_closing_writes_buffered_documents(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that leaving the service's context writes the trailing batch."""
+        with IngestionService(corpus_store=store, max_pending=10) as service:
+            service.ingest_text(corpus.id, "Trailing document.")
+            assert store.list_documents(corpus.id) == []
+
+        assert len(store.list_documents(corpus.id)) == 1
+
+    def test_ingest_texts(
+        self, service: IngestionService, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test batch ingestion of several texts."""
+        results = service.ingest_texts(
+            corpus.id,
+            [("First text.", {"title": "One"}), ("Second text.", None), ("First  text.", None)],
+        )
+
+        assert [doc.metadata.get("title") for doc, _ in results] == ["One", None, "One"]
+        assert results[2][0].id == results[0][0].id
+        assert len(store.list_documents(corpus.id)) == 2
+        assert store.get_chunks(results[1][0].id) == results[1][1]
+        assert service.max_pending == 0
+
+    def test_bulk_ingest_writes_on_exit(
+        self, store: SQLiteCorpusStore, corpus: Corpus
+    ):
+        """Test that bulk mode batches writes and flushes everything on exit."""
+        service = IngestionService(corpus_store=store)
+
+        with service.bulk_ingest(batch_size=2) as bulk:
+            for i in range(3):
+                bulk.ingest_text(corpus.id, f"Bulk document {i}.")
+            # First batch of two written, third still buffered
+            assert len(store.list_documents(corpus.id)) == 2
+
+        assert len(store.list_documents(corpus.id)) == 3
+        assert service.max_pending == 0
@@ -2,9 +2,10 @@
 Tests for logging configuration.
 """
 
+import json
 import logging
 
-from alavista.core.logging import configure_logging, get_logger
+from alavista.core.logging import JsonFormatter, configure_logging, get_logger
 
 
 class TestConfigureLogging:
@@ -36,6 +37,29 @@ class TestConfigureLogging:
         # Check that formatter contains JSON-like structure
         assert '"timestamp"' in formatter._fmt or 'timestamp' in formatter._fmt
 
+    def test_json_format_escapes_message(self):
+        """Test that JSON records stay valid when the message contains quotes."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            "test_json", logging.INFO, __file__, 1, 'said "hi"\nbye', None, None
+        )
+
+        payload = json.loads(formatter.format(record))
+
+        assert payload["message"] == 'said "hi"\nbye'
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "test_json"
+        assert "timestamp" in payload
+
+    def test_formatter_reused_across_configurations(self):
+        """Test that reconfiguring reuses the cached formatter instance."""
+        configure_logging(json_format=True)
+        first = logging.getLogger().handlers[0].formatter
+        configure_logging(json_format=True)
+        second = logging.getLogger().handlers[0].formatter
+
+        assert first is second
+
     def test_standard_format(self):
         """Test that standard format is used by default."""
         configure_logging(json_format=False)
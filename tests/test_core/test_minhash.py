@@ -0,0 +1,73 @@
+"""
+Tests for MinHash signatures and LSH near-duplicate lookup.
+"""
+
+from alavista.core.minhash import (
+    NUM_PERM,
+    MinHashLSH,
+    estimate_jaccard,
+    minhash_signature,
+    shingles,
+)
+
+BASE_TEXT = " ".join(f"word{i}" for i in range(200))
+
+
+class TestShingles:
+    """Test suite for word shingling."""
+
+    def test_word_ngrams(self):
+        """Test that shingles are lowercase word 5-grams."""
+        result = shingles("A b c d e F")
+
+        assert result == {"a b c d e", "b c d e f"}
+
+    def test_short_text_single_shingle(self):
+        """Test that texts shorter than the shingle size yield one shingle."""
+        assert shingles("Hello world") == {"hello world"}
+
+    def test_empty_text(self):
+        """Test that text without words yields no shingles."""
+        assert shingles("  ...  ") == set()
+
+
+class TestMinHashSignature:
+    """Test suite for MinHash signatures."""
+
+    def test_signature_shape_and_determinism(self):
+        """Test that signatures are fixed-length and deterministic."""
+        sig1 = minhash_signature(BASE_TEXT)
+        sig2 = minhash_signature(BASE_TEXT)
+
+        assert sig1.shape == (NUM_PERM,)
+        assert (sig1 == sig2).all()
+
+    def test_similarity_tracks_overlap(self):
+        """Test that near-duplicates score high and unrelated texts score low."""
+        near = BASE_TEXT.replace("word100", "changed")
+        other = " ".join(f"other{i}" for i in range(200))
+
+        base_sig = minhash_signature(BASE_TEXT)
+
+        assert estimate_jaccard(base_sig, minhash_signature(near)) > 0.8
+        assert estimate_jaccard(base_sig, minhash_signature(other)) < 0.2
+
+    def test_no_words_returns_none(self):
+        """Test that text without words has no signature."""
+        assert minhash_signature("   ") is None
+
+
+class TestMinHashLSH:
+    """Test suite for the LSH index."""
+
+    def test_query_finds_near_duplicate(self):
+        """Test that a near-duplicate is returned and unrelated text is not."""
+        lsh = MinHashLSH(threshold=0.8)
+        lsh.insert("doc1", minhash_signature(BASE_TEXT))
+
+        near = BASE_TEXT.replace("word100", "changed")
+        other = " ".join(f"other{i}" for i in range(200))
+
+        assert lsh.query(minhash_signature(near)) == "doc1"
+        assert lsh.query(minhash_signature(other)) is None
+        assert len(lsh) == 1
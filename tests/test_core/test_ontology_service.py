@@ -22,6 +22,8 @@ def test_load_and_lookup(tmp_path):
     )
     svc = OntologyService(ontology_path)
     assert "Person" in svc.list_entity_types()
+    assert svc.unknown_entity_types(["Person", "Zeta", "Alpha", "Zeta"]) == ["Alpha", "Zeta"]
+    assert svc.unknown_relation_types(["APPEARS_IN"]) == []
     assert svc.resolve_entity_type("doc") == "Document"
     assert svc.validate_relation("Person", "APPEARS_IN", "Document") is True
     assert svc.validate_relation("Document", "APPEARS_IN", "Person") is False
@@ -30,3 +32,62 @@ def test_load_and_lookup(tmp_path):
 def test_missing_file_raises(tmp_path):
     with pytest.raises(OntologyError):
         OntologyService(tmp_path / "missing.json")
+
+
+def test_alias_collision_prefers_first_entity(tmp_path):
+    ontology_path = tmp_path / "ont.json"
+    ontology_path.write_text(
+        """{
+            "entities": {
+                "Person": {"aliases": ["Agent"]},
+                "Agent": {"aliases": ["Person"]}
+            },
+            "relations": {}
+        }"""
+    )
+    svc = OntologyService(ontology_path)
+    assert svc.resolve_entity_type("AGENT") == "Person"
+    assert svc.resolve_entity_type("person") == "Person"
+    assert svc.resolve_entity_type("unknown") is None
+    assert svc.validate_relation("Person", "MISSING", "Agent") is False
+
+
+def test_invalid_json_raises(tmp_path):
+    ontology_path = tmp_path / "ont.json"
+    ontology_path.write_text("{not json")
+    with pytest.raises(OntologyError):
+        OntologyService(ontology_path)
+
+
+def test_load_without_orjson(tmp_path, monkeypatch):
+    from alavista.ontology import service
+
+    monkeypatch.setattr(service, "_HAS_ORJSON", False)
+    ontology_path = tmp_path / "ont.json"
+    ontology_path.write_text('{"entities": {"Person": {}}, "relations": {}}')
+    assert OntologyService(ontology_path).list_entity_types() == ["Person"]
+
+
+def test_load_reuses_parsed_file_until_it_changes(tmp_path):
+    ontology_path = tmp_path / "ont.json"
+    ontology_path.write_text('{"entities": {"Person": {}}, "relations": {}}')
+    first = OntologyService(ontology_path)
+    assert OntologyService(ontology_path)._data is first._data
+
+    ontology_path.write_text('{"entities": {"Person": {}, "Place": {}}, "relations": {}}')
+    assert OntologyService(ontology_path).list_entity_types() == ["Person", "Place"]
+
+
+def test_entity_info_copies_do_not_leak_between_services(tmp_path):
+    ontology_path = tmp_path / "ont.json"
+    ontology_path.write_text('{"entities": {"Person": {"aliases": ["human"]}}, "relations": {}}')
+    first = OntologyService(ontology_path)
+
+    info = first.get_entity_info("Person")
+    info["aliases"].append("individual")
+    info["extra"] = True
+
+    assert first.get_entity_info("Person") == {"aliases": ["human"]}
+    assert OntologyService(ontology_path).get_entity_info("Person") == {"aliases": ["human"]}
+    with pytest.raises(TypeError):
+        first._data["entities"]["Place"] = {}
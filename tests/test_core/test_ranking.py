@@ -0,0 +1,33 @@
+"""
+Tests for top-k selection.
+"""
+
+import numpy as np
+
+from alavista.core.ranking import top_k_indices
+
+
+class TestTopKIndices:
+    """Test suite for top_k_indices."""
+
+    def test_matches_stable_full_sort(self):
+        """Test that partial selection equals a stable full sort truncated to k."""
+        rng = np.random.default_rng(0)
+        scores = rng.integers(0, 5, size=200).astype(np.float64)
+        candidates = np.arange(len(scores))
+        expected = candidates[np.argsort(-scores, kind="stable")]
+
+        for k in (0, 1, 7, 50, 200):
+            assert top_k_indices(scores, candidates, k).tolist() == expected[:k].tolist()
+
+    def test_ties_at_cutoff_keep_lowest_indices(self):
+        """Test that ties at the k-th score are filled in ascending index order."""
+        scores = np.array([1.0, 3.0, 1.0, 1.0, 2.0])
+
+        assert top_k_indices(scores, np.arange(5), 3).tolist() == [1, 4, 0]
+
+    def test_candidate_subset(self):
+        """Test ranking only a subset of positions."""
+        scores = np.array([9.0, 0.5, 0.0, 0.7])
+
+        assert top_k_indices(scores, np.array([1, 3]), 1).tolist() == [3]
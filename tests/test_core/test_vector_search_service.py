@@ -2,6 +2,7 @@ import asyncio
 
 import pytest
 
+from alavista.core.container import Container
 from alavista.vector import InMemoryVectorSearchService, VectorSearchError
 
 
@@ -78,3 +79,90 @@ def test_duplicate_keys_error():
     _run(svc.index_embeddings("c5", [("doc1", "chunk1", [1.0, 0.0])]))
     with pytest.raises(VectorSearchError):
         _run(svc.index_embeddings("c5", [("doc1", "chunk1", [0.5, 0.5])]))
+
+
+def test_top_k_returns_highest_scores_in_order():
+    svc = InMemoryVectorSearchService()
+    items = [(f"doc{i}", f"chunk{i}", [float(i), 1.0]) for i in range(50)]
+    _run(svc.index_embeddings("c6", items))
+
+    hits = _run(svc.search("c6", [1.0, 0.0], k=3))
+    assert [h.document_id for h in hits] == ["doc49", "doc48", "doc47"]
+    assert hits[0].score >= hits[1].score >= hits[2].score
+
+
+def test_failed_batch_leaves_index_unchanged():
+    svc = InMemoryVectorSearchService()
+    _run(svc.index_embeddings("c7", [("doc1", "chunk1", [1.0, 0.0])]))
+    with pytest.raises(VectorSearchError):
+        _run(
+            svc.index_embeddings(
+                "c7",
+                [("doc2", "chunk2", [0.0, 1.0]), ("doc3", "chunk3", [0.0, 0.0])],
+            )
+        )
+
+    hits = _run(svc.search("c7", [0.0, 1.0], k=5))
+    assert [h.document_id for h in hits] == ["doc1"]
+
+
+def test_ids_stay_aligned_across_growth():
+    svc = InMemoryVectorSearchService()
+    for batch in range(5):
+        items = [
+            (f"doc{batch}", f"chunk{batch}_{i}", [float(batch * 10 + i), 1.0]) for i in range(10)
+        ]
+        _run(svc.index_embeddings("c8", items))
+
+    hits = _run(svc.search("c8", [1.0, 0.0], k=2))
+    assert [(h.document_id, h.chunk_id) for h in hits] == [("doc4", "chunk4_9"), ("doc4", "chunk4_8")]
+
+
+@pytest.mark.parametrize("quantization", ["float16", "int8"])
+def test_quantized_storage_preserves_ranking(quantization):
+    svc = InMemoryVectorSearchService(quantization=quantization)
+    items = [(f"doc{i}", f"chunk{i}", [1.0, i / 10, 0.5]) for i in range(30)]
+    _run(svc.index_embeddings("c9", items))
+
+    hits = _run(svc.search("c9", [0.0, 1.0, 0.0], k=3))
+    assert [h.document_id for h in hits] == ["doc29", "doc28", "doc27"]
+    assert hits[0].score == pytest.approx(2.9 / (2.9**2 + 1.25) ** 0.5, abs=1e-2)
+
+
+def test_unknown_quantization_errors():
+    with pytest.raises(VectorSearchError):
+        InMemoryVectorSearchService(quantization="int4")
+
+
+@pytest.mark.parametrize("quantization", ["none", "int8"])
+def test_persisted_vectors_reopen(tmp_path, quantization):
+    svc = InMemoryVectorSearchService(quantization=quantization, root_dir=tmp_path)
+    _run(svc.index_embeddings("c10", [("doc1", "chunk1", [1.0, 0.0])]))
+    _run(svc.index_embeddings("c10", [("doc2", "chunk2", [0.0, 1.0])]))
+
+    reopened = InMemoryVectorSearchService(quantization=quantization, root_dir=tmp_path)
+    hits = _run(reopened.search("c10", [0.0, 1.0], k=2))
+    assert [h.document_id for h in hits] == ["doc2", "doc1"]
+    assert hits[0].score == pytest.approx(1.0, abs=1e-2)
+
+    # Appends after reopening land in the same mapped file
+    _run(reopened.index_embeddings("c10", [("doc3", "chunk3", [1.0, 1.0])]))
+    with pytest.raises(VectorSearchError):
+        _run(reopened.index_embeddings("c10", [("doc1", "chunk1", [1.0, 0.0])]))
+
+    hits = _run(InMemoryVectorSearchService(root_dir=tmp_path).search("c10", [1.0, 1.0], k=1))
+    assert [h.document_id for h in hits] == ["doc3"]
+    assert (tmp_path / "c10.vectors").stat().st_size % (2 << 20) == 0
+
+
+def test_container_memory_backend_persists_under_vector_index_dir(tmp_path):
+    settings = Container.create_settings(
+        data_dir=tmp_path, vector_index_dir=tmp_path / "vectors", vector_backend="memory"
+    )
+    svc = Container.create_vector_search_service(settings)
+    _run(svc.index_embeddings("c12", [("doc1", "chunk1", [1.0, 0.0])]))
+
+    reopened = Container.create_vector_search_service(settings)
+    hits = _run(reopened.search("c12", [1.0, 0.0], k=1))
+    assert [h.document_id for h in hits] == ["doc1"]
+    assert (tmp_path / "vectors" / "memory" / "c12.vectors").exists()
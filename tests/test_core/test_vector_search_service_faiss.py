@@ -1,6 +1,7 @@
 import asyncio
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from alavista.vector import (
@@ -63,3 +64,97 @@ def test_faiss_dimension_mismatch(tmp_path: Path):
     _run(svc.index_embeddings("c4", [("doc1", "chunk1", [1.0, 2.0, 3.0])]))
     with pytest.raises(VectorSearchError):
         _run(svc.search("c4", [1.0, 2.0], k=1))
+
+
+def test_faiss_normalized_scores_are_cosine(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path, normalize=True)
+    _run(
+        svc.index_embeddings(
+            "c5",
+            [
+                ("doc1", "chunk1", [3.0, 0.0]),
+                ("doc2", "chunk2", [2.0, 2.0]),
+            ],
+        )
+    )
+
+    hits = _run(svc.search("c5", [5.0, 0.0], k=2))
+    assert hits[0].document_id == "doc1"
+    assert hits[0].score == pytest.approx(1.0, abs=1e-6)
+    assert hits[1].score == pytest.approx(2**-0.5, abs=1e-6)
+
+
+def test_faiss_zero_vector_rejected(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path, normalize=True)
+    with pytest.raises(VectorSearchError):
+        _run(svc.index_embeddings("c6", [("doc1", "chunk1", [0.0, 0.0])]))
+
+
+def test_faiss_hnsw_index_and_search(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path, index_type="hnsw")
+    _run(
+        svc.index_embeddings(
+            "c7",
+            [
+                ("doc1", "chunk1", [1.0, 0.0]),
+                ("doc2", "chunk2", [0.0, 1.0]),
+            ],
+        )
+    )
+
+    hits = _run(svc.search("c7", [0.9, 0.1], k=2))
+    assert len(hits) == 2
+    assert hits[0].document_id == "doc1"
+
+    # Persisted index keeps its type when reloaded
+    svc2 = FaissVectorSearchService(root_dir=tmp_path)
+    hits = _run(svc2.search("c7", [0.1, 0.9], k=1))
+    assert hits[0].document_id == "doc2"
+
+
+def test_faiss_ivfpq_index_and_search(tmp_path: Path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((256, 8)).astype(np.float32)
+    svc = FaissVectorSearchService(root_dir=tmp_path, index_type="ivfpq", ivf_nlist=4)
+    _run(
+        svc.index_embeddings(
+            "c8",
+            [(f"doc{i}", f"chunk{i}", vec.tolist()) for i, vec in enumerate(vectors)],
+        )
+    )
+
+    hits = _run(svc.search("c8", vectors[7].tolist(), k=5))
+    assert 0 < len(hits) <= 5
+    assert "doc7" in {h.document_id for h in hits}
+
+
+def test_faiss_ivfpq_requires_training_batch(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path, index_type="ivfpq")
+    with pytest.raises(VectorSearchError):
+        _run(svc.index_embeddings("c9", [("doc1", "chunk1", [1.0, 0.0, 0.0, 0.0])]))
+
+
+def test_faiss_ivfpq_requires_dimension_divisible_by_4(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path, index_type="ivfpq")
+    with pytest.raises(VectorSearchError, match="divisible by 4"):
+        _run(svc.index_embeddings("c11", [("doc1", "chunk1", [1.0] * 10)]))
+
+
+def test_faiss_unknown_index_type(tmp_path: Path):
+    with pytest.raises(VectorSearchError):
+        FaissVectorSearchService(root_dir=tmp_path, index_type="lsh")
+
+
+def test_faiss_bulk_defers_persistence(tmp_path: Path):
+    svc = FaissVectorSearchService(root_dir=tmp_path)
+    index_path = tmp_path / "c10.index"
+
+    with svc.bulk():
+        _run(svc.index_embeddings("c10", [("doc1", "chunk1", [1.0, 0.0])]))
+        _run(svc.index_embeddings("c10", [("doc2", "chunk2", [0.0, 1.0])]))
+        assert not index_path.exists()
+        assert len(_run(svc.search("c10", [1.0, 0.0], k=5))) == 2
+
+    assert index_path.exists()
+    svc2 = FaissVectorSearchService(root_dir=tmp_path)
+    assert len(_run(svc2.search("c10", [1.0, 0.0], k=5))) == 2
@@ -16,16 +16,9 @@ class TestEndToEndIngestion:
     """Test end-to-end ingestion workflows."""
 
     @pytest.fixture
-    def temp_data_dir(self, tmp_path: Path) -> Path:
-        """Create a temporary data directory."""
-        return tmp_path / "data"
-
-    @pytest.fixture
-    def corpus_store(self, temp_data_dir: Path) -> SQLiteCorpusStore:
-        """Create a corpus store for testing."""
-        db_path = temp_data_dir / "corpus.db"
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        return SQLiteCorpusStore(db_path)
+    def corpus_store(self, shared_corpus_store: SQLiteCorpusStore) -> SQLiteCorpusStore:
+        """Use the session-wide corpus store, reset after each test."""
+        return shared_corpus_store
 
     @pytest.fixture
     def ingestion_service(self, corpus_store: SQLiteCorpusStore) -> IngestionService:
@@ -66,16 +59,12 @@ class TestEndToEndIngestion:
         It also tests deduplication functionality.
         """
 
-        doc1, chunks1 = ingestion_service.ingest_text(
+        (doc1, chunks1), (doc2, chunks2) = ingestion_service.ingest_texts(
             corpus.id,
-            doc1_text,
-            metadata={"title": "Document 1", "author": "Test Author"},
-        )
-
-        doc2, chunks2 = ingestion_service.ingest_text(
-            corpus.id,
-            doc2_text,
-            metadata={"title": "Document 2", "author": "Test Author"},
+            [
+                (doc1_text, {"title": "Document 1", "author": "Test Author"}),
+                (doc2_text, {"title": "Document 2", "author": "Test Author"}),
+            ],
         )
 
         # Step 3: Verify documents are stored
@@ -89,11 +78,7 @@ class TestEndToEndIngestion:
         assert retrieved_doc2.id == doc2.id
 
         # Step 4: Verify listing documents
-        all_docs = corpus_store.list_documents(corpus.id)
-        assert len(all_docs) == 2
-        doc_ids = {d.id for d in all_docs}
-        assert doc1.id in doc_ids
-        assert doc2.id in doc_ids
+        assert corpus_store.list_document_ids(corpus.id) == {doc1.id, doc2.id}
 
         # Step 5: Verify chunks were created
         assert len(chunks1) >= 1
@@ -119,8 +104,7 @@ class TestEndToEndIngestion:
         assert doc1_duplicate.id == doc1.id
 
         # Should still only have 2 documents
-        all_docs = corpus_store.list_documents(corpus.id)
-        assert len(all_docs) == 2
+        assert len(corpus_store.list_document_ids(corpus.id)) == 2
 
     def test_multiple_corpora_isolation(
         self,
@@ -149,13 +133,8 @@ class TestEndToEndIngestion:
         )
 
         # Verify documents are in the correct corpus
-        corpus1_docs = corpus_store.list_documents(corpus1.id)
-        corpus2_docs = corpus_store.list_documents(corpus2.id)
-
-        assert len(corpus1_docs) == 1
-        assert len(corpus2_docs) == 1
-        assert corpus1_docs[0].id == doc1.id
-        assert corpus2_docs[0].id == doc2.id
+        assert corpus_store.list_document_ids(corpus1.id) == {doc1.id}
+        assert corpus_store.list_document_ids(corpus2.id) == {doc2.id}
 
         # Same content in different corpora should NOT deduplicate
         doc3, _ = ingestion_service.ingest_text(
@@ -167,8 +146,7 @@ class TestEndToEndIngestion:
         # Should create a new document (different corpus)
         assert doc3.id != doc1.id
 
-        corpus2_docs = corpus_store.list_documents(corpus2.id)
-        assert len(corpus2_docs) == 2
+        assert corpus_store.list_document_ids(corpus2.id) == {doc2.id, doc3.id}
 
     def test_file_ingestion_workflow(
         self,
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for MCP tool tests.
+"""
+
+import pytest
+
+from alavista.core.container import Container
+from alavista.core.corpus_store import SQLiteCorpusStore
+
+
+@pytest.fixture
+def memory_corpus_store() -> SQLiteCorpusStore:
+    """
+    Provide an isolated in-memory corpus store.
+
+    Returns:
+        SQLiteCorpusStore: Store backed by a private in-memory database
+    """
+    return Container.create_corpus_store(in_memory=True)
+
+
+@pytest.fixture
+def mock_corpus_store(
+    memory_corpus_store: SQLiteCorpusStore, monkeypatch: pytest.MonkeyPatch
+) -> SQLiteCorpusStore:
+    """
+    Provide an in-memory corpus store installed as the Container singleton.
+
+    Returns:
+        SQLiteCorpusStore: Store returned by Container.get_corpus_store for this test
+    """
+    monkeypatch.setattr(Container, "get_corpus_store", lambda: memory_corpus_store)
+    return memory_corpus_store
@@ -5,18 +5,22 @@ import pytest
 from interfaces.mcp.mcp_server import MCPServer, get_mcp_server
 
 
-def test_mcp_server_initialization():
+@pytest.fixture(scope="module")
+def server() -> MCPServer:
+    """Share one server across tests that only read its registry."""
+    return MCPServer()
+
+
+def test_mcp_server_initialization(server: MCPServer):
     """Test MCP server initializes and registers tools."""
-    server = MCPServer()
     assert len(server.tools) > 0
     assert "alavista.list_corpora" in server.tools
     assert "alavista.semantic_search" in server.tools
     assert "alavista.persona_query" in server.tools
 
 
-def test_list_tools():
+def test_list_tools(server: MCPServer):
     """Test listing all registered tools."""
-    server = MCPServer()
     tools = server.list_tools()
 
     assert isinstance(tools, list)
@@ -25,17 +29,14 @@ def test_list_tools():
     assert "alavista.graph_find_entity" in tools
 
 
-def test_execute_tool_not_found():
+def test_execute_tool_not_found(server: MCPServer):
     """Test error handling for unknown tool."""
-    server = MCPServer()
-
     with pytest.raises(ValueError, match="Tool .* not found"):
         server.execute_tool("nonexistent.tool", {})
 
 
-def test_get_tool_info():
+def test_get_tool_info(server: MCPServer):
     """Test getting tool information."""
-    server = MCPServer()
     info = server.get_tool_info()
 
     assert isinstance(info, dict)
@@ -52,9 +53,16 @@ def test_get_mcp_server_singleton():
     assert server1 is server2
 
 
-def test_all_tools_registered():
+def test_servers_do_not_share_tool_dicts():
+    """Test that each server gets its own copy of the tool registry."""
+    first = MCPServer()
+    first.tools["custom.tool"] = lambda args: {}
+
+    assert "custom.tool" not in MCPServer().tools
+
+
+def test_all_tools_registered(server: MCPServer):
     """Test that all expected tools are registered."""
-    server = MCPServer()
     expected_tools = [
         "alavista.list_corpora",
         "alavista.get_corpus",
@@ -72,5 +80,9 @@ def test_all_tools_registered():
         "alavista.ingest_file",
     ]
 
-    for tool_name in expected_tools:
-        assert tool_name in server.tools, f"Tool {tool_name} not registered"
+    assert set(expected_tools) - server.tools.keys() == set()
+
+
+def test_tool_info_matches_registry(server: MCPServer):
+    """Test that every registered tool is described, and only those."""
+    assert server.get_tool_info().keys() == server.tools.keys()
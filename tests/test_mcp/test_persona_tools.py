@@ -2,7 +2,6 @@
 
 import pytest
 
-from alavista.core.container import Container
 from interfaces.mcp.persona_tools import list_personas_tool, persona_query_tool
 
 
@@ -42,29 +41,18 @@ def test_persona_query_tool_missing_corpus_id():
         persona_query_tool({"persona_id": "test", "question": "test"})
 
 
-def test_persona_query_tool_unknown_persona(tmp_path):
+def test_persona_query_tool_unknown_persona(mock_corpus_store):
     """Test error with unknown persona."""
     from alavista.core.models import Corpus
-
-    corpus_store = Container.create_corpus_store(
-        Container.create_settings(data_dir=tmp_path)
-    )
+    from alavista.personas.persona_runtime import PersonaRuntimeError
 
     # Create test corpus
     corpus = Corpus(id="test", type="research", name="Test")
-    corpus_store.create_corpus(corpus)
-
-    original_get = Container.get_corpus_store
-    Container.get_corpus_store = lambda: corpus_store
-
-    try:
-        from alavista.personas.persona_runtime import PersonaRuntimeError
-
-        with pytest.raises(PersonaRuntimeError, match="not found"):
-            persona_query_tool({
-                "persona_id": "nonexistent",
-                "question": "What is corruption?",
-                "corpus_id": "test",
-            })
-    finally:
-        Container.get_corpus_store = original_get
+    mock_corpus_store.create_corpus(corpus)
+
+    with pytest.raises(PersonaRuntimeError, match="not found"):
+        persona_query_tool({
+            "persona_id": "nonexistent",
+            "question": "What is corruption?",
+            "corpus_id": "test",
+        })
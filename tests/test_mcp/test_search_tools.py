@@ -19,33 +19,21 @@ def test_semantic_search_tool_missing_query():
         semantic_search_tool({"corpus_id": "test"})
 
 
-def test_semantic_search_tool_corpus_not_found(tmp_path):
+def test_semantic_search_tool_corpus_not_found(mock_corpus_store):
     """Test error when corpus doesn't exist."""
-    corpus_store = Container.create_corpus_store(
-        Container.create_settings(data_dir=tmp_path)
-    )
-
-    original_get = Container.get_corpus_store
-    Container.get_corpus_store = lambda: corpus_store
-
-    try:
-        with pytest.raises(ValueError, match="Corpus .* not found"):
-            semantic_search_tool({"corpus_id": "nonexistent", "query": "test"})
-    finally:
-        Container.get_corpus_store = original_get
+    with pytest.raises(ValueError, match="Corpus .* not found"):
+        semantic_search_tool({"corpus_id": "nonexistent", "query": "test"})
 
 
-def test_semantic_search_tool_success(tmp_path):
+def test_semantic_search_tool_success(mock_corpus_store, monkeypatch):
     """Test successful search execution."""
     # Setup
-    corpus_store = Container.create_corpus_store(
-        Container.create_settings(data_dir=tmp_path)
-    )
-    search_service = Container.create_search_service(corpus_store)
+    search_service = Container.create_search_service(mock_corpus_store)
+    monkeypatch.setattr(Container, "get_search_service", lambda: search_service)
 
     # Create corpus and document
     corpus = Corpus(id="test", type="research", name="Test")
-    corpus_store.create_corpus(corpus)
+    mock_corpus_store.create_corpus(corpus)
 
     doc = Document(
         id="doc1",
@@ -54,41 +42,53 @@ def test_semantic_search_tool_success(tmp_path):
         content_hash="hash1",
         metadata={},
     )
-    corpus_store.add_document(doc)
-
-    # Mock singletons
-    original_corpus = Container.get_corpus_store
-    original_search = Container.get_search_service
-    Container.get_corpus_store = lambda: corpus_store
-    Container.get_search_service = lambda: search_service
-
-    try:
-        result = semantic_search_tool(
-            {"corpus_id": "test", "query": "machine learning", "k": 5}
-        )
-
-        assert "hits" in result
-        assert isinstance(result["hits"], list)
-
-        if result["hits"]:
-            hit = result["hits"][0]
-            assert "document_id" in hit
-            assert "chunk_id" in hit
-            assert "score" in hit
-            assert "excerpt" in hit
-    finally:
-        Container.get_corpus_store = original_corpus
-        Container.get_search_service = original_search
-
-
-def test_keyword_search_tool_is_alias():
-    """Test that keyword_search is an alias for semantic_search."""
-    # Both should work with same args
-    args = {"corpus_id": "test", "query": "test"}
-
-    # They should both require the same parameters
+    mock_corpus_store.add_document(doc)
+
+    result = semantic_search_tool(
+        {"corpus_id": "test", "query": "machine learning", "k": 5}
+    )
+
+    assert "hits" in result
+    assert isinstance(result["hits"], list)
+
+    if result["hits"]:
+        hit = result["hits"][0]
+        assert "document_id" in hit
+        assert "chunk_id" in hit
+        assert "score" in hit
+        assert "excerpt" in hit
+
+
+def test_keyword_search_tool_missing_arguments():
+    """Test that keyword_search requires both corpus_id and query."""
     with pytest.raises(ValueError):
         keyword_search_tool({"query": "test"})
 
     with pytest.raises(ValueError):
         keyword_search_tool({"corpus_id": "test"})
+
+
+def test_keyword_search_tool_success(mock_corpus_store):
+    """Test keyword search ranks documents through the store's FTS index."""
+    mock_corpus_store.create_corpus(Corpus(id="test", type="research", name="Test"))
+    mock_corpus_store.add_documents(
+        [
+            Document(id="doc1", corpus_id="test", text="Notes on machine learning.",
+                     content_hash="hash1"),
+            Document(id="doc2", corpus_id="test", text="Cooking recipes.", content_hash="hash2"),
+        ]
+    )
+
+    result = keyword_search_tool({"corpus_id": "test", "query": "machine learning"})
+
+    assert [hit["document_id"] for hit in result["hits"]] == ["doc1"]
+    hit = result["hits"][0]
+    assert hit["chunk_id"] == "doc1::chunk_0"
+    assert hit["excerpt"] == "Notes on machine learning."
+    assert hit["score"] > 0
+
+
+def test_keyword_search_tool_corpus_not_found(mock_corpus_store):
+    """Test error when corpus doesn't exist."""
+    with pytest.raises(ValueError, match="Corpus .* not found"):
+        keyword_search_tool({"corpus_id": "nonexistent", "query": "test"})
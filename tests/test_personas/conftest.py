@@ -0,0 +1,56 @@
+"""
+Shared fixtures for persona tests.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from alavista.ontology.service import OntologyService
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Provide one temporary directory for read-only files shared by all tests.
+
+    Tests that write files should use the function-scoped tmp_path instead.
+
+    Returns:
+        Path: Session-wide temporary directory
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
+def ontology_service(shared_tmp: Path) -> OntologyService:
+    """
+    Provide a test ontology service, shared since it is never modified.
+
+    Returns:
+        OntologyService: Service over a small Person/Organization/Document ontology
+    """
+    ontology_data = {
+        "version": "0.1",
+        "entities": {
+            "Person": {"description": "A person"},
+            "Organization": {"description": "An organization"},
+            "Document": {"description": "A document"},
+        },
+        "relations": {
+            "APPEARS_IN": {
+                "description": "Appears in",
+                "domain": ["Person", "Organization"],
+                "range": ["Document"],
+            },
+            "MENTIONED_WITH": {
+                "description": "Mentioned with",
+                "domain": ["Person", "Organization"],
+                "range": ["Person", "Organization"],
+            },
+        },
+    }
+    ontology_path = shared_tmp / "ontology.json"
+    ontology_path.write_text(json.dumps(ontology_data))
+    return OntologyService(ontology_path)
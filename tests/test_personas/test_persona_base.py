@@ -90,6 +90,22 @@ def test_default_persona_categorize_semantic_default():
         assert cat.category == "semantic", f"Failed for: {q}"
 
 
+def test_default_persona_categorize_uses_subclass_patterns():
+    """Test that pattern lists overridden on a subclass are honored."""
+
+    class CustomPersona(DefaultPersona):
+        COMPARISON_PATTERNS = [r"\bbenchmark\b"]
+
+    config = PersonaConfig(
+        name="Test",
+        id="test",
+        description="Test persona",
+    )
+
+    assert CustomPersona(config).categorize_question("Benchmark them").category == "comparison"
+    assert DefaultPersona(config).categorize_question("Benchmark them").category == "semantic"
+
+
 def test_default_persona_select_tools_structural():
     """Test tool selection for structural questions."""
     config = PersonaConfig(
@@ -180,3 +196,26 @@ def test_default_persona_respects_tool_whitelist():
 
     # Should only contain semantic_search since that's all that's allowed
     assert all(tool in ["semantic_search"] for tool in tools)
+
+
+def test_default_persona_select_tools_order_per_category():
+    """Test that each category yields its allowed tools in priority order."""
+    config = PersonaConfig(
+        name="Test",
+        id="test",
+        description="Test persona",
+        tools_allowed=["keyword_search", "graph_neighbors", "semantic_search", "graph_paths"],
+    )
+    persona = DefaultPersona(config)
+
+    def select(category: str) -> list[str]:
+        return persona.select_tools("q", QuestionCategory(category=category, confidence=0.5))
+
+    assert select("structural") == ["graph_neighbors", "graph_paths", "semantic_search"]
+    assert select("timeline") == ["semantic_search", "keyword_search"]
+    assert select("comparison") == ["semantic_search", "graph_neighbors"]
+    assert select("semantic") == ["semantic_search", "keyword_search"]
+
+    # Callers get their own list, not the persona's cached selection
+    select("semantic").append("graph_paths")
+    assert select("semantic") == ["semantic_search", "keyword_search"]
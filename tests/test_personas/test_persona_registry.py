@@ -1,50 +1,21 @@
 """Tests for PersonaRegistry."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 import yaml
 
-from alavista.ontology.service import OntologyService
+from alavista.core.corpus_store import SQLiteCorpusStore
+from alavista.core.ingestion_service import IngestionError, IngestionService
 from alavista.personas.persona_registry import PersonaRegistry, PersonaValidationError
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
 
-@pytest.fixture
-def ontology_service(tmp_path):
-    """Create a test ontology service."""
-    ontology_data = {
-        "version": "0.1",
-        "entities": {
-            "Person": {"description": "A person"},
-            "Organization": {"description": "An organization"},
-            "Document": {"description": "A document"},
-        },
-        "relations": {
-            "APPEARS_IN": {
-                "description": "Appears in",
-                "domain": ["Person", "Organization"],
-                "range": ["Document"],
-            },
-            "MENTIONED_WITH": {
-                "description": "Mentioned with",
-                "domain": ["Person", "Organization"],
-                "range": ["Person", "Organization"],
-            },
-        },
-    }
-    ontology_path = tmp_path / "ontology.json"
-    with open(ontology_path, "w") as f:
-        import json
-
-        json.dump(ontology_data, f)
-
-    return OntologyService(ontology_path)
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_persona_yaml():
-    """Sample persona YAML data."""
+    """Sample persona YAML data (shared; copy before modifying)."""
     return {
         "name": "Test Persona",
         "id": "test_persona",
@@ -59,6 +30,19 @@ def test_persona_yaml():
     }
 
 
+@pytest.fixture(scope="session")
+def test_persona_yaml_text(test_persona_yaml):
+    """Sample persona serialized once as YAML text."""
+    return yaml.dump(test_persona_yaml, Dumper=_YamlDumper)
+
+
+def _numbered_persona_text(template: str, i: int) -> str:
+    """Rewrite the sample persona YAML text as persona number `i`."""
+    return template.replace("id: test_persona\n", f"id: persona_{i}\n").replace(
+        "name: Test Persona\n", f"name: Persona {i}\n"
+    )
+
+
 def test_persona_registry_initialization(ontology_service):
     """Test basic registry initialization."""
     registry = PersonaRegistry(
@@ -68,7 +52,7 @@ def test_persona_registry_initialization(ontology_service):
     assert registry.list_persona_ids() == []
 
 
-def test_persona_registry_load_from_file(ontology_service, test_persona_yaml, tmp_path):
+def test_persona_registry_load_from_file(ontology_service, test_persona_yaml_text, tmp_path):
     """Test loading a persona from a YAML file."""
     registry = PersonaRegistry(
         ontology_service=ontology_service,
@@ -77,8 +61,7 @@ def test_persona_registry_load_from_file(ontology_service, test_persona_yaml, tm
 
     # Write YAML file
     yaml_file = tmp_path / "test_persona.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(test_persona_yaml, f)
+    yaml_file.write_text(test_persona_yaml_text)
 
     # Load persona
     persona = registry.load_from_file(yaml_file)
@@ -89,7 +72,26 @@ def test_persona_registry_load_from_file(ontology_service, test_persona_yaml, tm
     assert "APPEARS_IN" in persona.relation_whitelist
 
 
-def test_persona_registry_load_all(ontology_service, test_persona_yaml, tmp_path):
+def test_persona_registry_reloads_edited_file(
+    ontology_service, test_persona_yaml_text, tmp_path
+):
+    """Test that cached persona files are re-read once they change on disk."""
+    registry = PersonaRegistry(
+        ontology_service=ontology_service,
+        allowed_tools=["semantic_search", "graph_find_entity"],
+    )
+    yaml_file = tmp_path / "test_persona.yaml"
+    yaml_file.write_text(test_persona_yaml_text)
+    assert registry.load_from_file(yaml_file).name == "Test Persona"
+
+    yaml_file.write_text(
+        test_persona_yaml_text.replace("name: Test Persona\n", "name: Renamed Persona\n")
+    )
+
+    assert registry.load_from_file(yaml_file).name == "Renamed Persona"
+
+
+def test_persona_registry_load_all(ontology_service, test_persona_yaml_text, tmp_path):
     """Test loading all personas from a directory."""
     registry = PersonaRegistry(
         ontology_service=ontology_service,
@@ -98,13 +100,9 @@ def test_persona_registry_load_all(ontology_service, test_persona_yaml, tmp_path
 
     # Create multiple YAML files
     for i in range(3):
-        persona_data = test_persona_yaml.copy()
-        persona_data["id"] = f"persona_{i}"
-        persona_data["name"] = f"Persona {i}"
-
-        yaml_file = tmp_path / f"persona_{i}.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(persona_data, f)
+        (tmp_path / f"persona_{i}.yaml").write_text(
+            _numbered_persona_text(test_persona_yaml_text, i)
+        )
 
     # Load all
     registry.load_all(tmp_path)
@@ -115,18 +113,32 @@ def test_persona_registry_load_all(ontology_service, test_persona_yaml, tmp_path
     assert "persona_2" in registry.list_persona_ids()
 
 
-def test_persona_registry_get_persona(ontology_service, test_persona_yaml, tmp_path):
-    """Test retrieving a persona by ID."""
+def test_persona_registry_load_all_reports_bad_file(
+    ontology_service, test_persona_yaml_text, tmp_path
+):
+    """Test that a malformed file among several is named in the error."""
     registry = PersonaRegistry(
         ontology_service=ontology_service,
         allowed_tools=["semantic_search", "graph_find_entity"],
     )
+    for i in (0, 2):
+        (tmp_path / f"persona_{i}.yaml").write_text(
+            _numbered_persona_text(test_persona_yaml_text, i)
+        )
+    (tmp_path / "persona_1.yaml").write_text("name: [unterminated\n")
+
+    with pytest.raises(PersonaValidationError, match="persona_1.yaml"):
+        registry.load_all(tmp_path)
 
-    yaml_file = tmp_path / "test_persona.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(test_persona_yaml, f)
 
-    registry.load_from_file(yaml_file)
+def test_persona_registry_get_persona(ontology_service, test_persona_yaml):
+    """Test retrieving a persona by ID."""
+    registry = PersonaRegistry(
+        ontology_service=ontology_service,
+        allowed_tools=["semantic_search", "graph_find_entity"],
+    )
+
+    registry.load_from_mapping(test_persona_yaml)
 
     persona = registry.get_persona("test_persona")
     assert persona is not None
@@ -135,8 +147,25 @@ def test_persona_registry_get_persona(ontology_service, test_persona_yaml, tmp_p
     # Test non-existent persona
     assert registry.get_persona("nonexistent") is None
 
+    assert "test_persona" in registry
+    assert "nonexistent" not in registry
+    assert len(registry) == 1
+
+
+def test_empty_persona_registry_is_still_configured(ontology_service):
+    """Test an empty registry is not mistaken for a missing one."""
+    registry = PersonaRegistry(
+        ontology_service=ontology_service, allowed_tools=["semantic_search"]
+    )
+    service = IngestionService(
+        corpus_store=SQLiteCorpusStore(":memory:"), persona_registry=registry
+    )
 
-def test_persona_registry_validate_unknown_entity_type(ontology_service, tmp_path):
+    with pytest.raises(IngestionError, match="No manual corpus found"):
+        service.ingest_persona_text("nonexistent", "Some text")
+
+
+def test_persona_registry_validate_unknown_entity_type(ontology_service):
     """Test validation fails for unknown entity types."""
     registry = PersonaRegistry(
         ontology_service=ontology_service, allowed_tools=["semantic_search"]
@@ -151,15 +180,11 @@ def test_persona_registry_validate_unknown_entity_type(ontology_service, tmp_pat
         "tools_allowed": [],
     }
 
-    yaml_file = tmp_path / "invalid.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(invalid_persona, f)
-
     with pytest.raises(PersonaValidationError, match="Unknown entity type"):
-        registry.load_from_file(yaml_file)
+        registry.load_from_mapping(invalid_persona)
 
 
-def test_persona_registry_validate_unknown_relation_type(ontology_service, tmp_path):
+def test_persona_registry_validate_unknown_relation_type(ontology_service):
     """Test validation fails for unknown relation types."""
     registry = PersonaRegistry(
         ontology_service=ontology_service, allowed_tools=["semantic_search"]
@@ -174,15 +199,11 @@ def test_persona_registry_validate_unknown_relation_type(ontology_service, tmp_p
         "tools_allowed": [],
     }
 
-    yaml_file = tmp_path / "invalid.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(invalid_persona, f)
-
     with pytest.raises(PersonaValidationError, match="Unknown relation type"):
-        registry.load_from_file(yaml_file)
+        registry.load_from_mapping(invalid_persona)
 
 
-def test_persona_registry_validate_unknown_tool(ontology_service, tmp_path):
+def test_persona_registry_validate_unknown_tool(ontology_service):
     """Test validation fails for unknown tools."""
     registry = PersonaRegistry(
         ontology_service=ontology_service, allowed_tools=["semantic_search"]
@@ -197,26 +218,35 @@ def test_persona_registry_validate_unknown_tool(ontology_service, tmp_path):
         "tools_allowed": ["unknown_tool"],  # Not in allowed_tools
     }
 
-    yaml_file = tmp_path / "invalid.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(invalid_persona, f)
-
     with pytest.raises(PersonaValidationError, match="Unknown tool"):
-        registry.load_from_file(yaml_file)
+        registry.load_from_mapping(invalid_persona)
+
+
+def test_persona_registry_validate_reports_all_unknown_types(ontology_service):
+    """Test validation names every unknown entity type, not just the first."""
+    registry = PersonaRegistry(ontology_service=ontology_service)
+
+    invalid_persona = {
+        "name": "Invalid",
+        "id": "invalid",
+        "description": "Has several unknown entity types",
+        "entity_whitelist": ["Person", "Zeta", "Alpha"],
+        "relation_whitelist": [],
+        "tools_allowed": [],
+    }
 
+    with pytest.raises(PersonaValidationError, match="Unknown entity type.*'Alpha', 'Zeta'"):
+        registry.load_from_mapping(invalid_persona)
 
-def test_persona_registry_get_persona_summary(ontology_service, test_persona_yaml, tmp_path):
+
+def test_persona_registry_get_persona_summary(ontology_service, test_persona_yaml):
     """Test getting a persona summary."""
     registry = PersonaRegistry(
         ontology_service=ontology_service,
         allowed_tools=["semantic_search", "graph_find_entity"],
     )
 
-    yaml_file = tmp_path / "test_persona.yaml"
-    with open(yaml_file, "w") as f:
-        yaml.dump(test_persona_yaml, f)
-
-    registry.load_from_file(yaml_file)
+    registry.load_from_mapping(test_persona_yaml)
 
     summary = registry.get_persona_summary("test_persona")
     assert summary is not None
@@ -227,7 +257,7 @@ def test_persona_registry_get_persona_summary(ontology_service, test_persona_yam
     assert "semantic_search" in summary["tools"]
 
 
-def test_persona_registry_list_persona_summaries(ontology_service, test_persona_yaml, tmp_path):
+def test_persona_registry_list_persona_summaries(ontology_service, test_persona_yaml):
     """Test listing all persona summaries."""
     registry = PersonaRegistry(
         ontology_service=ontology_service,
@@ -236,14 +266,21 @@ def test_persona_registry_list_persona_summaries(ontology_service, test_persona_
 
     # Create two personas
     for i in range(2):
-        persona_data = test_persona_yaml.copy()
-        persona_data["id"] = f"persona_{i}"
-        yaml_file = tmp_path / f"persona_{i}.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(persona_data, f)
-
-    registry.load_all(tmp_path)
+        registry.load_from_mapping({**test_persona_yaml, "id": f"persona_{i}"})
 
     summaries = registry.list_persona_summaries()
     assert len(summaries) == 2
     assert all("id" in s and "name" in s for s in summaries)
+
+
+def test_persona_registry_load_from_mapping(ontology_service, test_persona_yaml):
+    """Test loading a persona from parsed data without touching the filesystem."""
+    registry = PersonaRegistry(
+        ontology_service=ontology_service,
+        allowed_tools=["semantic_search", "graph_find_entity"],
+    )
+
+    persona = registry.load_from_mapping(test_persona_yaml)
+
+    assert persona.id == "test_persona"
+    assert registry.get_persona("test_persona") is persona
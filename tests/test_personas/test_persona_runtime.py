@@ -1,58 +1,97 @@
 """Tests for PersonaRuntime."""
 
-from unittest.mock import MagicMock, Mock
+from collections.abc import Iterator
+from unittest.mock import Mock
 
 import pytest
 
 from alavista.core.models import Corpus, Document, SearchResult
+from alavista.graph.models import GraphNode
 from alavista.personas.models import PersonaConfig
 from alavista.personas.persona_base import DefaultPersona
 from alavista.personas.persona_registry import PersonaRegistry
 from alavista.personas.persona_runtime import PersonaRuntime, PersonaRuntimeError
 
 
+class FakeSearchService:
+    """Search service stand-in returning canned BM25 results."""
+
+    def __init__(self, results: list[SearchResult]):
+        self.results = results
+        self.calls = 0
+
+    def search_bm25(self, *args, **kwargs) -> list[SearchResult]:
+        self.calls += 1
+        return self.results
+
+    def search_bm25_batch(self, *args, queries: list[str], **kwargs) -> list[list[SearchResult]]:
+        self.calls += 1
+        return [self.results for _ in queries]
+
+
+class FakeGraphService:
+    """Graph service stand-in returning canned entity matches."""
+
+    def __init__(self, nodes: list[GraphNode]):
+        self.nodes = nodes
+
+    def find_entity(self, name: str) -> list[GraphNode]:
+        return self.nodes
+
+
+class FakeCorpusStore:
+    """Corpus store stand-in serving one corpus and its documents."""
+
+    def __init__(self, corpus: Corpus, documents: list[Document]):
+        self.corpus = corpus
+        self.documents = documents
+
+    def get_corpus(self, corpus_id: str) -> Corpus | None:
+        return self.corpus if corpus_id == self.corpus.id else None
+
+    def iter_documents(self, corpus_id: str) -> Iterator[Document]:
+        return iter(self.documents)
+
+
 @pytest.fixture
 def mock_services():
-    """Create mocked services for testing."""
-    search_service = Mock()
-    graph_service = Mock()
-    corpus_store = Mock()
-
-    # Mock corpus store to return a corpus
-    corpus = Corpus(id="test_corpus", type="research", name="Test Corpus")
-    corpus_store.get_corpus.return_value = corpus
-    corpus_store.list_documents.return_value = [
-        Document(
-            id="doc1",
-            corpus_id="test_corpus",
-            text="Sample document content for testing.",
-            content_hash="hash1",
-            metadata={},
-        )
-    ]
+    """Create lightweight fake services for testing."""
+    corpus_store = FakeCorpusStore(
+        Corpus(id="test_corpus", type="research", name="Test Corpus"),
+        [
+            Document(
+                id="doc1",
+                corpus_id="test_corpus",
+                text="Sample document content for testing.",
+                content_hash="hash1",
+                metadata={},
+            )
+        ],
+    )
 
-    # Mock search results
-    search_service.search_bm25.return_value = [
-        SearchResult(
-            doc_id="doc1",
-            chunk_id="doc1::chunk_0",
-            score=0.9,
-            excerpt="Sample document content for testing.",
-            metadata={},
-        )
-    ]
+    search_service = FakeSearchService(
+        [
+            SearchResult(
+                doc_id="doc1",
+                chunk_id="doc1::chunk_0",
+                score=0.9,
+                excerpt="Sample document content for testing.",
+                metadata={},
+            )
+        ]
+    )
 
-    # Mock graph results
-    from alavista.graph.models import GraphNode
-    graph_service.find_entity.return_value = [
-        GraphNode(
-            id="person1",
-            type="Person",
-            name="John Doe",
-            aliases=[],
-            metadata={},
-        )
-    ]
+    graph_service = FakeGraphService(
+        [
+            GraphNode(
+                id="person1",
+                type="Person",
+                name="John Doe",
+                aliases=[],
+                metadata={},
+            )
+        ]
+    )
 
     return {
         "search_service": search_service,
@@ -62,36 +101,8 @@ def mock_services():
 
 
 @pytest.fixture
-def persona_registry():
+def persona_registry(ontology_service):
     """Create a test persona registry."""
-    from alavista.ontology.service import OntologyService
-    from pathlib import Path
-    import tempfile
-    import json
-
-    # Create temporary ontology
-    ontology_data = {
-        "version": "0.1",
-        "entities": {
-            "Person": {"description": "A person"},
-            "Organization": {"description": "An organization"},
-            "Document": {"description": "A document"},
-        },
-        "relations": {
-            "APPEARS_IN": {
-                "description": "Appears in",
-                "domain": ["Person", "Organization"],
-                "range": ["Document"],
-            },
-        },
-    }
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(ontology_data, f)
-        ontology_path = Path(f.name)
-
-    ontology_service = OntologyService(ontology_path)
-
     registry = PersonaRegistry(
         ontology_service=ontology_service,
         allowed_tools=[
@@ -175,9 +186,10 @@ def test_persona_runtime_unknown_persona(persona_registry, mock_services):
 
 def test_persona_runtime_uses_correct_tools(persona_registry, mock_services):
     """Test that runtime uses persona-appropriate tools."""
+    search_service = Mock(wraps=mock_services["search_service"])
     runtime = PersonaRuntime(
         persona_registry=persona_registry,
-        search_service=mock_services["search_service"],
+        search_service=search_service,
         graph_service=mock_services["graph_service"],
         corpus_store=mock_services["corpus_store"],
     )
@@ -190,7 +202,7 @@ def test_persona_runtime_uses_correct_tools(persona_registry, mock_services):
     )
 
     # Should have called search service
-    mock_services["search_service"].search_bm25.assert_called()
+    search_service.search_bm25.assert_called()
 
     # Evidence should be populated
     assert len(answer.evidence) > 0
@@ -199,7 +211,7 @@ def test_persona_runtime_uses_correct_tools(persona_registry, mock_services):
 def test_persona_runtime_evidence_deduplication(persona_registry, mock_services):
     """Test that evidence is deduplicated."""
     # Create duplicate results
-    mock_services["search_service"].search_bm25.return_value = [
+    mock_services["search_service"].results = [
         SearchResult(
             doc_id="doc1",
             chunk_id="doc1::chunk_0",
@@ -231,13 +243,41 @@ def test_persona_runtime_evidence_deduplication(persona_registry, mock_services)
 
     # Should only have one evidence item after deduplication
     assert len(answer.evidence) == 1
+    assert answer.evidence[0]["score"] == 0.9
+
+
+def test_persona_runtime_evidence_keeps_best_score(persona_registry, mock_services):
+    """Test that deduplication keeps the highest scoring duplicate, sorted by score."""
+    mock_services["search_service"].results = [
+        SearchResult(doc_id="doc1", chunk_id="doc1::chunk_0", score=0.2, excerpt="A", metadata={}),
+        SearchResult(doc_id="doc2", chunk_id="doc2::chunk_0", score=0.5, excerpt="B", metadata={}),
+        SearchResult(doc_id="doc1", chunk_id="doc1::chunk_0", score=0.7, excerpt="A", metadata={}),
+    ]
+
+    runtime = PersonaRuntime(
+        persona_registry=persona_registry,
+        search_service=mock_services["search_service"],
+        graph_service=mock_services["graph_service"],
+        corpus_store=mock_services["corpus_store"],
+    )
+
+    answer = runtime.answer_question(
+        persona_id="test_persona",
+        question="What is the document about?",
+        corpus_id="test_corpus",
+    )
+
+    assert [(ev["chunk_id"], ev["score"]) for ev in answer.evidence] == [
+        ("doc1::chunk_0", 0.7),
+        ("doc2::chunk_0", 0.5),
+    ]
 
 
 def test_persona_runtime_no_evidence_response(persona_registry, mock_services):
     """Test response when no evidence is found."""
     # Mock empty results
-    mock_services["search_service"].search_bm25.return_value = []
-    mock_services["graph_service"].find_entity.return_value = []
+    mock_services["search_service"].results = []
+    mock_services["graph_service"].nodes = []
 
     runtime = PersonaRuntime(
         persona_registry=persona_registry,
@@ -254,3 +294,77 @@ def test_persona_runtime_no_evidence_response(persona_registry, mock_services):
 
     assert answer is not None
     assert "could not find sufficient evidence" in answer.answer_text.lower()
+
+
+def test_persona_runtime_answer_questions_batch(persona_registry, mock_services):
+    """Test that batched answers match per-question answers with one search call."""
+    runtime = PersonaRuntime(
+        persona_registry=persona_registry,
+        search_service=mock_services["search_service"],
+        graph_service=mock_services["graph_service"],
+        corpus_store=mock_services["corpus_store"],
+    )
+    questions = ["What is the document about?", "Who is John Doe?"]
+
+    expected = [
+        runtime.answer_question(
+            persona_id="test_persona", question=question, corpus_id="test_corpus"
+        )
+        for question in questions
+    ]
+    mock_services["search_service"].calls = 0
+
+    answers = runtime.answer_questions(
+        [("test_persona", question) for question in questions], corpus_id="test_corpus"
+    )
+
+    assert [answer.model_dump(exclude={"timestamp"}) for answer in answers] == [
+        answer.model_dump(exclude={"timestamp"}) for answer in expected
+    ]
+    assert mock_services["search_service"].calls == 1
+
+
+def test_persona_runtime_answer_questions_unknown_persona(persona_registry, mock_services):
+    """Test that batched answering rejects unknown personas up front."""
+    runtime = PersonaRuntime(
+        persona_registry=persona_registry,
+        search_service=mock_services["search_service"],
+        graph_service=mock_services["graph_service"],
+        corpus_store=mock_services["corpus_store"],
+    )
+
+    with pytest.raises(PersonaRuntimeError, match="not found"):
+        runtime.answer_questions([("nonexistent", "Question?")], corpus_id="test_corpus")
+    assert mock_services["search_service"].calls == 0
+
+
+def test_persona_runtime_answer_questions_skips_search_without_search_tools(
+    persona_registry, mock_services
+):
+    """Test that personas without search tools trigger no batched search."""
+    config = PersonaConfig(
+        name="Graph Persona",
+        id="graph_persona",
+        description="Uses graph tools only",
+        entity_whitelist=["Person"],
+        relation_whitelist=["APPEARS_IN"],
+        tools_allowed=["graph_find_entity"],
+        safety={"disclaimers": []},
+        reasoning={"approach": "Graph only"},
+    )
+    persona_registry._personas["graph_persona"] = DefaultPersona(config)
+    runtime = PersonaRuntime(
+        persona_registry=persona_registry,
+        search_service=mock_services["search_service"],
+        graph_service=mock_services["graph_service"],
+        corpus_store=mock_services["corpus_store"],
+    )
+
+    answers = runtime.answer_questions(
+        [("graph_persona", "Who is John Doe?"), ("graph_persona", "What happened?")],
+        corpus_id="test_corpus",
+    )
+
+    assert len(answers) == 2
+    assert all(answer.evidence == [] for answer in answers)
+    assert mock_services["search_service"].calls == 0
@@ -5,6 +5,13 @@ Tests for the BM25 index module.
 
 from alavista.search.bm25 import BM25Index
 
+# Built once at import; the index only reads these documents
+_LONG_TEXT = ' '.join(['word'] * 1000)
+_LIMIT_DOCS = [
+    {'id': f'doc{i}', 'text': f'document number {i} with word test'}
+    for i in range(10)
+]
+
 
 class TestBM25Index:
     """Test BM25 indexing and search."""
@@ -102,15 +109,19 @@ class TestBM25Index:
     def test_search_with_limit(self):
         """Test search result limiting."""
         index = BM25Index()
-        docs = [
-            {'id': f'doc{i}', 'text': f'document number {i} with word test'}
-            for i in range(10)
-        ]
-        index.build(docs)
+        index.build(_LIMIT_DOCS)
 
         results = index.search("test", k=5)
         assert len(results) <= 5
 
+    def test_search_with_limit_keeps_tie_order(self):
+        """Test that tied scores cut off by k keep document order."""
+        index = BM25Index()
+        index.build([{'id': f'doc{i}', 'text': 'same text'} for i in range(6)])
+
+        results = index.search("same", k=2)
+        assert [doc_id for doc_id, _ in results] == ['doc0', 'doc1']
+
     def test_search_results_sorted(self):
         """Test that search results are sorted by score."""
         index = BM25Index()
@@ -189,6 +200,110 @@ class TestBM25Index:
         assert index.get_document('doc1') is None
         assert index.get_document('doc2') is not None
 
+    def test_unmatched_query_skips_refresh(self):
+        """Test that a query with no indexed terms returns before pending updates apply."""
+        index = BM25Index()
+        index.build([{'id': 'doc1', 'text': 'hello world'}])
+        index.add_document({'id': 'doc2', 'text': 'goodbye world'})
+
+        assert index.search('nothing matches') == []
+        assert index._stale
+        assert [doc_id for doc_id, _ in index.search('goodbye')] == ['doc2']
+
+    def test_incremental_add(self):
+        """Test that adding a document matches building with it."""
+        docs = [
+            {'id': 'doc1', 'text': 'hello world'},
+            {'id': 'doc2', 'text': 'goodbye world'}
+        ]
+        new_doc = {'id': 'doc3', 'text': 'hello hello goodbye'}
+
+        index = BM25Index()
+        index.build(docs)
+        index.add_document(new_doc)
+
+        rebuilt = BM25Index()
+        rebuilt.build(docs + [new_doc])
+
+        assert index.search('hello') == rebuilt.search('hello')
+        assert index.doc_count == 3
+        assert index.get_document('doc3') is new_doc
+
+    def test_remove_document(self):
+        """Test that removing a document matches building without it."""
+        docs = [
+            {'id': 'doc1', 'text': 'hello world'},
+            {'id': 'doc2', 'text': 'goodbye world'},
+            {'id': 'doc3', 'text': 'hello goodbye'}
+        ]
+        index = BM25Index()
+        index.build(docs)
+
+        assert index.remove_document('doc1') is True
+        assert index.remove_document('doc1') is False
+
+        rebuilt = BM25Index()
+        rebuilt.build(docs[1:])
+
+        assert index.search('hello world') == rebuilt.search('hello world')
+        assert index.doc_count == 2
+        assert index.avg_doc_length == rebuilt.avg_doc_length
+        assert index.idf_cache == rebuilt.idf_cache
+        assert index.get_document('doc1') is None
+
+    def test_add_document_replaces_existing(self):
+        """Test that re-adding a document ID replaces its content."""
+        index = BM25Index()
+        index.build([
+            {'id': 'doc1', 'text': 'hello world'},
+            {'id': 'doc2', 'text': 'goodbye world'}
+        ])
+        index.add_document({'id': 'doc1', 'text': 'farewell'})
+
+        assert index.search('hello') == []
+        assert [doc_id for doc_id, _ in index.search('farewell')] == ['doc1']
+        assert index.doc_count == 2
+
+    def test_build_duplicate_ids_last_wins(self):
+        """Test that duplicate IDs in build keep only the last document."""
+        index = BM25Index()
+        index.build([
+            {'id': 'doc1', 'text': 'hello world'},
+            {'id': 'doc2', 'text': 'goodbye world'},
+            {'id': 'doc1', 'text': 'hello farewell'}
+        ])
+
+        assert index.doc_count == 2
+        assert [doc_id for doc_id, _ in index.search('hello')] == ['doc1']
+        assert index.get_document('doc1')['text'] == 'hello farewell'
+
+        assert index.remove_document('doc1') is True
+        assert index.search('hello') == []
+
+    def test_save_load_index(self, tmp_path):
+        """Test that a saved index loads with identical results."""
+        index = BM25Index(k1=1.2, b=0.5, remove_stopwords=True)
+        docs = [
+            {'id': 'doc1', 'text': 'the quick brown fox', 'metadata': {'page': 1}},
+            {'id': 'doc2', 'text': 'the lazy dog sleeps'},
+            {'id': 'doc3', 'text': 'quick quick dog'}
+        ]
+        index.build(docs)
+        index.save(tmp_path / 'index')
+
+        loaded = BM25Index.load(tmp_path / 'index')
+        assert loaded.k1 == 1.2
+        assert loaded.b == 0.5
+        assert loaded.remove_stopwords is True
+        assert loaded.doc_count == 3
+        for query in ['quick', 'dog', 'quick dog', 'the', 'missing']:
+            assert loaded.search(query) == index.search(query)
+        assert loaded.get_document('doc1')['metadata'] == {'page': 1}
+
+        # A loaded index still accepts updates
+        loaded.add_document({'id': 'doc4', 'text': 'brown dog'})
+        assert loaded.search('brown')[0][0] == 'doc4'
+
     def test_stopword_removal(self):
         """Test BM25 with stopword removal."""
         index = BM25Index(remove_stopwords=True)
@@ -246,9 +361,8 @@ class TestBM25Index:
     def test_long_documents(self):
         """Test indexing and searching long documents."""
         index = BM25Index()
-        long_text = ' '.join(['word'] * 1000)
         docs = [
-            {'id': 'doc1', 'text': long_text},
+            {'id': 'doc1', 'text': _LONG_TEXT},
             {'id': 'doc2', 'text': 'short document'}
         ]
         index.build(docs)
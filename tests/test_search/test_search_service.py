@@ -5,16 +5,14 @@ Tests for the SearchService module.
 import pytest
 
 from alavista.core.container import Container
-from alavista.core.corpus_store import SQLiteCorpusStore
 from alavista.core.models import Chunk, Corpus, Document, SearchResult
 from alavista.search.search_service import SearchService
 
 
 @pytest.fixture
-def corpus_store(tmp_path):
-    """Create a temporary corpus store."""
-    db_path = tmp_path / "test_corpus.db"
-    return SQLiteCorpusStore(db_path)
+def corpus_store(shared_corpus_store):
+    """Provide the session-wide in-memory corpus store, emptied after each test."""
+    return shared_corpus_store
 
 
 @pytest.fixture
@@ -193,6 +191,35 @@ class TestSearchService:
 
         assert results == []
 
+    def test_search_batch_matches_single_queries(
+        self, search_service, sample_corpus, sample_chunks
+    ):
+        """Test that batched search returns the same hits as one query at a time."""
+        queries = ["machine learning", "", "nonexistent term xyz", "learning"]
+        batch = search_service.search_bm25_batch(
+            corpus_id="test-corpus",
+            chunks=sample_chunks,
+            queries=queries,
+            k=2
+        )
+
+        assert batch == [
+            search_service.search_bm25(
+                corpus_id="test-corpus", chunks=sample_chunks, query=query, k=2
+            )
+            for query in queries
+        ]
+
+    def test_search_batch_empty_chunks(self, search_service, sample_corpus):
+        """Test batched search with no chunks."""
+        batch = search_service.search_bm25_batch(
+            corpus_id="test-corpus",
+            chunks=[],
+            queries=["test", "other"]
+        )
+
+        assert batch == [[], []]
+
     def test_excerpt_generation(self, search_service, sample_corpus, sample_chunks):
         """Test that excerpts are generated correctly."""
         results = search_service.search_bm25(
@@ -243,6 +270,23 @@ class TestSearchService:
         for result in results:
             assert 'source' in result.metadata
 
+    def test_result_metadata_is_not_shared(self, search_service, sample_corpus, sample_chunks):
+        """Test that mutating a result's metadata leaves the cached index untouched."""
+        results = search_service.search_bm25(
+            corpus_id="test-corpus",
+            chunks=sample_chunks,
+            query="machine learning"
+        )
+        results[0].metadata["source"] = "mutated"
+
+        again = search_service.search_bm25(
+            corpus_id="test-corpus",
+            chunks=sample_chunks,
+            query="machine learning"
+        )
+        assert again[0].metadata["source"] != "mutated"
+        assert all(chunk.metadata["source"] != "mutated" for chunk in sample_chunks)
+
     def test_index_caching(self, search_service, sample_corpus, sample_chunks):
         """Test that index is cached between searches."""
         # First search
@@ -263,6 +307,21 @@ class TestSearchService:
         assert len(results1) > 0
         assert len(results2) > 0
 
+    def test_index_cache_tracks_chunk_content(self, search_service, sample_corpus, sample_chunks):
+        """Test that the cached index is reused for equal chunks and rebuilt on change."""
+        index = search_service._get_or_build_index("test-corpus", sample_chunks)
+        assert search_service._get_or_build_index("test-corpus", list(sample_chunks)) is index
+
+        changed = [
+            chunk.model_copy(update={"text": "quantum entanglement"}) if i == 0 else chunk
+            for i, chunk in enumerate(sample_chunks)
+        ]
+        results = search_service.search_bm25(
+            corpus_id="test-corpus", chunks=changed, query="entanglement"
+        )
+
+        assert [r.chunk_id for r in results] == [changed[0].id]
+
     def test_invalidate_cache_specific(self, search_service, sample_corpus, sample_chunks):
         """Test invalidating cache for specific corpus."""
         # Build index
@@ -2,9 +2,8 @@ import asyncio
 
 import pytest
 
-from alavista.core.corpus_store import SQLiteCorpusStore
 from alavista.core.embeddings import DeterministicFallbackEmbeddingService
-from alavista.core.models import Chunk, Corpus, Document
+from alavista.core.models import Chunk, Corpus, Document, SearchResult
 from alavista.search.search_service import SearchService
 from alavista.vector import InMemoryVectorSearchService
 
@@ -28,9 +27,8 @@ def vector_service():
 
 
 @pytest.fixture
-def corpus_store(tmp_path):
-    db_path = tmp_path / "vec.db"
-    return SQLiteCorpusStore(db_path)
+def corpus_store(shared_corpus_store):
+    return shared_corpus_store
 
 
 @pytest.fixture
@@ -131,3 +129,32 @@ class TestVectorAndHybridSearch:
         svc = SearchService(corpus_store=corpus_store, vector_search_service=None)
         with pytest.raises(ValueError):
             svc.search(corpus_id="missing", chunks=[], query="q", mode="vector")
+
+    def test_combine_hybrid_weights_and_tie_break(self, corpus_store):
+        svc = SearchService(corpus_store=corpus_store, vector_search_service=None)
+
+        def hit(doc_id, chunk_id, score):
+            return SearchResult(doc_id=doc_id, chunk_id=chunk_id, score=score, excerpt="", metadata={})
+
+        bm25_hits = [hit("d2", "c2", 4.0), hit("d1", "c1", 2.0)]
+        vector_hits = [hit("d1", "c1", 0.9), hit("d3", "c3", 0.5)]
+
+        combined = svc._combine_hybrid(bm25_hits, vector_hits, w_bm25=0.5, w_vector=0.5)
+
+        # d1 and d2 both score 0.5; the tie is broken by doc_id
+        assert [(h.doc_id, h.score) for h in combined] == [("d1", 0.5), ("d2", 0.5), ("d3", 0.0)]
+
+    def test_vector_mode_zero_query_returns_empty(self, corpus_store, chunks, vector_service, embed_service):
+        _index_chunks(chunks, embed_service, vector_service)
+
+        class ZeroEmbeddings:
+            async def embed_texts(self, texts):
+                return [[0.0] * 8 for _ in texts]
+
+        svc = SearchService(
+            corpus_store=corpus_store,
+            vector_search_service=vector_service,
+            embedding_service=ZeroEmbeddings(),
+        )
+
+        assert svc.search(corpus_id="c1", chunks=chunks, query="anything", mode="vector") == []
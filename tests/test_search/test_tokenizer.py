@@ -2,6 +2,7 @@
 Tests for the tokenizer module.
 """
 
+import re
 
 from alavista.search.tokenizer import DEFAULT_STOPWORDS, normalize_unicode, tokenize
 
@@ -92,6 +93,12 @@ class TestTokenize:
         tokens = tokenize("the quick brown fox", remove_stopwords=True, stopwords=custom_stops)
         assert tokens == ["the", "fox"]
 
+    def test_custom_stopword_set(self):
+        """Test custom stopwords given as a frozenset."""
+        custom_stops = frozenset({"quick", "brown"})
+        tokens = tokenize("the quick brown fox", remove_stopwords=True, stopwords=custom_stops)
+        assert tokens == ["the", "fox"]
+
     def test_all_stopwords(self):
         """Test text with only stopwords."""
         tokens = tokenize("the and of", remove_stopwords=True)
@@ -121,6 +128,15 @@ class TestTokenize:
         tokens2 = tokenize(text)
         assert tokens1 == tokens2
 
+    def test_ascii_fast_path_matches_regex(self):
+        """Test that ASCII text splits exactly like the \\w+ regex."""
+        text = "".join(chr(c) for c in range(128)) + " snake_case e-mail x1,y2 _lead trail_"
+        assert tokenize(text, lowercase=False) == re.findall(r"\w+", text)
+
+    def test_mixed_ascii_and_unicode(self):
+        """Test that non-ASCII text keeps Unicode word characters."""
+        assert tokenize("Café_au-lait naïve") == ["café_au", "lait", "naïve"]
+
 
 class TestDefaultStopwords:
     """Test default stopwords set."""